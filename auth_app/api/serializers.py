@@ -1,8 +1,11 @@
 # Third-party imports
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 
+# Local imports
+from auth_app.backends import get_user_by_email
+
 User = get_user_model()
 
 
@@ -38,9 +41,9 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """
-        Ensure the email is unique.
+        Ensure the email is unique, ignoring case.
         """
-        if User.objects.filter(email=value).exists():
+        if get_user_by_email(value) is not None:
             raise serializers.ValidationError(
                 "A user with this email already exists."
             )
@@ -66,9 +69,13 @@ class RegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Create and return a new user instance.
+
+        Pass `password_hash` to `save()` to store an already hashed password
+        instead of hashing the raw one here.
         """
         fullname = validated_data.pop('fullname')
         password = validated_data.pop('password')
+        password_hash = validated_data.pop('password_hash', None)
         validated_data.pop('repeated_password')
 
         first_name, last_name = self._split_fullname(fullname)
@@ -78,7 +85,8 @@ class RegistrationSerializer(serializers.ModelSerializer):
             email=validated_data['email'],
             first_name=first_name,
             last_name=last_name,
-            password=password
+            password=password,
+            password_hash=password_hash
         )
         user.save()
         return user
@@ -92,7 +100,8 @@ class RegistrationSerializer(serializers.ModelSerializer):
         last_name = " ".join(rest)
         return first_name, last_name
 
-    def _get_user(self, username, email, first_name, last_name, password):
+    def _get_user(self, username, email, first_name, last_name, password,
+                  password_hash=None):
         """
         Return a new user instance with a set password.
         """
@@ -102,7 +111,10 @@ class RegistrationSerializer(serializers.ModelSerializer):
             first_name=first_name,
             last_name=last_name
         )
-        user.set_password(password)
+        if password_hash:
+            user.password = password_hash
+        else:
+            user.set_password(password)
         return user
 
 
@@ -110,7 +122,8 @@ class LoginSerializer(serializers.Serializer):
     """
     Serializer for user login.
 
-    Authenticates user with email and password.
+    Validates the email and password fields. The credentials themselves are
+    checked asynchronously by `LoginView` through `EmailBackend`.
     """
 
     email = serializers.EmailField(
@@ -125,34 +138,6 @@ class LoginSerializer(serializers.Serializer):
         help_text="User's account password."
     )
 
-    def validate(self, data):
-        """
-        Validate user credentials and authenticate the user.
-
-        Raises:
-            serializers.ValidationError: If email does not exist or authentication fails.
-        """
-        email = data.get("email")
-        password = data.get("password")
-
-        user = self._get_user_by_email(email)
-        user = authenticate(username=user.username, password=password)
-
-        if not user:
-            raise serializers.ValidationError("Invalid email or password.")
-
-        data["user"] = user
-        return data
-
-    def _get_user_by_email(self, email):
-        """
-        Retrieve a user instance by email or raise a validation error.
-        """
-        try:
-            return User.objects.get(email=email)
-        except User.DoesNotExist:
-            raise serializers.ValidationError("Invalid email or password.")
-
 
 class UserEmailCheckSerializer(serializers.ModelSerializer):
     """
@@ -2,7 +2,7 @@
 import re
 
 # 2. Third-party suppliers
-from django.contrib.auth.models import User
+from asgiref.sync import sync_to_async
 from rest_framework import permissions, status
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny
@@ -15,16 +15,22 @@ from .serializers import (
     RegistrationSerializer,
     UserEmailCheckSerializer,
 )
+from auth_app.backends import EmailBackend, get_user_by_email
+from auth_app.hashing import HashingQueueFull, amake_password
+from core.views import AsyncAPIView
 
 
-class BaseAuthView(APIView):
+class BaseAuthView(AsyncAPIView):
     """
     Base class for user authentication and registration.
 
-    Provides helper methods for generating success and error responses.
+    The auth views are async: under ASGI (`core/asgi.py`) password hashing
+    runs in the bounded pool of `auth_app.hashing` while the event loop
+    keeps serving other requests. Provides helper methods for generating
+    success and error responses.
     """
 
-    def _get_success_response(self, user, code):
+    async def _get_success_response(self, user, code):
         """
         Generate a success response with user info and auth token.
 
@@ -35,7 +41,7 @@ class BaseAuthView(APIView):
         Returns:
             Response: The success response containing the token and user info.
         """
-        token, provided = Token.objects.get_or_create(user=user)
+        token, provided = await Token.objects.aget_or_create(user=user)
         return Response({
             "token": token.key,
             "fullname": f"{user.first_name} {user.last_name}".strip(),
@@ -43,17 +49,31 @@ class BaseAuthView(APIView):
             "user_id": user.id
         }, status=code)
 
-    def _get_error_response(self, serializer):
+    def _get_error_response(self, errors):
         """
-        Generate an error response for invalid serializer data.
+        Generate an error response for invalid data.
 
         Args:
-            serializer (serializers.Serializer): The serializer with validation errors.
+            errors (dict): The validation errors.
 
         Returns:
-            Response: The error response containing serializer errors.
+            Response: The error response containing the errors.
         """
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def _get_busy_response(self):
+        """
+        Generate a response asking the client to retry once the hashing
+        pool has capacity again.
+
+        Returns:
+            Response: The 503 response with a Retry-After header.
+        """
+        return Response(
+            {"detail": "Too many sign-ins in progress, please retry shortly."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={'Retry-After': '1'}
+        )
 
 
 class RegistrationView(BaseAuthView):
@@ -65,7 +85,7 @@ class RegistrationView(BaseAuthView):
     """
     permission_classes = [AllowAny]
 
-    def post(self, request):
+    async def post(self, request):
         """
         Handle POST request for user registration.
 
@@ -76,11 +96,18 @@ class RegistrationView(BaseAuthView):
             Response: The success or error response based on the validity of the data.
         """
         serializer = RegistrationSerializer(data=request.data)
-        if not serializer.is_valid():
-            return self._get_error_response(serializer)
+        if not await sync_to_async(serializer.is_valid)():
+            return self._get_error_response(serializer.errors)
+
+        try:
+            password_hash = await amake_password(
+                serializer.validated_data['password']
+            )
+        except HashingQueueFull:
+            return self._get_busy_response()
 
-        user = serializer.save()
-        return self._get_success_response(user, status.HTTP_201_CREATED)
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+        return await self._get_success_response(user, status.HTTP_201_CREATED)
 
 
 class LoginView(BaseAuthView):
@@ -92,7 +119,7 @@ class LoginView(BaseAuthView):
     """
     permission_classes = [AllowAny]
 
-    def post(self, request):
+    async def post(self, request):
         """
         Handle POST request for user login.
 
@@ -104,10 +131,20 @@ class LoginView(BaseAuthView):
         """
         serializer = LoginSerializer(data=request.data)
         if not serializer.is_valid():
-            return self._get_error_response(serializer)
+            return self._get_error_response(serializer.errors)
 
-        user = serializer.validated_data["user"]
-        return self._get_success_response(user, status.HTTP_200_OK)
+        try:
+            user = await EmailBackend().aauthenticate(
+                request, **serializer.validated_data
+            )
+        except HashingQueueFull:
+            return self._get_busy_response()
+
+        if not user:
+            return self._get_error_response({
+                "non_field_errors": ["Invalid email or password."]
+            })
+        return await self._get_success_response(user, status.HTTP_200_OK)
 
 
 class EmailCheckView(APIView):
@@ -173,9 +210,8 @@ class EmailCheckView(APIView):
         Returns:
             Response: A response with user data if the email exists, or an empty response.
         """
-        try:
-            user = User.objects.get(email=email)
-            serializer = UserEmailCheckSerializer(user)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except User.DoesNotExist:
+        user = get_user_by_email(email)
+        if user is None:
             return Response({}, status=status.HTTP_200_OK)
+        serializer = UserEmailCheckSerializer(user)
+        return Response(serializer.data, status=status.HTTP_200_OK)
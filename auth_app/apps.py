@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AuthAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'auth_app'
+
+    def ready(self):
+        """
+        Connect the signal handlers invalidating the token cache.
+        """
+        from . import signals  # noqa: F401
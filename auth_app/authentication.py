@@ -0,0 +1,37 @@
+# 1. Third-party suppliers
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+# 2. Local imports
+from .token_cache import cache_token, get_cached_token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for DRF's TokenAuthentication.
+
+    Resolves token keys through `auth_app.token_cache`, so repeated
+    requests with the same token skip the Token and User join.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Return the user and token for a key, from the cache if possible.
+
+        Raises:
+            AuthenticationFailed: If the token is unknown or the user inactive.
+        """
+        token = get_cached_token(key)
+        if token is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related('user').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            cache_token(token)
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (token.user, token)
@@ -0,0 +1,85 @@
+# 1. Third-party suppliers
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models.functions import Lower
+
+# 2. Local imports
+from .hashing import acheck_password, amake_password
+
+User = get_user_model()
+
+
+def _users_by_email(email):
+    """
+    Return the queryset matching an email, ignoring case, limited to one row.
+    """
+    return User.objects.alias(email_lower=Lower('email')).filter(
+        email_lower=email.lower()
+    )[:1]
+
+
+def get_user_by_email(email):
+    """
+    Return the user with the given email, ignoring case, or None.
+
+    The lookup compares `LOWER(email)`, which is backed by the functional
+    index created in `auth_app.migrations.0001_user_email_lower_index`.
+    """
+    return next(iter(_users_by_email(email)), None)
+
+
+async def aget_user_by_email(email):
+    """
+    Async version of `get_user_by_email`.
+    """
+    async for user in _users_by_email(email):
+        return user
+    return None
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authenticate users by email address and password.
+
+    Fetches the user with a single indexed query. Calls without an `email`
+    are left to the other configured backends.
+    """
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        """
+        Return the active user matching the credentials, or None.
+        """
+        if email is None or password is None:
+            return None
+
+        user = get_user_by_email(email)
+        if user is None:
+            # Run the hasher anyway to keep timing independent of existence.
+            User().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    async def aauthenticate(self, request, email=None, password=None, **kwargs):
+        """
+        Async version of `authenticate`.
+
+        Hashing runs in the bounded pool of `auth_app.hashing`, which raises
+        `HashingQueueFull` when saturated. Outdated hashes are not upgraded
+        on this path, since that would write from the hashing pool.
+        """
+        if email is None or password is None:
+            return None
+
+        user = await aget_user_by_email(email)
+        if user is None:
+            # Run the hasher anyway to keep timing independent of existence.
+            await amake_password(password)
+            return None
+
+        valid = await acheck_password(password, user.password)
+        if valid and self.user_can_authenticate(user):
+            return user
+        return None
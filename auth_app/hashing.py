@@ -0,0 +1,131 @@
+"""
+Bounded worker pool for password hashing.
+
+Hashing and verifying passwords costs tens to hundreds of milliseconds of
+CPU. The async auth views hand that work to this pool instead of running
+it on a request worker, so cheap requests keep flowing during login
+spikes. When more jobs are in flight than workers plus `MAX_QUEUE`, new
+jobs are rejected with `HashingQueueFull` instead of piling up.
+
+Configured by `PASSWORD_HASHING_POOL` with `EXECUTOR` ('thread' or
+'process'), `MAX_WORKERS` and `MAX_QUEUE`. Jobs never touch the database,
+so they are safe to run in worker processes.
+"""
+
+# 1. Standard library
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# 2. Third-party suppliers
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+
+DEFAULTS = {
+    'EXECUTOR': 'thread',
+    'MAX_WORKERS': 4,
+    'MAX_QUEUE': 64,
+}
+
+
+class HashingQueueFull(Exception):
+    """
+    Raised when the hashing pool cannot accept more jobs.
+    """
+
+
+def _init_process_worker():
+    """
+    Configure Django in a spawned worker process so hashers are available.
+    """
+    django.setup()
+
+
+class PasswordHashingPool:
+    """
+    Executor wrapper limiting the number of queued hashing jobs.
+    """
+
+    def __init__(self, executor='thread', max_workers=4, max_queue=64):
+        """
+        Args:
+            executor (str): 'thread' or 'process'.
+            max_workers (int): Number of hashing workers.
+            max_queue (int): Jobs allowed to wait for a free worker.
+        """
+        self.kind = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        """
+        Return the executor, creating it on first use.
+        """
+        with self._lock:
+            if self._executor is None:
+                if self.kind == 'process':
+                    self._executor = ProcessPoolExecutor(
+                        self.max_workers, initializer=_init_process_worker
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix='password-hashing'
+                    )
+            return self._executor
+
+    async def run(self, func, *args):
+        """
+        Run a hashing function in the pool and return its result.
+
+        Raises:
+            HashingQueueFull: If the pool is saturated.
+        """
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queue:
+                raise HashingQueueFull()
+            self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+
+_pool = None
+
+
+def get_hashing_pool():
+    """
+    Return the process-wide hashing pool configured from settings.
+    """
+    global _pool
+    if _pool is None:
+        config = {**DEFAULTS, **getattr(settings, 'PASSWORD_HASHING_POOL', {})}
+        _pool = PasswordHashingPool(
+            executor=config['EXECUTOR'],
+            max_workers=config['MAX_WORKERS'],
+            max_queue=config['MAX_QUEUE'],
+        )
+    return _pool
+
+
+async def amake_password(password):
+    """
+    Hash a raw password in the hashing pool.
+    """
+    return await get_hashing_pool().run(hashers.make_password, password)
+
+
+async def acheck_password(password, encoded):
+    """
+    Verify a raw password against an encoded one in the hashing pool.
+    """
+    return await get_hashing_pool().run(
+        hashers.check_password, password, encoded
+    )
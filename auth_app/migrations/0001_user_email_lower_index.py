@@ -0,0 +1,33 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+EMAIL_LOWER_INDEX = models.Index(
+    Lower('email'), name='auth_user_email_lower_idx'
+)
+
+
+def create_email_index(apps, schema_editor):
+    """
+    Add a case-insensitive functional index on the user email.
+    """
+    User = apps.get_model('auth', 'User')
+    schema_editor.add_index(User, EMAIL_LOWER_INDEX)
+
+
+def drop_email_index(apps, schema_editor):
+    """
+    Remove the functional email index.
+    """
+    User = apps.get_model('auth', 'User')
+    schema_editor.remove_index(User, EMAIL_LOWER_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
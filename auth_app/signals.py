@@ -0,0 +1,45 @@
+"""
+Signal handlers invalidating the token cache.
+"""
+
+# 1. Third-party suppliers
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+# 2. Local imports
+from .token_cache import invalidate_tokens
+
+# Fields of the cached user instance that authentication or the views read;
+# saves of other fields (e.g. `last_login`) keep the cached tokens.
+TOKEN_USER_FIELDS = {
+    'is_active', 'password', 'is_staff', 'is_superuser',
+    'username', 'email', 'first_name', 'last_name',
+}
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """
+    Stop accepting a deleted token, including one deleted with its user.
+    """
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, raw=False,
+                           update_fields=None, **kwargs):
+    """
+    Drop the cached tokens of a changed user.
+
+    Covers deactivation as well as changes to the user data served from
+    the cached user instance. Saves limited by `update_fields` to other
+    fields skip the token query.
+    """
+    if created or raw:
+        return
+    if update_fields is None or TOKEN_USER_FIELDS & set(update_fields):
+        invalidate_tokens(
+            Token.objects.filter(user=instance).values_list('key', flat=True)
+        )
@@ -1,3 +1,137 @@
+# 1. Third-party suppliers
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
 
-# Create your tests here.
+# 2. Local imports
+from auth_app.token_cache import cache_token, get_cached_token, local_tokens
+
+
+class TokenInvalidationTests(TestCase):
+    """
+    User saves drop the user's cached tokens only when fields the cached
+    user instance serves change.
+    """
+
+    def setUp(self):
+        cache.clear()
+        local_tokens.clear()
+        self.user = User.objects.create_user('user', 'user@example.com', 'pw')
+        self.token = Token.objects.create(user=self.user)
+        cache_token(self.token)
+
+    def test_last_login_update_keeps_the_tokens(self):
+        self.user.last_login = timezone.now()
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+        self.assertIsNotNone(get_cached_token(self.token.key))
+
+    def test_deactivation_drops_the_tokens(self):
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertIsNone(get_cached_token(self.token.key))
+
+    def test_full_save_drops_the_tokens(self):
+        self.user.first_name = 'Changed'
+        self.user.save()
+        self.assertIsNone(get_cached_token(self.token.key))
+
+
+class TokenCacheTests(TestCase):
+    """
+    Cached tokens are rebuilt per lookup, so requests never share the
+    token or user instances.
+    """
+
+    def setUp(self):
+        cache.clear()
+        local_tokens.clear()
+        self.user = User.objects.create_user(
+            'user', 'user@example.com', 'pw', first_name='Ada'
+        )
+        self.token = Token.objects.create(user=self.user)
+        cache_token(self.token)
+
+    def test_lookups_return_new_instances(self):
+        first = get_cached_token(self.token.key)
+        first.user.first_name = 'Changed'
+        first.user.cached_boards = ['leaked']
+        second = get_cached_token(self.token.key)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.user, second.user)
+        self.assertEqual(second.user.first_name, 'Ada')
+        self.assertFalse(hasattr(second.user, 'cached_boards'))
+
+    def test_shared_level_returns_loaded_instances(self):
+        local_tokens.clear()
+        with self.assertNumQueries(0):
+            token = get_cached_token(self.token.key)
+            self.assertEqual(token.user.pk, self.user.pk)
+        self.assertEqual(token, self.token)
+        self.assertFalse(token._state.adding)
+        self.assertFalse(token.user._state.adding)
+
+
+class AuthViewTests(TestCase):
+    """
+    The async registration and login views keep DRF's request parsing and
+    error format.
+    """
+    password = 'a-Long-and-unusual-pw-17'
+
+    def setUp(self):
+        cache.clear()
+
+    def _register(self, client, email='new@example.com'):
+        return client.post(reverse('auth_app:registration'), {
+            'fullname': 'New User', 'email': email,
+            'password': self.password, 'repeated_password': self.password,
+        }, content_type='application/json')
+
+    def test_registration_and_login(self):
+        response = self._register(self.client)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['fullname'], 'New User')
+
+        response = self.client.post(reverse('auth_app:login'), {
+            'email': 'NEW@example.com', 'password': self.password,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['token'],
+            Token.objects.get(user__email='new@example.com').key
+        )
+
+    def test_wrong_password_is_rejected(self):
+        self._register(self.client)
+        response = self.client.post(reverse('auth_app:login'), {
+            'email': 'new@example.com', 'password': 'wrong',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {'non_field_errors': ['Invalid email or password.']}
+        )
+
+    def test_validation_errors_use_the_serializer_format(self):
+        self._register(self.client)
+        response = self._register(self.client)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.json())
+
+    def test_malformed_json_is_a_parse_error(self):
+        response = self.client.post(
+            reverse('auth_app:login'), '{"email":',
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('JSON parse error', response.json()['detail'])
+
+    async def test_views_run_on_the_event_loop(self):
+        response = await self.async_client.post(reverse('auth_app:login'), {
+            'email': 'nobody@example.com', 'password': 'wrong',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,137 @@
+"""
+Two-level cache resolving token keys to tokens with their users.
+
+Lookups hit a bounded in-process LRU first and the shared Django cache
+second. Shared entries are dropped by the signal handlers in
+`auth_app.signals`; local entries of other processes expire after the
+short `LOCAL_TIMEOUT`, which bounds how long a revoked token is accepted.
+
+Both levels store the field values of the token and its user, not model
+instances: every lookup builds fresh instances, so changes a request makes
+to `request.user` (attributes, related object caches, `refresh_from_db`)
+never leak into other requests or threads.
+"""
+
+# 1. Standard library
+import hashlib
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+# 3. Local imports
+from core.cache import LRUCache
+from core.metrics import register_collector
+
+DEFAULTS = {
+    'MAX_ENTRIES': 10000,
+    'LOCAL_TIMEOUT': 30,
+    'SHARED_TIMEOUT': 300,
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'TOKEN_CACHE', {})}
+
+local_tokens = LRUCache(CONFIG['MAX_ENTRIES'], CONFIG['LOCAL_TIMEOUT'])
+shared_lookups = {'hits': 0, 'misses': 0}
+
+
+def _shared_key(key):
+    """
+    Return the shared cache key of a token key.
+
+    The token key is hashed so secrets never appear in the cache backend.
+    """
+    return 'auth:token:v2:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def _field_values(instance):
+    """
+    Return the values of a model instance's concrete fields, in order.
+    """
+    return tuple(
+        getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+    )
+
+
+def _from_values(model, db, values):
+    """
+    Return a model instance built from `_field_values`, as if loaded.
+    """
+    field_names = [field.attname for field in model._meta.concrete_fields]
+    return model.from_db(db, field_names, values)
+
+
+def _build_token(entry):
+    """
+    Return a new token with its user from a cache entry.
+    """
+    db, token_values, user_values = entry
+    token = _from_values(Token, db, token_values)
+    token.user = _from_values(User, db, user_values)
+    return token
+
+
+def get_cached_token(key):
+    """
+    Return the cached token (with its user loaded) or None.
+
+    The instances are new on every call and may be changed freely.
+    """
+    entry = local_tokens.get(key)
+    if entry is not None:
+        return _build_token(entry)
+
+    entry = cache.get(_shared_key(key))
+    shared_lookups['hits' if entry is not None else 'misses'] += 1
+    if entry is None:
+        return None
+    local_tokens.set(key, entry)
+    return _build_token(entry)
+
+
+def cache_token(token):
+    """
+    Store a token with its user in both cache levels.
+    """
+    entry = (token._state.db, _field_values(token), _field_values(token.user))
+    local_tokens.set(token.key, entry)
+    cache.set(_shared_key(token.key), entry, CONFIG['SHARED_TIMEOUT'])
+
+
+def invalidate_tokens(keys):
+    """
+    Drop tokens from both cache levels, again once the transaction commits.
+    """
+    keys = list(keys)
+    if not keys:
+        return
+    for key in keys:
+        local_tokens.delete(key)
+    shared_keys = [_shared_key(key) for key in keys]
+    cache.delete_many(shared_keys)
+    transaction.on_commit(lambda: cache.delete_many(shared_keys))
+
+
+def token_cache_stats():
+    """
+    Return hit and miss counters of both cache levels in this process.
+    """
+    return {'local': local_tokens.stats(), 'shared': dict(shared_lookups)}
+
+
+def _metric_samples():
+    """
+    Return the counters as `kanmind_cache_requests_total` samples.
+    """
+    return [
+        ('kanmind_cache_requests_total',
+         {'cache': f'token_{level}', 'result': result}, counters[key])
+        for level, counters in token_cache_stats().items()
+        for result, key in (('hit', 'hits'), ('miss', 'misses'))
+    ]
+
+
+register_collector(_metric_samples)
@@ -4,18 +4,32 @@ from rest_framework import serializers
 
 # 2. Local imports
 from board_app.models import Board
+from task_app.api.serializers import CommentSerializer, UserShortSerializer
+from task_app.fragments import render_cached_tasks, task_stubs
 from task_app.models import Task
+from task_app.rendering import render_users, user_values
 
 
 class BoardOverviewSerializer(serializers.ModelSerializer):
     """
     Serializer for board overview, including summary statistics.
+
+    Reads the denormalized counters from `board.stats`; select the related
+    `stats` row to serialize a list of boards without extra queries.
     """
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source='owner.id')
+    member_count = serializers.IntegerField(
+        source='stats.member_count', read_only=True
+    )
+    ticket_count = serializers.IntegerField(
+        source='stats.ticket_count', read_only=True
+    )
+    tasks_to_do_count = serializers.IntegerField(
+        source='stats.to_do_count', read_only=True
+    )
+    tasks_high_prio_count = serializers.IntegerField(
+        source='stats.high_prio_count', read_only=True
+    )
+    owner_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -29,30 +43,6 @@ class BoardOverviewSerializer(serializers.ModelSerializer):
             'tasks_high_prio_count'
         ]
 
-    def get_member_count(self, board):
-        """
-        Return the number of members associated with the board.
-        """
-        return board.members.count()
-
-    def get_ticket_count(self, board):
-        """
-        Return the number of tasks linked to the board.
-        """
-        return board.tasks.count()
-
-    def get_tasks_to_do_count(self, board):
-        """
-        Return the count of tasks with 'to-do' status.
-        """
-        return board.tasks.filter(status='to-do').count()
-
-    def get_tasks_high_prio_count(self, board):
-        """
-        Return the count of tasks with high priority.
-        """
-        return board.tasks.filter(priority='high').count()
-
 
 class BoardCreateSerializer(serializers.ModelSerializer):
     """
@@ -80,72 +70,45 @@ class BoardCreateSerializer(serializers.ModelSerializer):
         return board
 
 
-class UserShortSerializer(serializers.ModelSerializer):
+class BoardDetailSerializer(serializers.ModelSerializer):
     """
-    Short serializer for user data including full name.
+    Full detail serializer for a board including tasks and members.
     """
-    fullname = serializers.SerializerMethodField()
+    members = serializers.SerializerMethodField()
+    tasks = serializers.SerializerMethodField()
+    owner_id = serializers.IntegerField(read_only=True)
+    version = serializers.IntegerField(source='stats.version', read_only=True)
 
     class Meta:
-        model = User
-        fields = ['id', 'email', 'fullname']
+        model = Board
+        fields = ['id', 'title', 'owner_id', 'version', 'members', 'tasks']
 
-    def get_fullname(self, obj):
+    def get_members(self, obj):
         """
-        Concatenate first and last name into a full name.
+        Return the board members rendered from `values()` rows.
         """
-        return f"{obj.first_name} {obj.last_name}".strip()
+        return render_users(user_values(obj.members.all()))
 
-
-class TaskSerializer(serializers.ModelSerializer):
-    """
-    Serializer for displaying task information inside a board.
-    """
-    assignee = UserShortSerializer(read_only=True)
-    reviewer = UserShortSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Task
-        fields = [
-            'id',
-            'board',
-            'title',
-            'description',
-            'status',
-            'priority',
-            'assignee',
-            'reviewer',
-            'due_date',
-            'comments_count'
-        ]
-
-    def get_comments_count(self, obj):
+    def get_tasks(self, obj):
         """
-        Return the number of comments on the task.
+        Return the board tasks, assembled from cached task fragments.
+
+        Uses context['tasks'] (a Task queryset) if provided; otherwise
+        queries all tasks of the board in column order.
         """
-        return obj.comments.count()
+        tasks = self.context.get('tasks')
+        if tasks is None:
+            tasks = Task.objects.filter(board=obj).in_column_order()
+        return render_cached_tasks(task_stubs(tasks))
 
 
-class BoardDetailSerializer(serializers.ModelSerializer):
+class BoardChangeCommentSerializer(CommentSerializer):
     """
-    Full detail serializer for a board including tasks and members.
+    Comment serializer for the change feed, including the task ID.
     """
-    members = UserShortSerializer(many=True, read_only=True)
-    tasks = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
-
-    class Meta:
-        model = Board
-        fields = ['id', 'title', 'owner_id', 'members', 'tasks']
 
-    def get_tasks(self, obj):
-        """
-        Return serialized tasks for the board.
-        Uses context['tasks'] if provided; otherwise queries from DB.
-        """
-        tasks = self.context.get('tasks', Task.objects.filter(board=obj))
-        return TaskSerializer(tasks, many=True).data
+    class Meta(CommentSerializer.Meta):
+        fields = ['id', 'task', 'created_at', 'author', 'content']
 
 
 class BoardUpdateSerializer(serializers.ModelSerializer):
@@ -6,17 +6,34 @@ retrieving, updating, and deleting boards.
 Available endpoints:
     - / → BoardListCreateView
     - /<int:board_id>/ → BoardDetailView
+    - /<int:board_id>/changes/ → BoardChangesView
+    - /<int:board_id>/events/ → BoardEventsView
 """
 
 # 1. Third-party imports
 from django.urls import path
 
 # 2. Local imports
-from .views import BoardDetailView, BoardListCreateView
+from .views import (
+    BoardChangesView,
+    BoardDetailView,
+    BoardEventsView,
+    BoardListCreateView,
+)
 
 app_name = 'board_app'
 
 urlpatterns = [
     path('', BoardListCreateView.as_view(), name='board-list-create'),
     path('<int:board_id>/', BoardDetailView.as_view(), name='board-detail'),
+    path(
+        '<int:board_id>/changes/',
+        BoardChangesView.as_view(),
+        name='board-changes'
+    ),
+    path(
+        '<int:board_id>/events/',
+        BoardEventsView.as_view(),
+        name='board-events'
+    ),
 ]
@@ -1,19 +1,42 @@
-# 1. Third-party imports
+# 1. Standard library
+import asyncio
+import json
+
+# 2. Third-party imports
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from rest_framework import status
+from django.views import View
+from rest_framework import exceptions, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-# 2. Local imports
+# 3. Local imports
 from .serializers import (
+    BoardChangeCommentSerializer,
     BoardCreateSerializer,
     BoardDetailSerializer,
     BoardOverviewSerializer,
     BoardUpdateSerializer,
 )
-from board_app.models import Board
-from task_app.models import Task
+from auth_app.authentication import CachedTokenAuthentication
+from board_app.changelog import get_changes
+from board_app.events import CONFIG as EVENTS_CONFIG
+from board_app.events import TooManySubscribers, broker
+from board_app.membership import can_access_board
+from board_app.models import Board, BoardStats
+from board_app.stats import get_board_stats
+from core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    with_etag,
+)
+from core.pagination import KeysetPagination
+from task_app.models import Comment, Task
+from task_app.rendering import render_tasks, render_users, task_values, user_values
 
 
 class BoardListCreateView(APIView):
@@ -25,17 +48,23 @@ class BoardListCreateView(APIView):
 
     def get(self, request):
         """
-        Return all boards where the user is a member or the owner.
+        Return the boards where the user is a member or the owner.
+
+        Results are cursor-paginated by title.
 
         Returns:
-            Response: A list of serialized boards.
+            Response: A page of serialized boards and the next page link.
         """
-        user = request.user
-        boards = Board.objects.filter(
-            members=user) | Board.objects.filter(owner=user)
-        boards = boards.distinct()
+        paginator = KeysetPagination(ordering=('title', 'id'))
+        boards = paginator.paginate_queryset(
+            Board.objects.visible_to(request.user).select_related('stats'),
+            request,
+            self
+        )
+        for board in boards:
+            get_board_stats(board)
         serializer = BoardOverviewSerializer(boards, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(serializer.data)
 
     def post(self, request):
         """
@@ -49,6 +78,7 @@ class BoardListCreateView(APIView):
         )
         if serializer.is_valid():
             board = serializer.save()
+            board = Board.objects.select_related('stats').get(id=board.id)
             overview = BoardOverviewSerializer(board)
             return Response(overview.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -64,6 +94,8 @@ class BoardDetailView(APIView):
         """
         Fetch the board if the user is authorized.
 
+        Access is checked against the cached membership of the user.
+
         Args:
             board_id (int): ID of the board.
             user (User): Authenticated user.
@@ -71,8 +103,10 @@ class BoardDetailView(APIView):
         Returns:
             Board or None: The board object if authorized, otherwise None.
         """
-        board = get_object_or_404(Board, id=board_id)
-        if user != board.owner and user not in board.members.all():
+        board = get_object_or_404(
+            Board.objects.select_related('stats'), id=board_id
+        )
+        if not can_access_board(user.id, board.id):
             return None
         return board
 
@@ -80,16 +114,26 @@ class BoardDetailView(APIView):
         """
         Retrieve full board details including members and tasks.
 
+        Answers `If-None-Match` with 304 while the board version is unchanged.
+
         Returns:
-            Response: Serialized board details or 403 if unauthorized.
+            Response: Serialized board details, 304 or 403 if unauthorized.
         """
         board = self.get_board(board_id, request.user)
         if not board:
             return self._get_permission_response()
 
-        tasks = Task.objects.filter(board=board)
+        etag = make_etag(
+            request, 'board', board.id, get_board_stats(board).version
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        tasks = Task.objects.filter(board=board).in_column_order()
         serializer = BoardDetailSerializer(board, context={'tasks': tasks})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return with_etag(
+            Response(serializer.data, status=status.HTTP_200_OK), etag
+        )
 
     def patch(self, request, board_id):
         """
@@ -158,3 +202,197 @@ class BoardDetailView(APIView):
             BoardUpdateSerializer(updated_board).data,
             status=status.HTTP_200_OK
         )
+
+
+class BoardChangesView(APIView):
+    """
+    API view returning what changed on a board since a known version.
+
+    Clients keep the `version` of `GET /boards/{id}/` and poll with
+    `?since=<version>`; every response carries the new `version` to send
+    next time.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, board_id):
+        """
+        Return the board fields, tasks, comments and members changed after
+        `since`, plus the IDs of deleted ones.
+
+        Returns:
+            Response: The changes, 400 for a malformed `since`, 403 if
+            unauthorized or the board does not exist, or 409 if `since` is
+            ahead of the board.
+        """
+        since = self._get_since(request)
+        if since is None:
+            return Response(
+                {"since": ["A non-negative integer is required."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Checked first, so unknown boards get the same 403 and board IDs
+        # cannot be probed.
+        if not can_access_board(request.user.id, board_id):
+            return Response(
+                {"detail": "You do not have permission to access or modify this board."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        version = BoardStats.objects.filter(
+            board_id=board_id
+        ).values_list('version', flat=True).first()
+        if version is None:
+            version = get_board_stats(get_object_or_404(Board, id=board_id)).version
+        if since > version:
+            return Response(
+                {"detail": "since is ahead of the board version, reload the board."},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        changes = get_changes(board_id, since, version)
+        return Response({
+            'since': since,
+            'version': version,
+            'board': self._get_board_data(board_id, changes['board'][0]),
+            'tasks': render_tasks(task_values(
+                Task.objects.filter(
+                    id__in=changes['task'][0], board_id=board_id
+                ).in_column_order()
+            )),
+            'comments': BoardChangeCommentSerializer(
+                Comment.objects.filter(
+                    id__in=changes['comment'][0], task__board_id=board_id
+                ).select_related('author').order_by('id'),
+                many=True
+            ).data,
+            'members': render_users(user_values(
+                User.objects.filter(id__in=changes['member'][0]).order_by('id')
+            )),
+            'deleted': {
+                'tasks': changes['task'][1],
+                'comments': changes['comment'][1],
+                'members': changes['member'][1],
+            },
+        })
+
+    def _get_since(self, request):
+        """
+        Return the `since` query parameter as a non-negative int, or None.
+        """
+        try:
+            since = int(request.query_params['since'])
+        except (KeyError, ValueError):
+            return None
+        return since if since >= 0 else None
+
+    def _get_board_data(self, board_id, changed_ids):
+        """
+        Return the title and owner of the board if they changed, else None.
+        """
+        if not changed_ids:
+            return None
+        return Board.objects.filter(id=board_id).values('title', 'owner_id').first()
+
+
+class BoardEventsView(View):
+    """
+    Async view streaming the change events of a board as Server-Sent Events.
+
+    Serve it through `core/asgi.py`: each open stream then costs a queue
+    instead of a worker thread. Browsers' EventSource cannot send headers,
+    so the token may also be passed as `?token=`. Comments are sent as
+    heartbeats, and a `reset` event asks the client to reload the board
+    after its queue overflowed. The stream ends when the board is deleted
+    or the user is removed from it.
+    """
+    http_method_names = ['get']
+
+    async def get(self, request, board_id):
+        """
+        Open the event stream of a board.
+
+        Returns:
+            StreamingHttpResponse: The stream; 403 without access to the
+            board, 503 if the worker serves too many streams.
+        """
+        user = await self._get_user(request)
+        if user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if not await sync_to_async(can_access_board)(user.id, board_id):
+            return JsonResponse(
+                {"detail": "You do not have permission to access or modify this board."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            subscription = broker.subscribe(board_id, user.id)
+        except TooManySubscribers:
+            response = JsonResponse(
+                {"detail": "Too many open event streams, try again later."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = '10'
+            return response
+
+        response = StreamingHttpResponse(
+            self._stream(subscription), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _get_user(self, request):
+        """
+        Return the user of the token (header or query) or session, or None.
+        """
+        auth = request.headers.get('Authorization', '').split()
+        if len(auth) == 2 and auth[0].lower() == 'token':
+            key = auth[1]
+        else:
+            key = request.GET.get('token')
+        if key:
+            authenticate = CachedTokenAuthentication().authenticate_credentials
+            try:
+                user, _ = await sync_to_async(authenticate)(key)
+            except exceptions.AuthenticationFailed:
+                return None
+            return user
+        user = await request.auser()
+        return user if user.is_authenticated else None
+
+    async def _stream(self, subscription):
+        """
+        Yield the events of a subscription as SSE messages until the client
+        disconnects or the board becomes inaccessible.
+        """
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    event = await subscription.get(EVENTS_CONFIG['HEARTBEAT'])
+                except asyncio.TimeoutError:
+                    yield ': heartbeat\n\n'
+                    continue
+                if event is None:
+                    yield 'event: reset\ndata: {}\n\n'
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                if await self._ends_stream(event, subscription):
+                    return
+        finally:
+            broker.unsubscribe(subscription)
+
+    async def _ends_stream(self, event, subscription):
+        """
+        Return True if the event revokes the subscriber's access.
+        """
+        if event['type'] == 'board.deleted':
+            return True
+        if event['type'] == 'member.removed' and event['user_id'] == subscription.user_id:
+            return not await sync_to_async(can_access_board)(
+                subscription.user_id, subscription.board_id
+            )
+        return False
+
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class BoardAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'board_app'
+
+    def ready(self):
+        """
+        Connect the signal handlers maintaining denormalized board data.
+        """
+        from . import signals  # noqa: F401
@@ -0,0 +1,62 @@
+"""
+Per-board change log backing the delta sync endpoint.
+
+Every change to a task, comment, member or the board itself upserts one
+`BoardChange` row per object, stamped with the board version the change
+produced. Callers record a change in the same transaction as its version
+bump (see `board_app.stats`), passing the version the bump returned. The
+bump holds the row lock of the board's counters until that transaction
+commits, so a change never becomes visible after a later version.
+"""
+
+# 1. Local imports
+from board_app.models import BoardChange
+
+
+def record_changes(board_id, kind, object_ids, seq, deleted=False):
+    """
+    Stamp objects of a board with the version of their change in one upsert.
+
+    Args:
+        board_id (int): ID of the board.
+        kind (str): One of `BoardChange.KIND_CHOICES`.
+        object_ids (Iterable[int]): IDs of the changed objects.
+        seq (int | None): The board version returned by the bump of the
+            change; nothing is recorded without one (no stats row).
+        deleted (bool): Whether the objects were deleted.
+    """
+    if seq is None:
+        return
+    BoardChange.objects.bulk_create(
+        [
+            BoardChange(
+                board_id=board_id,
+                kind=kind,
+                object_id=object_id,
+                seq=seq,
+                deleted=deleted
+            )
+            for object_id in set(object_ids)
+        ],
+        update_conflicts=True,
+        update_fields=['seq', 'deleted'],
+        unique_fields=['board', 'kind', 'object_id'],
+    )
+
+
+def get_changes(board_id, since, until):
+    """
+    Return the changes of a board with `since < seq <= until`.
+
+    Returns:
+        dict: Maps each kind to a pair of lists (changed IDs, deleted IDs).
+    """
+    changes = {kind: ([], []) for kind, _ in BoardChange.KIND_CHOICES}
+    if since >= until:
+        return changes
+    rows = BoardChange.objects.filter(
+        board_id=board_id, seq__gt=since, seq__lte=until
+    ).values_list('kind', 'object_id', 'deleted')
+    for kind, object_id, deleted in rows:
+        changes[kind][deleted].append(object_id)
+    return changes
@@ -0,0 +1,166 @@
+"""
+In-process publish/subscribe broker for board change events.
+
+Signal handlers publish small events (e.g. `{'type': 'task.updated',
+'id': 7}`) once the surrounding transaction commits; the SSE view of
+every subscribed connection receives them through an asyncio queue owned
+by its event loop. Publishing never blocks: a subscriber whose queue is
+full is marked as overflowed, its queued events are dropped and the
+stream tells the client to reload the board instead.
+
+The broker only reaches connections served by the same worker process.
+Deployments running several workers need a shared channel (e.g. Redis
+pub/sub) feeding `publish` in every worker.
+
+Configured by `BOARD_EVENTS` with `MAX_CONNECTIONS` (per worker),
+`QUEUE_SIZE` (per connection) and `HEARTBEAT` (seconds).
+"""
+
+# 1. Standard library
+import asyncio
+import threading
+from collections import defaultdict
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.db import transaction
+
+DEFAULTS = {
+    'MAX_CONNECTIONS': 1000,
+    'QUEUE_SIZE': 100,
+    'HEARTBEAT': 15,
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'BOARD_EVENTS', {})}
+
+
+class TooManySubscribers(Exception):
+    """
+    Raised when the worker already serves `MAX_CONNECTIONS` streams.
+    """
+
+
+class Subscription:
+    """
+    Queue of the events of one board for one streaming connection.
+    """
+
+    def __init__(self, board_id, user_id, loop, queue_size):
+        """
+        Args:
+            board_id (int): ID of the watched board.
+            user_id (int): ID of the subscribed user.
+            loop (AbstractEventLoop): Loop the stream runs on.
+            queue_size (int): Events buffered before the stream overflows.
+        """
+        self.board_id = board_id
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def deliver(self, event):
+        """
+        Queue an event; runs on the subscription's loop.
+        """
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            # Wake up the stream so it can report the reset right away.
+            self.queue.put_nowait(None)
+
+    async def get(self, timeout):
+        """
+        Return the next event, None after an overflow.
+
+        Raises:
+            TimeoutError: If no event arrives within `timeout` seconds.
+        """
+        event = await asyncio.wait_for(self.queue.get(), timeout)
+        if self.overflowed:
+            self.overflowed = False
+            return None
+        return event
+
+
+class BoardEventBroker:
+    """
+    Registry of subscriptions per board with a bound on their number.
+    """
+
+    def __init__(self, max_connections=1000, queue_size=100):
+        """
+        Args:
+            max_connections (int): Subscriptions allowed at the same time.
+            queue_size (int): Events buffered per subscription.
+        """
+        self.max_connections = max_connections
+        self.queue_size = queue_size
+        self.connections = 0
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id, user_id):
+        """
+        Register a subscription on the running event loop.
+
+        Raises:
+            TooManySubscribers: If the connection limit is reached.
+        """
+        subscription = Subscription(
+            board_id, user_id, asyncio.get_running_loop(), self.queue_size
+        )
+        with self._lock:
+            if self.connections >= self.max_connections:
+                raise TooManySubscribers()
+            self.connections += 1
+            self._subscriptions[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscription; safe to call more than once.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.board_id)
+            if subscriptions and subscription in subscriptions:
+                subscriptions.remove(subscription)
+                self.connections -= 1
+                if not subscriptions:
+                    del self._subscriptions[subscription.board_id]
+
+    def publish(self, board_id, event):
+        """
+        Hand an event to every subscriber of a board; callable from any
+        thread.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(
+                    subscription.deliver, event
+                )
+            except RuntimeError:
+                # The loop of a dropped connection has been closed.
+                self.unsubscribe(subscription)
+
+
+broker = BoardEventBroker(CONFIG['MAX_CONNECTIONS'], CONFIG['QUEUE_SIZE'])
+
+
+def publish_on_commit(board_id, event_type, **data):
+    """
+    Publish a board event once the current transaction commits.
+
+    Args:
+        board_id (int): ID of the changed board.
+        event_type (str): E.g. 'task.created' or 'member.removed'.
+        **data: Further event fields, usually the `id` of the object.
+    """
+    event = {'type': event_type, **data}
+    transaction.on_commit(lambda: broker.publish(board_id, event))
@@ -0,0 +1,61 @@
+# 1. Third-party suppliers
+from django.core.management.base import BaseCommand
+
+# 2. Local imports
+from board_app.models import Board
+from board_app.stats import rebuild_board_stats
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized `BoardStats` counters of all boards.
+
+    Boards are processed in chunks of ascending IDs, each chunk in its own
+    transaction, so the command can run against a live database.
+    """
+    help = "Rebuild the denormalized board counters and repair any drift."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help="Number of boards rebuilt per transaction (default: 500)."
+        )
+        parser.add_argument(
+            '--board',
+            type=int,
+            action='append',
+            dest='board_ids',
+            help="Only rebuild the board with this ID (repeatable)."
+        )
+
+    def handle(self, *args, chunk_size, board_ids, **options):
+        """
+        Rebuild the counters chunk by chunk and report the repaired boards.
+        """
+        boards = Board.objects.order_by('id')
+        if board_ids:
+            boards = boards.filter(id__in=board_ids)
+
+        processed = repaired = 0
+        last_id = 0
+        while True:
+            chunk = list(
+                boards.filter(id__gt=last_id).values_list('id', flat=True)[
+                    :chunk_size
+                ]
+            )
+            if not chunk:
+                break
+            repaired += rebuild_board_stats(chunk)
+            processed += len(chunk)
+            last_id = chunk[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt counters of {processed} boards, "
+            f"repaired {repaired} drifted boards."
+        ))
@@ -0,0 +1,113 @@
+"""
+Cross-request cache of board membership.
+
+Stores the member IDs of every board and the IDs of the boards every user
+can see (owned or member) in the Django cache. Entries are invalidated by
+the signal handlers in `board_app.signals` whenever members or owners
+change; `MEMBERSHIP_CACHE_TIMEOUT` bounds the lifetime of any entry that
+a concurrent request might have repopulated with pre-commit data.
+
+Cache misses always read the primary database, also inside requests routed
+to a read replica (`core.db_router`): a lagging replica would otherwise put
+membership from before the last invalidation back into the shared cache.
+"""
+
+# 1. Third-party suppliers
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+# 2. Local imports
+from board_app.models import Board
+from core.db_router import PRIMARY
+
+MEMBERS_KEY = 'membership:board:{}:members'
+VISIBLE_KEY = 'membership:user:{}:boards'
+
+
+def _timeout():
+    """
+    Return the lifetime of membership cache entries in seconds.
+    """
+    return getattr(settings, 'MEMBERSHIP_CACHE_TIMEOUT', 300)
+
+
+def get_board_member_ids(board_id):
+    """
+    Return the IDs of the members of a board.
+
+    Args:
+        board_id (int): ID of the board.
+
+    Returns:
+        frozenset: The member user IDs.
+    """
+    key = MEMBERS_KEY.format(board_id)
+    member_ids = cache.get(key)
+    if member_ids is None:
+        member_ids = frozenset(
+            Board.members.through.objects.using(PRIMARY).filter(
+                board_id=board_id
+            ).values_list('user_id', flat=True)
+        )
+        cache.set(key, member_ids, _timeout())
+    return member_ids
+
+
+def get_visible_board_ids(user_id):
+    """
+    Return the IDs of the boards a user owns or is a member of.
+
+    Args:
+        user_id (int): ID of the user.
+
+    Returns:
+        frozenset: The visible board IDs.
+    """
+    key = VISIBLE_KEY.format(user_id)
+    board_ids = cache.get(key)
+    if board_ids is None:
+        member_board_ids = Board.members.through.objects.filter(
+            user_id=user_id
+        ).values('board_id')
+        board_ids = frozenset(
+            Board.objects.using(PRIMARY).filter(
+                Q(id__in=member_board_ids) | Q(owner_id=user_id)
+            ).values_list('id', flat=True)
+        )
+        cache.set(key, board_ids, _timeout())
+    return board_ids
+
+
+def is_board_member(user_id, board_id):
+    """
+    Return True if the user is a member of the board.
+    """
+    return user_id in get_board_member_ids(board_id)
+
+
+def can_access_board(user_id, board_id):
+    """
+    Return True if the user owns the board or is a member of it.
+    """
+    return board_id in get_visible_board_ids(user_id)
+
+
+def invalidate_membership(board_ids=(), user_ids=()):
+    """
+    Drop the cached member sets of boards and board sets of users.
+
+    The keys are deleted right away and again once the surrounding
+    transaction commits, so a request that read the old rows in between
+    cannot leave a stale entry behind.
+
+    Args:
+        board_ids (Iterable[int]): Boards whose member set changed.
+        user_ids (Iterable[int]): Users whose visible boards changed.
+    """
+    keys = [MEMBERS_KEY.format(board_id) for board_id in set(board_ids)]
+    keys += [VISIBLE_KEY.format(user_id) for user_id in set(user_ids)]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,86 @@
+# Generated by Django 5.1.4 on 2026-10-17 03:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_board_stats(apps, schema_editor):
+    """
+    Create the counters row of every existing board.
+    """
+    Board = apps.get_model('board_app', 'Board')
+    BoardStats = apps.get_model('board_app', 'BoardStats')
+
+    def count_tasks(**filters):
+        condition = Q(**{f'tasks__{k}': v for k, v in filters.items()})
+        return Count('tasks', filter=condition or None, distinct=True)
+
+    boards = Board.objects.annotate(
+        member_count=Count('members', distinct=True),
+        ticket_count=count_tasks(),
+        to_do_count=count_tasks(status='to-do'),
+        in_progress_count=count_tasks(status='in-progress'),
+        review_count=count_tasks(status='review'),
+        done_count=count_tasks(status='done'),
+        high_prio_count=count_tasks(priority='high'),
+    )
+    BoardStats.objects.bulk_create(
+        (
+            BoardStats(
+                board_id=board.id,
+                member_count=board.member_count,
+                ticket_count=board.ticket_count,
+                to_do_count=board.to_do_count,
+                in_progress_count=board.in_progress_count,
+                review_count=board.review_count,
+                done_count=board.done_count,
+                high_prio_count=board.high_prio_count,
+            )
+            for board in boards.iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0005_alter_board_options_alter_board_members_and_more'),
+        ('task_app', '0016_alter_comment_options_alter_task_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardStats',
+            fields=[
+                ('board', models.OneToOneField(help_text='The board these counters belong to.', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='board_app.board')),
+                ('member_count', models.IntegerField(default=0)),
+                ('ticket_count', models.IntegerField(default=0)),
+                ('to_do_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('high_prio_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Board statistics',
+                'verbose_name_plural': 'Board statistics',
+            },
+        ),
+        migrations.AlterField(
+            model_name='board',
+            name='members',
+            field=models.ManyToManyField(blank=True, help_text='Other users who have access to this board.', related_name='boards', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='board',
+            name='owner',
+            field=models.ForeignKey(help_text='The user who owns the board.', on_delete=django.db.models.deletion.CASCADE, related_name='owned_boards', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(
+            populate_board_stats, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-17 03:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0006_boardstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['title', 'id'], name='board_title_id_idx'),
+        ),
+    ]
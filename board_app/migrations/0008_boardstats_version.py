@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0007_board_title_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardstats',
+            name='version',
+            field=models.BigIntegerField(default=0, help_text='Incremented on every change to the board or its content.'),
+        ),
+    ]
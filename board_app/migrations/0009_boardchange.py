@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-17 04:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0008_boardstats_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('board', 'Board'), ('task', 'Task'), ('comment', 'Comment'), ('member', 'Member')], max_length=10)),
+                ('object_id', models.BigIntegerField(help_text='ID of the task, comment, member (user) or board.')),
+                ('seq', models.BigIntegerField(help_text='Board version produced by the latest change.')),
+                ('deleted', models.BooleanField(default=False)),
+                ('board', models.ForeignKey(help_text='The board the changed object belongs to.', on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='board_app.board')),
+            ],
+            options={
+                'verbose_name': 'Board change',
+                'verbose_name_plural': 'Board changes',
+                'indexes': [models.Index(fields=['board', 'seq'], name='board_change_seq_idx')],
+                'constraints': [models.UniqueConstraint(fields=('board', 'kind', 'object_id'), name='board_change_object_uniq')],
+            },
+        ),
+    ]
@@ -2,6 +2,52 @@
 from django.contrib.auth.models import User
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+class BoardQuerySet(models.QuerySet):
+    """
+    QuerySet with helpers shared by the board API views.
+    """
+
+    def visible_to(self, user):
+        """
+        Return boards the user owns or is a member of.
+
+        Membership is resolved through a subquery on the members table so
+        the result needs no DISTINCT and aggregates stay exact.
+        """
+        member_board_ids = Board.members.through.objects.filter(
+            user_id=user.id
+        ).values('board_id')
+        return self.filter(Q(id__in=member_board_ids) | Q(owner_id=user.id))
+
+    def with_counters(self):
+        """
+        Annotate each board with freshly aggregated `BoardStats` counters.
+
+        The task counters are conditional aggregates over a single join on
+        the task table, the member count is a correlated subquery, so all
+        counters are computed in one SQL statement. Used to (re)build the
+        denormalized `BoardStats` rows.
+        """
+        member_count = Board.members.through.objects.filter(
+            board_id=OuterRef('pk')
+        ).order_by().values('board_id').annotate(
+            total=Count('*')
+        ).values('total')
+        return self.annotate(
+            member_count=Coalesce(Subquery(member_count), 0),
+            ticket_count=Count('tasks'),
+            to_do_count=Count('tasks', filter=Q(tasks__status='to-do')),
+            in_progress_count=Count(
+                'tasks', filter=Q(tasks__status='in-progress')
+            ),
+            review_count=Count('tasks', filter=Q(tasks__status='review')),
+            done_count=Count('tasks', filter=Q(tasks__status='done')),
+            high_prio_count=Count('tasks', filter=Q(tasks__priority='high')),
+        )
 
 
 class Board(models.Model):
@@ -37,6 +83,28 @@ class Board(models.Model):
         help_text="Other users who have access to this board."
     )
 
+    objects = BoardQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the owner loaded from the database.
+
+        Signal handlers use it to invalidate the membership cache of the
+        previous owner when the board changes hands.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'owner_id' in field_names:
+            instance._loaded_owner_id = values[field_names.index('owner_id')]
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board and remember the saved owner as the loaded one.
+        """
+        super().save(*args, **kwargs)
+        self._loaded_owner_id = self.owner_id
+
     def __str__(self):
         """
         Return a string representation of the board.
@@ -50,3 +118,116 @@ class Board(models.Model):
         verbose_name = "Board"
         verbose_name_plural = "Boards"
         ordering = ['title']
+        indexes = [
+            models.Index(fields=['title', 'id'], name='board_title_id_idx'),
+        ]
+
+
+class BoardStats(models.Model):
+    """
+    Denormalized counters of a board.
+
+    The row is kept up to date on every task and membership change (see
+    `board_app.signals`), so the board overview can read the counters
+    without aggregating. `manage.py rebuild_board_stats` repairs drift.
+
+    `version` is bumped by every change to the board, its members, tasks
+    or comments and drives the ETags of the board read endpoints.
+    """
+
+    COUNTER_FIELDS = [
+        'member_count',
+        'ticket_count',
+        'to_do_count',
+        'in_progress_count',
+        'review_count',
+        'done_count',
+        'high_prio_count',
+    ]
+
+    board = models.OneToOneField(
+        Board,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        help_text="The board these counters belong to."
+    )
+    member_count = models.IntegerField(default=0)
+    ticket_count = models.IntegerField(default=0)
+    to_do_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    done_count = models.IntegerField(default=0)
+    high_prio_count = models.IntegerField(default=0)
+    version = models.BigIntegerField(
+        default=0,
+        help_text="Incremented on every change to the board or its content."
+    )
+
+    def __str__(self):
+        """
+        Return a string representation of the board statistics.
+
+        Returns:
+            str: The board ID followed by the ticket count.
+        """
+        return f"Stats of board {self.board_id} ({self.ticket_count} tickets)"
+
+    class Meta:
+        verbose_name = "Board statistics"
+        verbose_name_plural = "Board statistics"
+
+
+class BoardChange(models.Model):
+    """
+    Latest change of one task, comment, member or the board itself.
+
+    There is one row per changed object; every change overwrites `seq`
+    with the board version it produced (see `board_app.changelog`), so a
+    client that has seen version N fetches the rows with `seq > N`.
+    Deletions keep their row as a tombstone with `deleted` set.
+    """
+
+    KIND_CHOICES = [
+        ('board', 'Board'),
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+        ('member', 'Member'),
+    ]
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.CASCADE,
+        related_name='changes',
+        help_text="The board the changed object belongs to."
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField(
+        help_text="ID of the task, comment, member (user) or board."
+    )
+    seq = models.BigIntegerField(
+        help_text="Board version produced by the latest change."
+    )
+    deleted = models.BooleanField(default=False)
+
+    def __str__(self):
+        """
+        Return a string representation of the change.
+
+        Returns:
+            str: Kind, object ID and sequence number.
+        """
+        return f"{self.kind} {self.object_id} at {self.seq}"
+
+    class Meta:
+        verbose_name = "Board change"
+        verbose_name_plural = "Board changes"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['board', 'kind', 'object_id'],
+                name='board_change_object_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['board', 'seq'], name='board_change_seq_idx'),
+        ]
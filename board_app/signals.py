@@ -0,0 +1,289 @@
+"""
+Signal handlers keeping the denormalized board counters and versions and
+the membership cache in sync with boards, members, tasks and comments,
+publishing board and member change events and recording the change log.
+
+Each handler bumping a board version records the change in the same
+transaction, stamped with the version the bump returned (see
+`board_app.changelog`).
+"""
+
+# 1. Third-party suppliers
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+# 2. Local imports
+from board_app.changelog import record_changes
+from board_app.events import publish_on_commit
+from board_app.membership import invalidate_membership
+from board_app.models import Board, BoardStats
+from board_app.stats import (
+    recount_members,
+    task_counter_deltas,
+    touch_board_stats,
+    touch_board_stats_of_task,
+    touch_boards_stats,
+)
+from task_app.models import Comment, Task
+
+
+def _deleted_with(origin, *models):
+    """
+    Return True if a deletion cascades from deleting one of the models.
+    """
+    if isinstance(origin, QuerySet):
+        return origin.model in models
+    return isinstance(origin, models)
+
+
+def _loaded_task_state(task):
+    """
+    Return (board_id, status, priority) as last loaded or saved, if known.
+    """
+    loaded = getattr(task, '_loaded_values', None)
+    if not loaded:
+        return None
+    return (loaded.get('board_id'), loaded.get('status'), loaded.get('priority'))
+
+
+def _changed_member_ids(instance, action, reverse, pk_set, consume=False):
+    """
+    Return the IDs on the other side of a members change: the boards of a
+    user (reverse) or the users of a board, as captured before a clear.
+    """
+    if action != 'post_clear':
+        return list(pk_set or [])
+    key = '_cleared_board_ids' if reverse else '_cleared_member_ids'
+    if consume:
+        return instance.__dict__.pop(key, [])
+    return getattr(instance, key, [])
+
+
+@receiver(post_save, sender=Board)
+def create_board_stats(sender, instance, created, raw=False, **kwargs):
+    """
+    Create the empty counters row for a newly created board, and bump the
+    version of an updated one and record it in the change log.
+    """
+    if raw:
+        return
+    if created:
+        BoardStats.objects.get_or_create(board=instance)
+        return
+    with transaction.atomic():
+        version = touch_board_stats(instance.pk)
+        record_changes(instance.pk, 'board', [instance.pk], version)
+
+
+@receiver(post_save, sender=Board)
+def invalidate_owner_membership(sender, instance, created, **kwargs):
+    """
+    Drop the cached visible boards of a new owner and a previous one.
+    """
+    previous_owner_id = getattr(instance, '_loaded_owner_id', None)
+    if created or previous_owner_id != instance.owner_id:
+        invalidate_membership(user_ids=[instance.owner_id, previous_owner_id])
+
+
+@receiver(pre_delete, sender=Board)
+def remember_deleted_board_members(sender, instance, **kwargs):
+    """
+    Capture the members of a board before they are deleted with it.
+    """
+    instance._deleted_member_ids = list(
+        instance.members.values_list('id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Board)
+def invalidate_deleted_board_membership(sender, instance, **kwargs):
+    """
+    Drop the cached membership of a deleted board and its users.
+    """
+    invalidate_membership(
+        board_ids=[instance.pk],
+        user_ids=[instance.owner_id, *getattr(instance, '_deleted_member_ids', [])]
+    )
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def update_member_count(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep `BoardStats.member_count` in sync with the members relation and
+    record the added or removed members in the change log.
+
+    Added ids are exact (Django filters out existing members), so additions
+    are applied as increments. Removals and clears trigger a recount.
+    """
+    if action == 'pre_clear':
+        if reverse:
+            instance._cleared_board_ids = list(
+                instance.boards.values_list('id', flat=True)
+            )
+        else:
+            instance._cleared_member_ids = list(
+                instance.members.values_list('id', flat=True)
+            )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    related_ids = _changed_member_ids(instance, action, reverse, pk_set)
+    if not related_ids:
+        return
+    board_ids = related_ids if reverse else [instance.pk]
+    added = action == 'post_add'
+
+    with transaction.atomic():
+        if added and reverse:
+            versions = touch_boards_stats(board_ids, {'member_count': 1})
+        elif added:
+            versions = touch_boards_stats(
+                board_ids, {'member_count': len(related_ids)}
+            )
+        else:
+            versions = recount_members(board_ids)
+        for board_id, version in versions.items():
+            user_ids = [instance.pk] if reverse else related_ids
+            record_changes(board_id, 'member', user_ids, version, deleted=not added)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def invalidate_member_membership(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Drop the cached membership of the boards and users a change touches.
+    """
+    if action in ('post_add', 'post_remove') and pk_set:
+        if reverse:
+            invalidate_membership(board_ids=pk_set, user_ids=[instance.pk])
+        else:
+            invalidate_membership(board_ids=[instance.pk], user_ids=pk_set)
+    elif action == 'post_clear':
+        if reverse:
+            invalidate_membership(
+                board_ids=getattr(instance, '_cleared_board_ids', []),
+                user_ids=[instance.pk]
+            )
+        else:
+            invalidate_membership(
+                board_ids=[instance.pk],
+                user_ids=getattr(instance, '_cleared_member_ids', [])
+            )
+
+
+@receiver(post_save, sender=Task)
+def update_task_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Bump the board version when a task is saved and adjust the counters
+    when it is created or changes its board, status or priority.
+
+    Records the task in the change log, and a tombstone on its previous
+    board if it moved.
+    """
+    if raw:
+        return
+
+    new_state = (instance.board_id, instance.status, instance.priority)
+    old_state = None if created else _loaded_task_state(instance)
+    new_board_id, status, priority = new_state
+    deltas = {}
+    if created or (old_state and old_state != new_state):
+        deltas = task_counter_deltas(status, priority, 1)
+    with transaction.atomic():
+        if old_state and old_state[0] != new_board_id:
+            old_board_id, old_status, old_priority = old_state
+            version = touch_board_stats(
+                old_board_id, task_counter_deltas(old_status, old_priority, -1)
+            )
+            record_changes(old_board_id, 'task', [instance.pk], version, deleted=True)
+        elif deltas and old_state:
+            deltas.update(task_counter_deltas(old_state[1], old_state[2], -1))
+        version = touch_board_stats(new_board_id, deltas)
+        record_changes(new_board_id, 'task', [instance.pk], version)
+
+
+@receiver(post_delete, sender=Task)
+def update_task_counters_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Decrement the board counters when a task is deleted and record a
+    tombstone in the change log.
+
+    Skipped when the whole board is deleted, its counters go with it.
+    """
+    if _deleted_with(origin, Board):
+        return
+
+    board_id, status, priority = _loaded_task_state(instance) or (
+        instance.board_id, instance.status, instance.priority
+    )
+    with transaction.atomic():
+        version = touch_board_stats(
+            board_id, task_counter_deltas(status, priority, -1)
+        )
+        record_changes(board_id, 'task', [instance.pk], version, deleted=True)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def touch_board_on_comment_change(sender, instance, raw=False, origin=None, **kwargs):
+    """
+    Bump the board version when a comment is created, edited or deleted,
+    and record the change in the change log.
+
+    Skipped when the comment goes with its task or board, which bump the
+    version themselves; the task's tombstone implies its comments are gone.
+    """
+    if raw or _deleted_with(origin, Board, Task):
+        return
+    with transaction.atomic():
+        board_id, version = touch_board_stats_of_task(instance.task_id)
+        record_changes(
+            board_id, 'comment', [instance.pk], version,
+            deleted='created' not in kwargs
+        )
+
+
+@receiver(post_save, sender=Board)
+def publish_board_update(sender, instance, created, raw=False, **kwargs):
+    """
+    Publish an event when a board is renamed or changes its owner.
+    """
+    if not raw and not created:
+        publish_on_commit(instance.pk, 'board.updated', id=instance.pk)
+
+
+@receiver(post_delete, sender=Board)
+def publish_board_deletion(sender, instance, **kwargs):
+    """
+    Publish an event when a board is deleted.
+    """
+    publish_on_commit(instance.pk, 'board.deleted', id=instance.pk)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def publish_member_changes(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Publish an event per added or removed board member.
+
+    Connected after the handlers above, so it consumes the ids they
+    captured before a clear.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    related_ids = _changed_member_ids(
+        instance, action, reverse, pk_set, consume=True
+    )
+    pairs = (
+        [(board_id, instance.pk) for board_id in related_ids] if reverse
+        else [(instance.pk, user_id) for user_id in related_ids]
+    )
+    event_type = 'member.added' if action == 'post_add' else 'member.removed'
+    for board_id, user_id in pairs:
+        publish_on_commit(board_id, event_type, user_id=user_id)
+
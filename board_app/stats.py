@@ -0,0 +1,202 @@
+"""
+Helpers maintaining the denormalized `BoardStats` counters and versions.
+
+Counters are changed with F-expressions so concurrent writers never lose
+an update. Membership counts are recounted instead of adjusted, because
+the members relation does not report which removed ids were members.
+
+Every bump returns the versions its UPDATE wrote (`RETURNING`), so the
+change log can be stamped with them in the same transaction while the
+row lock is held, instead of reading the version again later.
+"""
+
+# 1. Standard library
+from collections import Counter
+
+# 2. Third-party suppliers
+from django.db import connections, router, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.sql import UpdateQuery
+
+# 3. Local imports
+from board_app.models import Board, BoardStats
+from task_app.models import Task
+
+STATUS_COUNTERS = {
+    'to-do': 'to_do_count',
+    'in-progress': 'in_progress_count',
+    'review': 'review_count',
+    'done': 'done_count',
+}
+
+
+def task_counter_deltas(status, priority, sign=1):
+    """
+    Return the counter deltas caused by adding or removing one task.
+
+    Args:
+        status (str): Status of the task.
+        priority (str): Priority of the task.
+        sign (int): 1 when the task is added, -1 when it is removed.
+
+    Returns:
+        Counter: Mapping of `BoardStats` field names to deltas.
+    """
+    deltas = Counter({'ticket_count': sign})
+    if status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[status]] += sign
+    if priority == 'high':
+        deltas['high_prio_count'] += sign
+    return deltas
+
+
+def _bump_versions(queryset, **changes):
+    """
+    Bump the version of the selected `BoardStats` rows in one UPDATE.
+
+    Args:
+        queryset (QuerySet): The `BoardStats` rows to bump.
+        **changes: Further field updates, as for `QuerySet.update`.
+
+    Returns:
+        dict: The new version of every updated row, by board ID.
+    """
+    using = router.db_for_write(BoardStats)
+    query = queryset.query.chain(UpdateQuery)
+    query.add_update_values({'version': F('version') + 1, **changes})
+    sql, params = query.get_compiler(using).as_sql()
+    if not sql:
+        return {}
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    sql = f"{sql} RETURNING {quote('board_id')}, {quote('version')}"
+    with transaction.mark_for_rollback_on_error(using):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return dict(cursor.fetchall())
+
+
+def touch_boards_stats(board_ids, deltas=None):
+    """
+    Bump the versions of boards and apply counter deltas in one UPDATE.
+
+    Args:
+        board_ids (Iterable[int]): IDs of the boards.
+        deltas (Mapping): `BoardStats` field names mapped to deltas.
+
+    Returns:
+        dict: The new version of every board, by board ID.
+    """
+    changes = {
+        field: F(field) + delta
+        for field, delta in (deltas or {}).items() if delta
+    }
+    return _bump_versions(
+        BoardStats.objects.filter(board_id__in=list(board_ids)), **changes
+    )
+
+
+def touch_board_stats(board_id, deltas=None):
+    """
+    Bump the board version and apply counter deltas in one UPDATE.
+
+    Args:
+        board_id (int): ID of the board.
+        deltas (Mapping): `BoardStats` field names mapped to deltas.
+
+    Returns:
+        int | None: The new version, None if the board has no stats row.
+    """
+    return touch_boards_stats([board_id], deltas).get(board_id)
+
+
+def touch_board_stats_of_task(task_id):
+    """
+    Bump the version of the board a task belongs to in one UPDATE.
+
+    Returns:
+        tuple: (board ID, new version), or (None, None) if there is none.
+    """
+    board_id = Task.objects.filter(id=task_id).values('board_id')
+    versions = _bump_versions(
+        BoardStats.objects.filter(board_id=Subquery(board_id))
+    )
+    return next(iter(versions.items()), (None, None))
+
+
+def recount_members(board_ids):
+    """
+    Recount the members of the given boards in a single UPDATE.
+
+    Also bumps the version of the boards.
+
+    Args:
+        board_ids (Iterable[int]): IDs of the boards to recount.
+
+    Returns:
+        dict: The new version of every board, by board ID.
+    """
+    member_count = Board.members.through.objects.filter(
+        board_id=OuterRef('board_id')
+    ).order_by().values('board_id').annotate(
+        total=Count('*')
+    ).values('total')
+    return _bump_versions(
+        BoardStats.objects.filter(board_id__in=list(board_ids)),
+        member_count=Coalesce(Subquery(member_count), 0),
+    )
+
+
+def rebuild_board_stats(board_ids):
+    """
+    Recompute the counters of the given boards from scratch.
+
+    Missing `BoardStats` rows are created. Runs in one transaction.
+
+    Args:
+        board_ids (Iterable[int]): IDs of the boards to rebuild.
+
+    Returns:
+        int: Number of boards whose stored counters had drifted.
+    """
+    fields = BoardStats.COUNTER_FIELDS
+    boards = Board.objects.filter(id__in=list(board_ids)).with_counters()
+    fresh = {
+        row['id']: row for row in boards.order_by().values('id', *fields)
+    }
+
+    with transaction.atomic():
+        stored = BoardStats.objects.in_bulk(list(fresh))
+        missing = [
+            BoardStats(board_id=board_id, **{f: row[f] for f in fields})
+            for board_id, row in fresh.items() if board_id not in stored
+        ]
+        drifted = [
+            stats for board_id, stats in stored.items()
+            if any(getattr(stats, f) != fresh[board_id][f] for f in fields)
+        ]
+        for stats in drifted:
+            for field in fields:
+                setattr(stats, field, fresh[stats.board_id][field])
+
+        BoardStats.objects.bulk_create(missing)
+        BoardStats.objects.bulk_update(drifted, fields)
+    return len(missing) + len(drifted)
+
+
+def get_board_stats(board):
+    """
+    Return the `BoardStats` row of a board, rebuilding it if it is missing.
+
+    Rows are missing after raw or bulk inserts of boards that were not
+    followed by `rebuild_board_stats`.
+    """
+    try:
+        return board.stats
+    except BoardStats.DoesNotExist:
+        rebuild_board_stats([board.pk])
+        board.stats = BoardStats.objects.db_manager(
+            router.db_for_write(BoardStats)
+        ).get(board_id=board.pk)
+        return board.stats
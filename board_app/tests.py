@@ -1,3 +1,245 @@
+# 1. Third-party suppliers
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+# 2. Local imports
+from board_app.models import Board, BoardChange, BoardStats
+from board_app.stats import rebuild_board_stats
+from task_app.models import Comment, Task
+
+STATUSES = ['to-do', 'in-progress', 'review', 'done']
+PRIORITIES = ['low', 'medium', 'high']
+
+
+def create_board(owner, members, task_count, title='Board'):
+    """
+    Create a board with members and `task_count` tasks, every third of
+    them commented and assigned to and reviewed by the members in turn.
+    """
+    board = Board.objects.create(title=title, owner=owner)
+    board.members.add(*members)
+    tasks = Task.objects.bulk_create([
+        Task(
+            board=board,
+            title=f'Task {index}',
+            status=STATUSES[index % len(STATUSES)],
+            priority=PRIORITIES[index % len(PRIORITIES)],
+            assignee=members[index % len(members)] if index % 2 else None,
+            reviewer=members[(index + 1) % len(members)] if index % 3 else None,
+            created_by=owner,
+            rank=f'{index:06d}',
+        )
+        for index in range(task_count)
+    ])
+    Comment.objects.bulk_create([
+        Comment(task=task, author=owner, content='Comment')
+        for task in tasks[::3]
+    ])
+    rebuild_board_stats([board.id])
+    return board
+
+
+class BoardDetailQueryTests(TestCase):
+    """
+    Board detail takes a fixed number of queries, however many tasks the
+    board has.
+    """
+    # Board with stats, visible boards, members, task stubs and the
+    # rendering of the fragment cache misses.
+    QUERIES = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.members = [
+            User.objects.create_user(f'member{i}', f'member{i}@example.com', 'pw')
+            for i in range(3)
+        ]
+        cls.boards = {
+            size: create_board(cls.owner, cls.members, size, f'Board {size}')
+            for size in (1, 100, 1000)
+        }
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_queries_do_not_grow_with_tasks(self):
+        for size, board in self.boards.items():
+            with self.subTest(tasks=size):
+                cache.clear()
+                url = reverse('board_app:board-detail', args=[board.id])
+                with self.assertNumQueries(self.QUERIES):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data['tasks']), size)
+
+
+class BoardListQueryTests(TestCase):
+    """
+    The board list takes a fixed number of queries, however many boards
+    the user has.
+    """
+    # Boards with their stored counters, in one joined statement.
+    QUERIES = 1
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.member = User.objects.create_user('member', 'member@example.com', 'pw')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def test_queries_do_not_grow_with_boards(self):
+        url = reverse('board_app:board-list-create')
+        for count in (1, 10, 50):
+            while Board.objects.count() < count:
+                create_board(self.owner, [self.member], 4, f'Board {count}')
+            with self.subTest(boards=count):
+                with self.assertNumQueries(self.QUERIES):
+                    response = self.client.get(url)
+                self.assertEqual(len(response.data['results']), count)
+
+    def test_counters_match_the_tasks(self):
+        create_board(self.owner, [self.member], 12)
+        response = self.client.get(reverse('board_app:board-list-create'))
+        board = response.data['results'][0]
+        self.assertEqual(board['member_count'], 1)
+        self.assertEqual(board['ticket_count'], 12)
+        self.assertEqual(board['tasks_to_do_count'], 3)
+        self.assertEqual(board['tasks_high_prio_count'], 4)
+
+
+class MissingBoardStatsTests(TestCase):
+    """
+    Boards whose `BoardStats` row is missing get it rebuilt on read.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.board = create_board(cls.owner, [cls.owner], 7)
+        cls.task = cls.board.tasks.first()
+
+    def setUp(self):
+        cache.clear()
+        BoardStats.objects.filter(board=self.board).delete()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_board_detail_rebuilds_the_stats(self):
+        response = self.client.get(
+            reverse('board_app:board-detail', args=[self.board.id])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertEqual(BoardStats.objects.get(board=self.board).ticket_count, 7)
+
+    def test_board_list_rebuilds_the_stats(self):
+        response = self.client.get(reverse('board_app:board-list-create'))
+        self.assertEqual(response.data['results'][0]['ticket_count'], 7)
+
+    def test_task_comments_rebuild_the_stats(self):
+        response = self.client.get(
+            reverse('task_app:task-comments', args=[self.task.id])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(BoardStats.objects.filter(board=self.board).exists())
+
+
+class BoardChangeLogTests(TestCase):
+    """
+    Changes are stamped with the board version their own bump produced.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.member = User.objects.create_user('member', 'member@example.com', 'pw')
+        cls.board = create_board(cls.owner, [cls.owner], 3)
+        cls.other_board = create_board(cls.owner, [cls.owner], 1)
+
+    def _version(self, board):
+        return BoardStats.objects.get(board=board).version
+
+    def _change(self, board, kind, object_id):
+        return BoardChange.objects.get(board=board, kind=kind, object_id=object_id)
+
+    def test_task_save_and_move(self):
+        task = self.board.tasks.first()
+        task.title = 'Renamed'
+        task.save()
+        self.assertEqual(self._change(self.board, 'task', task.id).seq,
+                         self._version(self.board))
+
+        task.board = self.other_board
+        task.save()
+        tombstone = self._change(self.board, 'task', task.id)
+        self.assertTrue(tombstone.deleted)
+        self.assertEqual(tombstone.seq, self._version(self.board))
+        self.assertEqual(self._change(self.other_board, 'task', task.id).seq,
+                         self._version(self.other_board))
+
+    def test_members_and_comments(self):
+        self.board.members.add(self.member)
+        self.assertEqual(self._change(self.board, 'member', self.member.id).seq,
+                         self._version(self.board))
+        self.member.boards.remove(self.board)
+        change = self._change(self.board, 'member', self.member.id)
+        self.assertTrue(change.deleted)
+        self.assertEqual(change.seq, self._version(self.board))
+
+        comment = Comment.objects.create(
+            task=self.board.tasks.first(), author=self.owner, content='Hi'
+        )
+        self.assertEqual(self._change(self.board, 'comment', comment.id).seq,
+                         self._version(self.board))
+
+    def test_delta_sync_returns_each_change_once(self):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        url = reverse('board_app:board-changes', args=[self.board.id])
+        since = self._version(self.board)
+        seen = []
+        for task in self.board.tasks.all():
+            task.priority = 'low'
+            task.save()
+            response = client.get(url, {'since': since})
+            seen.extend(row['id'] for row in response.data['tasks'])
+            since = response.data['version']
+        self.assertEqual(
+            seen, list(self.board.tasks.values_list('id', flat=True))
+        )
+
+
+class BoardChangesAccessTests(TestCase):
+    """
+    The delta sync endpoint does not tell non-members which boards exist.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.stranger = User.objects.create_user('other', 'other@example.com', 'pw')
+        cls.board = create_board(cls.owner, [cls.owner], 1)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.stranger)
+
+    def test_existing_and_missing_boards_look_the_same(self):
+        for board_id in (self.board.id, self.board.id + 1000):
+            with self.subTest(board_id=board_id):
+                response = self.client.get(
+                    reverse('board_app:board-changes', args=[board_id]),
+                    {'since': 0}
+                )
+                self.assertEqual(response.status_code, 403)
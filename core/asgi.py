@@ -3,6 +3,12 @@ ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve the project through this module (e.g. ``uvicorn core.asgi:application``)
+to get the non-blocking behaviour of the async views: registration and login
+hash passwords in the bounded pool of ``auth_app.hashing`` while the event
+loop keeps handling other requests, and every open board event stream
+(``/api/boards/<id>/events/``) costs a queue instead of a worker thread.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
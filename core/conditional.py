@@ -0,0 +1,64 @@
+"""
+Conditional GET support driven by version counters.
+
+Views compute a strong ETag from the version of the data they render and
+answer `If-None-Match` with 304 before doing any serialization work. The
+version must be read before the data, so a concurrent write can only make
+the ETag older than the body, never newer.
+"""
+
+# 1. Standard library
+import hashlib
+
+# 2. Third-party suppliers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(request, *parts):
+    """
+    Build a strong ETag from version parts and the request variant.
+
+    The full path (including cursors and page size) and the negotiated
+    renderer are part of the tag, so every representation gets its own.
+
+    Args:
+        request (Request): The current DRF request.
+        *parts: Values identifying the resource and its version.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    renderer = getattr(request, 'accepted_media_type', '')
+    key = ':'.join(
+        str(part) for part in (*parts, request.get_full_path(), renderer)
+    )
+    return '"%s"' % hashlib.sha1(key.encode()).hexdigest()
+
+
+def is_not_modified(request, etag):
+    """
+    Return True if the client's If-None-Match header matches the ETag.
+    """
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags
+
+
+def not_modified_response(etag):
+    """
+    Return an empty 304 response carrying the ETag.
+    """
+    return with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+
+def with_etag(response, etag):
+    """
+    Attach the ETag and ask clients to revalidate before reusing the body.
+    """
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,177 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+`ReplicaRoutingMiddleware` marks GET requests to the allowlisted views in
+`DATABASE_REPLICAS['VIEWS']` as replica-safe; `ReplicaRouter` then sends
+their reads to one of the `DATABASE_REPLICAS['ALIASES']`. Everything else,
+including every write, uses the `default` (primary) database.
+
+A client whose request changed data is pinned to the primary for
+`PIN_SECONDS`, so it reads its own writes even while the replicas lag.
+Clients are identified by a hash of their credentials (the Authorization
+header or the session cookie) and pins live in the shared cache.
+
+Credentials (tokens and sessions) are always read from the primary: a
+client that has just registered or logged in must not be rejected by a
+replica that has not seen its token yet. For the same reason, code that
+fills a shared cache from its reads (e.g. `board_app.membership`) reads the
+primary explicitly with `.using(PRIMARY)`.
+"""
+
+# 1. Standard library
+import hashlib
+import random
+from contextvars import ContextVar
+
+# 2. Third-party suppliers
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULTS = {
+    'ALIASES': [],
+    'PIN_SECONDS': 5,
+    'VIEWS': [],
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'DATABASE_REPLICAS', {})}
+
+PRIMARY = 'default'
+PRIMARY_ONLY_APPS = {'authtoken', 'sessions'}
+PIN_KEY = 'db:pinned:{}'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_use_replica = ContextVar('use_replica', default=False)
+
+
+class ReplicaRouter:
+    """
+    Route reads of replica-safe requests to a replica, all else to primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        """
+        Return a random replica alias inside replica-safe requests.
+        """
+        if (
+            CONFIG['ALIASES'] and _use_replica.get()
+            and model._meta.app_label not in PRIMARY_ONLY_APPS
+        ):
+            return random.choice(CONFIG['ALIASES'])
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        """
+        Send every write to the primary.
+        """
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Allow relations between objects loaded from any copy of the data.
+        """
+        databases = {PRIMARY, *CONFIG['ALIASES']}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Migrate the primary only; replicas receive its schema by replication.
+        """
+        return db not in CONFIG['ALIASES']
+
+
+def _client_key(request):
+    """
+    Return the pin cache key of the requesting client, or None if the
+    request carries no credentials.
+    """
+    credentials = request.headers.get('Authorization') or request.COOKIES.get(
+        settings.SESSION_COOKIE_NAME
+    )
+    if not credentials:
+        return None
+    return PIN_KEY.format(hashlib.sha1(credentials.encode()).hexdigest())
+
+
+def pin_to_primary(request):
+    """
+    Route the client's replica-safe reads to the primary for `PIN_SECONDS`.
+    """
+    key = _client_key(request)
+    if key is not None:
+        cache.set(key, True, CONFIG['PIN_SECONDS'])
+
+
+def is_pinned(request):
+    """
+    Return True if the client wrote data within the last `PIN_SECONDS`.
+    """
+    key = _client_key(request)
+    return key is not None and cache.get(key, False)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Enable replica reads for allowlisted GET views and pin writing clients.
+
+    Works in sync and async stacks. In async stacks `process_view` is a
+    coroutine too, so Django does not hop to a thread for every request.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.views = set(CONFIG['VIEWS'])
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self._aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _use_replica.set(False)
+        try:
+            response = self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(request)
+        return response
+
+    async def __acall__(self, request):
+        token = _use_replica.set(False)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            await sync_to_async(pin_to_primary)(request)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Mark the request as replica-safe once its view is resolved.
+        """
+        if self._is_replica_safe(request) and not is_pinned(request):
+            _use_replica.set(True)
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Async variant of `process_view`.
+        """
+        if (
+            self._is_replica_safe(request)
+            and not await sync_to_async(is_pinned)(request)
+        ):
+            _use_replica.set(True)
+
+    def _is_replica_safe(self, request):
+        """
+        Return True for GET requests to allowlisted views, with replicas set.
+        """
+        return (
+            CONFIG['ALIASES'] and request.method == 'GET'
+            and request.resolver_match.view_name in self.views
+        )
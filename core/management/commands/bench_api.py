@@ -0,0 +1,357 @@
+# 1. Standard library
+import json
+import statistics
+import time
+from contextlib import ExitStack
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import URLPattern, get_resolver, reverse
+from rest_framework.authtoken.models import Token
+
+# 3. Local imports
+from auth_app.token_cache import token_cache_stats
+from core.db_router import CONFIG as REPLICA_CONFIG
+from core.management.utils import get_sample_task
+from task_app.models import Comment
+from task_app.search import search_terms
+
+API_NAMESPACES = ('auth_app', 'board_app', 'task_app')
+# Streams never end, so they cannot be timed like requests.
+SKIPPED_ROUTES = {'board_app:board-events'}
+BENCH_PASSWORD = 'bench-api-password'
+
+
+class Command(BaseCommand):
+    """
+    Benchmark every API endpoint in-process with the Django test client.
+
+    Requests each route of the API apps `--iterations` times against the
+    current (seeded) database and prints, per endpoint, the p50/p95/p99
+    latency, the SQL query count and time per request and the response size
+    as JSON, followed by the token cache counters.
+
+    The whole run happens inside one transaction that is rolled back, and
+    every request in a savepoint of its own, so write endpoints see the
+    same data on every iteration and nothing is persisted. Caches are
+    swapped for a private in-process cache for the same reason, and
+    on-commit hooks (live events) never fire.
+
+    With `--compare baseline.json` the results are checked against an
+    earlier output; the command fails if an endpoint got slower than
+    `--threshold` percent at p50 or p95, or issues more queries.
+    """
+    help = "Benchmark the API endpoints and report latency percentiles and queries."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=50,
+            help="Timed requests per endpoint (default: 50)."
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=5,
+            help="Untimed requests per endpoint before timing (default: 5)."
+        )
+        parser.add_argument(
+            '--task',
+            type=int,
+            help="Task whose board, owner and comments are requested "
+                 "(default: the most recently commented task)."
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help="Only benchmark endpoints whose label contains this text "
+                 "(repeatable), e.g. 'GET board_app:'."
+        )
+        parser.add_argument(
+            '--output',
+            help="Also write the JSON report to this file, e.g. as a baseline."
+        )
+        parser.add_argument(
+            '--compare',
+            help="Baseline report to check the results against."
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=20.0,
+            help="Allowed latency increase in percent (default: 20)."
+        )
+
+    def handle(self, *args, iterations, warmup, task, endpoints, output,
+               compare, threshold, **options):
+        """
+        Run the benchmark, print the report and compare it to a baseline.
+        """
+        if iterations < 2:
+            raise CommandError("At least 2 iterations are needed for percentiles.")
+        if REPLICA_CONFIG['ALIASES']:
+            raise CommandError(
+                "Disable the read replicas: the rolled-back benchmark data "
+                "only exists on the primary database."
+            )
+        baseline = self._load_baseline(compare) if compare else None
+
+        private_cache = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'bench-api',
+            }
+        }
+        with override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+            CACHES=private_cache,
+        ), transaction.atomic():
+            requests = self._get_requests(self._set_up(get_sample_task(task)))
+            self._warn_uncovered(requests)
+            if endpoints:
+                requests = [
+                    request for request in requests
+                    if any(text in request[0] for text in endpoints)
+                ]
+            results = {}
+            for label, method, path, body, client in requests:
+                if options['verbosity'] >= 2:
+                    self.stderr.write(f"Benchmarking {label} ...")
+                results[label] = self._bench(
+                    client, method, path, body, iterations, warmup
+                )
+            report = {
+                'iterations': iterations,
+                'endpoints': results,
+                'token_cache': token_cache_stats(),
+            }
+            transaction.set_rollback(True)
+
+        content = json.dumps(report, indent=2)
+        self.stdout.write(content)
+        if output:
+            with open(output, 'w') as file:
+                file.write(content + '\n')
+        if baseline is not None:
+            self._compare(baseline, results, threshold)
+
+    def _set_up(self, task):
+        """
+        Create the objects the write endpoints need, inside the benchmark
+        transaction, and return the IDs the requests refer to.
+        """
+        board = task.board
+        owner = board.owner
+        bench_user = User.objects.create_user(
+            'bench-api', 'bench-api@example.com', BENCH_PASSWORD
+        )
+        board.members.add(owner, bench_user)
+        comment = Comment.objects.create(task=task, author=owner, content='Bench')
+        token, _ = Token.objects.get_or_create(user=owner)
+        return {
+            'task': task,
+            'board_id': board.id,
+            'owner': owner,
+            'member_id': bench_user.id,
+            'comment_id': comment.id,
+            'token': token.key,
+        }
+
+    def _get_requests(self, subject):
+        """
+        Return (label, method, path, body, client) of every benchmarked request.
+
+        Users are authenticated with their token, like the frontend does.
+        """
+        task = subject['task']
+        board_id = subject['board_id']
+        member_id = subject['member_id']
+        terms = search_terms(task.title)
+        anonymous = Client()
+        client = Client(HTTP_AUTHORIZATION=f"Token {subject['token']}")
+        new_task = {
+            'board': board_id, 'title': 'Bench task', 'description': '',
+            'status': 'to-do', 'priority': 'medium',
+            'assignee_id': member_id, 'reviewer_id': None, 'due_date': None,
+        }
+        specs = [
+            ('POST', 'auth_app:registration', [], {
+                'fullname': 'Bench Registration', 'email': 'bench-new@example.com',
+                'password': BENCH_PASSWORD, 'repeated_password': BENCH_PASSWORD,
+            }, anonymous),
+            ('POST', 'auth_app:login', [], {
+                'email': 'bench-api@example.com', 'password': BENCH_PASSWORD,
+            }, anonymous),
+            ('GET', 'auth_app:email-check', [], {'email': subject['owner'].email}, client),
+            ('GET', 'board_app:board-list-create', [], None, client),
+            ('POST', 'board_app:board-list-create', [], {
+                'title': 'Bench board', 'members': [member_id],
+            }, client),
+            ('GET', 'board_app:board-detail', [board_id], None, client),
+            ('PATCH', 'board_app:board-detail', [board_id], {'title': 'Bench'}, client),
+            ('DELETE', 'board_app:board-detail', [board_id], None, client),
+            ('GET', 'board_app:board-changes', [board_id], {'since': 0}, client),
+            ('POST', 'task_app:task-create', [], new_task, client),
+            ('POST', 'task_app:task-bulk-create', [], [new_task] * 20, client),
+            ('PATCH', 'task_app:task-batch-update', [], [
+                {'id': task.id, 'status': 'done', 'priority': 'high'},
+            ], client),
+            ('GET', 'task_app:assigned-to-me', [], None, client),
+            ('GET', 'task_app:reviewing-tasks', [], None, client),
+            ('GET', 'task_app:task-search', [], {'q': terms[0] if terms else 'a'}, client),
+            ('PATCH', 'task_app:task-detail', [task.id], {'status': 'review'}, client),
+            ('DELETE', 'task_app:task-detail', [task.id], None, client),
+            ('PATCH', 'task_app:task-move', [task.id], {'status': 'done'}, client),
+            ('GET', 'task_app:task-comments', [task.id], None, client),
+            ('POST', 'task_app:task-comments', [task.id], {'content': 'Bench'}, client),
+            ('DELETE', 'task_app:comment-delete', [task.id, subject['comment_id']],
+             None, client),
+        ]
+        return [
+            (f'{method} {name}', method, reverse(name, args=args), body, client)
+            for method, name, args, body, client in specs
+        ]
+
+    def _warn_uncovered(self, requests):
+        """
+        Warn about API routes the benchmark does not request yet.
+        """
+        covered = {label.split(' ', 1)[1] for label, *_ in requests}
+        for name in sorted(_route_names(get_resolver().url_patterns)):
+            if (name.split(':')[0] in API_NAMESPACES
+                    and name not in covered | SKIPPED_ROUTES):
+                self.stderr.write(f"Warning: route '{name}' is not benchmarked.")
+
+    def _bench(self, client, method, path, body, iterations, warmup):
+        """
+        Request one endpoint repeatedly and summarize the timed runs.
+        """
+        samples = []
+        for run in range(warmup + iterations):
+            timer = QueryTimer()
+            with ExitStack() as stack:
+                stack.enter_context(transaction.atomic())
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timer))
+                start = time.perf_counter()
+                response = self._request(client, method, path, body)
+                elapsed = time.perf_counter() - start
+                transaction.set_rollback(True)
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{method} {path} answered {response.status_code}: "
+                    f"{response.content[:200]!r}"
+                )
+            if run >= warmup:
+                samples.append(
+                    (elapsed, timer.count, timer.seconds, len(response.content))
+                )
+
+        latencies = [sample[0] * 1000 for sample in samples]
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        return {
+            'status': response.status_code,
+            'p50_ms': round(percentiles[49], 3),
+            'p95_ms': round(percentiles[94], 3),
+            'p99_ms': round(percentiles[98], 3),
+            'queries': statistics.mean(sample[1] for sample in samples),
+            'sql_ms': round(statistics.mean(sample[2] for sample in samples) * 1000, 3),
+            'bytes': statistics.mean(sample[3] for sample in samples),
+        }
+
+    def _request(self, client, method, path, body):
+        """
+        Send one request; GET bodies are passed as query parameters.
+        """
+        if method == 'GET':
+            return client.get(path, body)
+        return getattr(client, method.lower())(
+            path, body, content_type='application/json'
+        )
+
+    def _load_baseline(self, path):
+        """
+        Return the endpoint results of a baseline report.
+
+        Raises:
+            CommandError: If the file cannot be read or is no report.
+        """
+        try:
+            with open(path) as file:
+                return json.load(file)['endpoints']
+        except (OSError, ValueError, KeyError) as error:
+            raise CommandError(f"Cannot read baseline '{path}': {error}")
+
+    def _compare(self, baseline, results, threshold):
+        """
+        Report regressions against the baseline.
+
+        Raises:
+            CommandError: If any endpoint regressed.
+        """
+        factor = 1 + threshold / 100
+        regressions = []
+        for label, result in results.items():
+            base = baseline.get(label)
+            if base is None:
+                continue
+            for key in ('p50_ms', 'p95_ms'):
+                if result[key] > base[key] * factor:
+                    regressions.append(
+                        f"{label}: {key} {base[key]} -> {result[key]}"
+                    )
+            if result['queries'] > base['queries']:
+                regressions.append(
+                    f"{label}: queries {base['queries']} -> {result['queries']}"
+                )
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} regressions against the baseline:\n"
+                + '\n'.join(regressions)
+            )
+        self.stderr.write(self.style.SUCCESS(
+            f"No regressions beyond {threshold:g}% against the baseline."
+        ))
+
+
+class QueryTimer:
+    """
+    Database execute wrapper counting statements and their total time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+def _route_names(patterns, namespace=None):
+    """
+    Yield the namespaced names of all named URL patterns.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            if pattern.name:
+                yield f'{namespace}:{pattern.name}' if namespace else pattern.name
+        else:
+            child = pattern.namespace
+            if namespace and child:
+                child = f'{namespace}:{child}'
+            yield from _route_names(pattern.url_patterns, child or namespace)
@@ -0,0 +1,129 @@
+# 1. Standard library
+import re
+from contextlib import ExitStack
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+# 3. Local imports
+from core.management.utils import get_sample_task
+from task_app.search import search_terms
+
+# A full pass over a table or one of its indexes. Virtual tables (the FTS
+# index), constant rows and subquery results are not tables on disk.
+FULL_SCAN = re.compile(r'^SCAN (?!CONSTANT ROW|\()(?!.*VIRTUAL TABLE)')
+
+
+class Command(BaseCommand):
+    """
+    Fail if a query of the hot read endpoints scans a whole table.
+
+    Requests every read endpoint the frontend polls as the owner of a board
+    from the current database, runs `EXPLAIN QUERY PLAN` on every query they
+    issue and reports the queries whose plan contains a full table or index
+    scan. `core.tests.QueryPlanTests` runs it on fixture data with the test
+    suite; run it by hand against a seeded database to check the plans on
+    realistic data. SQLite only.
+    """
+    help = "Check the query plans of the hot read endpoints for full scans."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--task',
+            type=int,
+            help="Task whose board, owner and comments are requested "
+                 "(default: the most recently commented task)."
+        )
+
+    def handle(self, *args, task, **options):
+        """
+        Request the endpoints, explain their queries and report full scans.
+        """
+        for connection in connections.all():
+            if connection.vendor != 'sqlite':
+                raise CommandError(
+                    f"Database '{connection.alias}' is not SQLite; "
+                    "only SQLite query plans are supported."
+                )
+
+        task = get_sample_task(task)
+        client = APIClient()
+        client.force_authenticate(task.board.owner)
+
+        failures = []
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for url in self._get_urls(task):
+                failures += self._check_endpoint(client, url, options['verbosity'])
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} queries scan a full table:\n\n"
+                + '\n\n'.join(failures)
+            )
+        self.stdout.write(self.style.SUCCESS("No full scans in the hot queries."))
+
+    def _get_urls(self, task):
+        """
+        Return the URLs of the hot read endpoints for the given task.
+        """
+        board_id = task.board_id
+        terms = search_terms(task.title)
+        return [
+            reverse('board_app:board-list-create'),
+            reverse('board_app:board-detail', args=[board_id]),
+            reverse('board_app:board-changes', args=[board_id]) + '?since=0',
+            reverse('task_app:assigned-to-me'),
+            reverse('task_app:reviewing-tasks'),
+            reverse('task_app:task-search') + f"?q={terms[0] if terms else 'a'}",
+            reverse('task_app:task-comments', args=[task.id]),
+            reverse('auth_app:email-check') + f'?email={task.board.owner.email}',
+        ]
+
+    def _check_endpoint(self, client, url, verbosity):
+        """
+        Request one endpoint and return a report of each full-scan query.
+
+        Queries are captured on every database alias, so reads routed to a
+        replica are checked as well.
+        """
+        with ExitStack() as stack:
+            contexts = [
+                stack.enter_context(CaptureQueriesContext(connection))
+                for connection in connections.all()
+            ]
+            response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} answered {response.status_code}.")
+
+        failures = []
+        count = 0
+        for context in contexts:
+            for query in context.captured_queries:
+                sql = query['sql'].strip()
+                if not sql.upper().startswith('SELECT'):
+                    continue
+                count += 1
+                plan = self._explain(context.connection, sql)
+                if verbosity >= 2:
+                    self.stdout.write(f"{sql}\n    " + '\n    '.join(plan))
+                scans = [step for step in plan if FULL_SCAN.match(step)]
+                if scans:
+                    failures.append(f"GET {url}\n{sql}\n    " + '\n    '.join(scans))
+        self.stdout.write(f"GET {url}: {count} queries, {len(failures)} full scans")
+        return failures
+
+    def _explain(self, connection, sql):
+        """
+        Return the steps of the SQLite query plan of a statement.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+            return [row[3] for row in cursor.fetchall()]
@@ -0,0 +1,131 @@
+# 1. Standard library
+import pstats
+from pathlib import Path
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 3. Local imports
+from core.profiling import profile_directory
+
+
+class Command(BaseCommand):
+    """
+    Aggregate the request profiles written by `core.profiling`.
+
+    Merges the selected dumps and prints the functions with the highest
+    cumulative (or own) time, each with its hottest call path: starting at
+    the function, the caller contributing the most time is followed
+    upwards until there is none left or `--depth` is reached.
+    """
+    help = "Summarize the top functions and call paths of request profiles."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--directory',
+            help="Directory of the dumps (default: REQUEST_PROFILING['DIRECTORY'])."
+        )
+        parser.add_argument(
+            '--view',
+            help="Only use dumps of this URL name, e.g. 'board-detail'."
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help="Number of functions reported (default: 20)."
+        )
+        parser.add_argument(
+            '--sort',
+            choices=['cumulative', 'tottime'],
+            default='cumulative',
+            help="Rank functions by cumulative or own time (default: cumulative)."
+        )
+        parser.add_argument(
+            '--depth',
+            type=int,
+            default=6,
+            help="Maximum length of the reported call paths (default: 6)."
+        )
+        parser.add_argument(
+            '--project-only',
+            action='store_true',
+            help="Only report functions defined in the project's own code."
+        )
+
+    def handle(self, *args, directory, view, limit, sort, depth, project_only,
+               **options):
+        """
+        Merge the dumps and print the report.
+        """
+        directory = Path(directory) if directory else profile_directory()
+        dumps = sorted(directory.glob('*.prof'))
+        if view:
+            dumps = [dump for dump in dumps if f'-{view}-' in dump.name]
+        if not dumps:
+            raise CommandError(f"No profile dumps found in {directory}.")
+
+        stats = pstats.Stats(*map(str, dumps))
+        index = 3 if sort == 'cumulative' else 2
+        ranked = sorted(
+            stats.stats.items(), key=lambda item: item[1][index], reverse=True
+        )
+        if project_only:
+            ranked = [item for item in ranked if self._is_project(item[0])]
+
+        self.stdout.write(
+            f"{len(dumps)} profiles, {stats.total_tt:.3f} s in total, "
+            f"sorted by {'cumulative' if sort == 'cumulative' else 'own'} time\n"
+        )
+        self.stdout.write(f"{'calls':>9} {'own s':>9} {'cum s':>9}  function")
+        for function, (_, calls, own, cumulative, _) in ranked[:limit]:
+            self.stdout.write(
+                f"{calls:>9} {own:>9.3f} {cumulative:>9.3f}  "
+                f"{self._label(function)}"
+            )
+            path = self._hottest_path(stats, function, depth)
+            if len(path) > 1:
+                self.stdout.write(
+                    ' ' * 31 + 'via ' + ' < '.join(
+                        self._label(caller) for caller in path[1:]
+                    )
+                )
+
+    def _hottest_path(self, stats, function, depth):
+        """
+        Return the function and its chain of most expensive callers.
+        """
+        path = [function]
+        while len(path) < depth:
+            callers = stats.stats[path[-1]][4]
+            candidates = [
+                (timing[3], caller) for caller, timing in callers.items()
+                if caller not in path
+            ]
+            if not candidates:
+                break
+            path.append(max(candidates)[1])
+        return path
+
+    def _is_project(self, function):
+        """
+        Return True if the function is defined in the project's own code.
+        """
+        filename = function[0]
+        return (
+            filename.startswith(str(settings.BASE_DIR))
+            and 'site-packages' not in filename
+        )
+
+    def _label(self, function):
+        """
+        Return 'file:line(name)' with the path shortened to its last parts.
+        """
+        filename, line, name = function
+        if filename == '~':
+            return name
+        return f"{'/'.join(Path(filename).parts[-3:])}:{line}({name})"
@@ -0,0 +1,397 @@
+# 1. Standard library
+import datetime
+import random
+import time
+import uuid
+from contextlib import contextmanager
+
+# 2. Third-party suppliers
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+# 3. Local imports
+from board_app.models import Board
+from board_app.stats import rebuild_board_stats
+from task_app.models import Comment, Task
+from task_app.ranking import spread_ranks
+from task_app.search import INSERT_TRIGGERS, TRIGGER_SQL, index_boards
+
+FIRST_NAMES = [
+    'Anna', 'Ben', 'Clara', 'David', 'Emma', 'Felix', 'Greta', 'Hugo',
+    'Ida', 'Jonas', 'Lena', 'Max', 'Nora', 'Oskar', 'Paula', 'Tim',
+]
+LAST_NAMES = [
+    'Becker', 'Fischer', 'Hoffmann', 'Koch', 'Meyer', 'Müller', 'Neumann',
+    'Richter', 'Schmidt', 'Schneider', 'Schulz', 'Wagner', 'Weber', 'Wolf',
+]
+WORDS = [
+    'api', 'backend', 'board', 'bug', 'cache', 'check', 'cleanup', 'design',
+    'docs', 'email', 'export', 'fix', 'frontend', 'import', 'index', 'layout',
+    'login', 'migration', 'mobile', 'onboarding', 'payment', 'profile',
+    'refactor', 'release', 'report', 'review', 'search', 'settings', 'signup',
+    'sync', 'test', 'update', 'upload', 'user', 'validation', 'widget',
+]
+STATUSES = [status for status, _ in Task.STATUS_CHOICES]
+STATUS_WEIGHTS = [3, 2, 1, 4]
+PRIORITIES = [priority for priority, _ in Task.PRIORITY_CHOICES]
+PRIORITY_WEIGHTS = [5, 3, 2]
+TASK_COLUMNS = [
+    'board_id', 'title', 'description', 'status', 'priority', 'assignee_id',
+    'reviewer_id', 'due_date', 'created_by_id', 'rank',
+]
+
+
+def zipf_counts(total, buckets, skew):
+    """
+    Split `total` into `buckets` counts following a Zipf-like distribution.
+
+    The k-th largest count is proportional to 1 / k**skew; the counts are
+    returned in random order.
+
+    Args:
+        total (int): Sum of all counts.
+        buckets (int): Number of counts.
+        skew (float): Exponent of the distribution, 0 for uniform counts.
+
+    Returns:
+        list[int]: The shuffled counts.
+    """
+    if buckets <= 0:
+        return []
+    weights = [1 / rank ** skew for rank in range(1, buckets + 1)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for index in range(total - sum(counts)):
+        counts[index % buckets] += 1
+    random.shuffle(counts)
+    return counts
+
+
+@contextmanager
+def insert_triggers_suspended():
+    """
+    Suspend the search index insert triggers within the current transaction.
+
+    SQLite schema changes are transactional: the triggers are dropped and
+    recreated before the transaction commits, and no other connection can
+    write in between, so only the rows of this transaction skip them. A
+    failed batch rolls the drop back with everything else.
+    """
+    if connection.vendor != 'sqlite':
+        yield
+        return
+    if not connection.in_atomic_block:
+        raise RuntimeError("Search triggers may only be suspended in a transaction.")
+    with connection.cursor() as cursor:
+        for trigger in INSERT_TRIGGERS:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    yield
+    with connection.cursor() as cursor:
+        for statement in TRIGGER_SQL:
+            cursor.execute(statement)
+
+
+class Command(BaseCommand):
+    """
+    Generate a large synthetic dataset of users, boards, tasks and comments.
+
+    Board sizes, tasks per board and comments per task follow Zipf-like
+    distributions (`--skew`), so a few boards are huge and most are small,
+    as in production. Users and boards are written with batched
+    `bulk_create` calls, memberships, tasks and comments with raw
+    `executemany`, each batch of boards with all its rows in one
+    transaction; all users share one precomputed password hash. Tasks are
+    ranked within their columns on insert; the search index is filled per
+    batch instead of by its per-row triggers, which are suspended only
+    inside the batch's transaction, and the board counters are rebuilt at
+    the end. Signals are bypassed, so no change log entries, live events
+    or inbox versions are produced.
+
+    New rows are tagged with a random run prefix in usernames and emails,
+    so the command can run repeatedly against the same database.
+    """
+    help = "Seed the database with a large, skewed synthetic kanban dataset."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--users', type=int, default=1000,
+            help="Number of users (default: 1000)."
+        )
+        parser.add_argument(
+            '--boards', type=int, default=200,
+            help="Number of boards (default: 200)."
+        )
+        parser.add_argument(
+            '--members', type=int, default=8,
+            help="Average number of members per board (default: 8)."
+        )
+        parser.add_argument(
+            '--tasks', type=int, default=20000,
+            help="Number of tasks (default: 20000)."
+        )
+        parser.add_argument(
+            '--comments', type=int, default=60000,
+            help="Number of comments (default: 60000)."
+        )
+        parser.add_argument(
+            '--skew', type=float, default=1.1,
+            help="Zipf exponent of board and task sizes (default: 1.1)."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=20000,
+            help="Rows written per transaction (default: 20000)."
+        )
+        parser.add_argument(
+            '--password', default='kanmind-seed',
+            help="Password of all generated users (default: kanmind-seed)."
+        )
+        parser.add_argument(
+            '--seed', type=int,
+            help="Random seed for a reproducible dataset."
+        )
+
+    def handle(self, *args, users, boards, members, tasks, comments, skew,
+               batch_size, password, seed, **options):
+        """
+        Create the users, then the boards batch by batch, then the counters.
+        """
+        if users < 1 or boards < 0 or tasks < 0 or comments < 0:
+            raise CommandError("Counts must not be negative; at least one user is needed.")
+        if comments and not tasks:
+            raise CommandError("Comments need tasks.")
+        if tasks and not boards:
+            raise CommandError("Tasks need boards.")
+        random.seed(seed)
+        self.verbosity = options['verbosity']
+        self.prefix = f'seed-{uuid.UUID(int=random.getrandbits(128)).hex[:8]}'
+        self.batch_size = batch_size
+        self.today = datetime.date.today()
+        started = time.monotonic()
+
+        user_ids = self._create_users(users, make_password(password))
+        board_ids = self._create_boards(
+            user_ids, boards, members, tasks, comments, skew
+        )
+        for start in range(0, len(board_ids), 500):
+            rebuild_board_stats(board_ids[start:start + 500])
+
+        elapsed = time.monotonic() - started
+        rows = users + len(board_ids) + tasks + comments
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {users} users, {len(board_ids)} boards, {tasks} tasks "
+            f"and {comments} comments ({self.prefix}) in {elapsed:.1f} s "
+            f"({rows / max(elapsed, 1e-9):.0f} rows/s). "
+            f"Password: {password}"
+        ))
+
+    def _create_users(self, count, password_hash):
+        """
+        Create `count` users sharing one password hash and return their IDs.
+        """
+        user_ids = []
+        for start in range(0, count, self.batch_size):
+            batch = [
+                self._build_user(number, password_hash)
+                for number in range(start, min(start + self.batch_size, count))
+            ]
+            with transaction.atomic():
+                User.objects.bulk_create(batch)
+            user_ids += [user.id for user in batch]
+            self._progress('users', len(user_ids), count)
+        return user_ids
+
+    def _build_user(self, number, password_hash):
+        """
+        Return an unsaved user with a random name.
+        """
+        username = f'{self.prefix}-{number}'
+        return User(
+            username=username,
+            email=f'{username}@example.com',
+            password=password_hash,
+            first_name=random.choice(FIRST_NAMES),
+            last_name=random.choice(LAST_NAMES),
+        )
+
+    def _create_boards(self, user_ids, count, members, tasks, comments, skew):
+        """
+        Create boards with their members, tasks and comments.
+
+        Boards are collected until their rows reach the batch size and
+        then written in one transaction. Returns the IDs of the boards.
+        """
+        sizes = [
+            min(max(size, 1), len(user_ids))
+            for size in zipf_counts(count * members, count, skew)
+        ]
+        task_counts = zipf_counts(tasks, count, skew)
+        # Comments follow the tasks: a board gets its share by task count.
+        comment_counts = [
+            comments * task_count // tasks if tasks else 0
+            for task_count in task_counts
+        ]
+        with_tasks = [index for index, task_count in enumerate(task_counts) if task_count]
+        for index in range(comments - sum(comment_counts)):
+            comment_counts[with_tasks[index % len(with_tasks)]] += 1
+
+        board_ids = []
+        pending = []
+        pending_rows = 0
+        created_tasks = 0
+        for number in range(count):
+            pending.append((
+                number, sizes[number], task_counts[number], comment_counts[number]
+            ))
+            pending_rows += sizes[number] + task_counts[number] + comment_counts[number]
+            if pending_rows >= self.batch_size or number == count - 1:
+                board_ids += self._write_boards(pending, user_ids, skew)
+                created_tasks += sum(entry[2] for entry in pending)
+                self._progress('tasks', created_tasks, tasks)
+                pending = []
+                pending_rows = 0
+        return board_ids
+
+    def _write_boards(self, entries, user_ids, skew):
+        """
+        Write one batch of boards with all their rows in one transaction.
+
+        Args:
+            entries (list[tuple]): (number, member count, task count,
+                comment count) of every board.
+            user_ids (list[int]): IDs of the users to pick members from.
+            skew (float): Zipf exponent of the comments per task.
+
+        Returns:
+            list[int]: IDs of the created boards.
+        """
+        board_members = [random.sample(user_ids, size) for _, size, _, _ in entries]
+        with transaction.atomic(), insert_triggers_suspended():
+            boards = Board.objects.bulk_create([
+                Board(title=self._words(2, 4).capitalize(), owner_id=users[0])
+                for users in board_members
+            ])
+            self._insert_rows(
+                Board.members.through, ['board_id', 'user_id'],
+                [
+                    (board.id, user_id)
+                    for board, users in zip(boards, board_members)
+                    for user_id in users
+                ],
+            )
+
+            board_tasks = [
+                self._build_tasks(board.id, users, task_count)
+                for board, users, (_, _, task_count, _) in zip(
+                    boards, board_members, entries
+                )
+            ]
+            self._insert_rows(
+                Task, TASK_COLUMNS,
+                [task for column in board_tasks for task in column],
+            )
+            # The boards are new, so their tasks are exactly the inserted
+            # rows, and ascending IDs follow the order of insertion.
+            task_ids = iter(
+                Task.objects.filter(board__in=boards).order_by('id')
+                .values_list('id', flat=True)
+            )
+
+            created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+            new_comments = []
+            for column, users, (_, _, _, comment_count) in zip(
+                board_tasks, board_members, entries
+            ):
+                per_task = zipf_counts(comment_count, len(column), skew)
+                # per_task first: zip must not pull an extra ID from task_ids.
+                for task_comments, task_id in zip(per_task, task_ids):
+                    new_comments += [
+                        (
+                            task_id,
+                            random.choice(users),
+                            self._words(3, 20).capitalize() + '.',
+                            created_at,
+                        )
+                        for _ in range(task_comments)
+                    ]
+            self._insert_rows(
+                Comment, ['task_id', 'author_id', 'content', 'created_at'],
+                new_comments,
+            )
+            index_boards(board.id for board in boards)
+        return [board.id for board in boards]
+
+    def _insert_rows(self, model, columns, rows):
+        """
+        Insert plain value tuples with `executemany`, skipping the ORM.
+
+        Used for the tables with the most rows; building model instances
+        and compiling `bulk_create` statements costs several times more
+        than the inserts themselves.
+        """
+        quote = connection.ops.quote_name
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(model._meta.db_table),
+            ', '.join(quote(column) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[start:start + self.batch_size])
+
+    def _build_tasks(self, board_id, users, count):
+        """
+        Return the `TASK_COLUMNS` values of `count` new tasks of a board,
+        ranked within their columns.
+        """
+        assignees = [None, *users]
+        reviewers = [None, None, *users]
+        tasks = [
+            [
+                board_id,
+                self._words(2, 6).capitalize(),
+                self._words(0, 30),
+                status,
+                random.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+                random.choice(assignees),
+                random.choice(reviewers),
+                self._due_date(),
+                random.choice(users),
+                '',
+            ]
+            for status in random.choices(STATUSES, STATUS_WEIGHTS, k=count)
+        ]
+        for status in STATUSES:
+            column = [task for task in tasks if task[3] == status]
+            for task, rank in zip(column, spread_ranks(len(column))):
+                task[9] = rank
+        return [tuple(task) for task in tasks]
+
+    def _words(self, minimum, maximum):
+        """
+        Return between `minimum` and `maximum` random words.
+        """
+        return ' '.join(random.choices(WORDS, k=random.randint(minimum, maximum)))
+
+    def _due_date(self):
+        """
+        Return a due date within two months around today, or None, as a
+        database value.
+        """
+        if random.random() < 0.3:
+            return None
+        return connection.ops.adapt_datefield_value(
+            self.today + datetime.timedelta(days=random.randint(-30, 60))
+        )
+
+    def _progress(self, label, done, total):
+        """
+        Report progress on stderr at verbosity 2 and above.
+        """
+        if self.verbosity >= 2:
+            self.stderr.write(f"{label}: {done}/{total}")
@@ -0,0 +1,32 @@
+"""
+Helpers shared by the benchmark and diagnostics commands.
+"""
+
+# 1. Third-party suppliers
+from django.core.management.base import CommandError
+
+# 2. Local imports
+from task_app.models import Comment, Task
+
+
+def get_sample_task(task_id=None):
+    """
+    Return the task whose board, owner and comments a command requests.
+
+    Defaults to the most recently commented task, which on a seeded
+    database sits on a board with members, tasks and comments.
+
+    Raises:
+        CommandError: If the task does not exist or the database is empty.
+    """
+    tasks = Task.objects.select_related('board__owner')
+    if task_id is not None:
+        try:
+            return tasks.get(id=task_id)
+        except Task.DoesNotExist:
+            raise CommandError(f"Task {task_id} does not exist.")
+    comment = Comment.objects.order_by('-id').first()
+    task = tasks.filter(id=comment.task_id).first() if comment else tasks.first()
+    if task is None:
+        raise CommandError("The database holds no tasks to query.")
+    return task
@@ -0,0 +1,388 @@
+"""
+Request metrics in the Prometheus text format, served at `/metrics`.
+
+`MetricsMiddleware` records, per URL name (e.g. `board-detail`), the
+request count by method and status and histograms of the latency, the SQL
+statements (from `core.query_stats`) and the response size. Cache hits and
+misses are counted by the caches themselves: the task fragment cache
+through `inc`, the token cache through a collector read at scrape time.
+
+Recording is lock-free: every thread adds to a dictionary of its own, so
+requests never wait for each other; a lock is only taken the first time a
+thread records. Scrapes merge the per-thread dictionaries. The dictionaries
+of exited threads are folded into a process total whenever a new thread
+registers or a scrape runs, so servers starting a thread per request do
+not accumulate them.
+
+Every worker process counts on its own. With `DIRECTORY` set, each process
+writes its totals to `<DIRECTORY>/<pid>-<id>.json` (atomically, after a
+request once `FLUSH_INTERVAL` seconds have passed, and on exit) and the
+scraping process sums the files of all processes, so the totals stay
+correct however requests are spread. Files of exited workers are kept so
+counters never go backwards; clear the directory when the server is
+(re)started. Without `DIRECTORY` only the scraped process is reported.
+
+Access is limited to `ALLOWED_IPS`, or to requests carrying
+`Authorization: Bearer <TOKEN>` when a token is configured.
+"""
+
+# 1. Standard library
+import atexit
+import bisect
+import hmac
+import json
+import os
+import threading
+import time
+import uuid
+import weakref
+from pathlib import Path
+
+# 2. Third-party suppliers
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+
+# 3. Local imports
+from core.query_stats import get_query_stats
+
+DEFAULTS = {
+    'DIRECTORY': None,
+    'FLUSH_INTERVAL': 5,
+    'ALLOWED_IPS': ['127.0.0.1', '::1'],
+    'TOKEN': None,
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'METRICS', {})}
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Name: (type, help, buckets of histograms).
+DEFINITIONS = {
+    'kanmind_http_requests_total': (
+        'counter', "Requests by URL name, method and status.", None,
+    ),
+    'kanmind_http_request_duration_seconds': (
+        'histogram', "Time until the response is returned.", LATENCY_BUCKETS,
+    ),
+    'kanmind_http_request_db_queries': (
+        'histogram', "SQL statements per request.", QUERY_BUCKETS,
+    ),
+    'kanmind_http_response_size_bytes': (
+        'histogram', "Body size of non-streaming responses.", SIZE_BUCKETS,
+    ),
+    'kanmind_cache_requests_total': (
+        'counter', "Cache lookups by cache and result (hit or miss).", None,
+    ),
+}
+
+METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_local = threading.local()
+# (weak reference to the thread, its samples) pairs, and the samples of
+# exited threads.
+_shards = []
+_retired = {}
+_shards_lock = threading.Lock()
+_collectors = []
+_process = {'pid': None, 'file': None, 'next_flush': 0.0}
+
+
+def _shard():
+    """
+    Return the samples dictionary of the current thread.
+    """
+    try:
+        return _local.shard
+    except AttributeError:
+        shard = _local.shard = {}
+        with _shards_lock:
+            _retire_exited_shards()
+            _shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+
+def _retire_exited_shards():
+    """
+    Fold the samples of exited threads into `_retired`.
+
+    Call with `_shards_lock` held. An exited thread no longer records, so
+    its dictionary can be read without copying.
+    """
+    live = []
+    for thread_ref, shard in _shards:
+        thread = thread_ref()
+        if thread is not None and thread.is_alive():
+            live.append((thread_ref, shard))
+            continue
+        for key, value in shard.items():
+            _add(_retired, key, list(value) if isinstance(value, list) else value)
+    _shards[:] = live
+
+
+def _key(name, labels):
+    """
+    Return the sample key of a metric name and its labels.
+    """
+    return (name, tuple(sorted(labels.items())))
+
+
+def inc(name, value=1, **labels):
+    """
+    Add `value` to a counter.
+    """
+    shard = _shard()
+    key = _key(name, labels)
+    shard[key] = shard.get(key, 0) + value
+
+
+def observe(name, value, **labels):
+    """
+    Record one observation in a histogram.
+
+    Its samples are the count per bucket (the last one is `+Inf`) followed
+    by the sum of the observed values.
+    """
+    buckets = DEFINITIONS[name][2]
+    shard = _shard()
+    key = _key(name, labels)
+    samples = shard.get(key)
+    if samples is None:
+        samples = shard[key] = [0] * (len(buckets) + 1) + [0]
+    samples[bisect.bisect_left(buckets, value)] += 1
+    samples[-1] += value
+
+
+def register_collector(collector):
+    """
+    Add a callable returning `(name, labels, value)` counter samples that
+    are read at scrape time, e.g. counters a cache keeps itself.
+    """
+    _collectors.append(collector)
+
+
+def snapshot():
+    """
+    Return the merged samples of this process as `{key: value}`, where
+    histogram values are lists as described in `observe`.
+    """
+    with _shards_lock:
+        _retire_exited_shards()
+        shards = [shard for _, shard in _shards]
+        merged = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in _retired.items()
+        }
+    for shard in shards:
+        # dict.copy() is atomic, unlike iterating a dict another thread
+        # may be adding to.
+        for key, value in shard.copy().items():
+            _add(merged, key, list(value) if isinstance(value, list) else value)
+    for collector in _collectors:
+        for name, labels, value in collector():
+            _add(merged, _key(name, labels), value)
+    return merged
+
+
+def _add(merged, key, value):
+    """
+    Add a counter value or histogram samples to the merged samples.
+    """
+    current = merged.get(key)
+    if current is None:
+        merged[key] = value
+    elif isinstance(current, list):
+        if len(current) == len(value):
+            merged[key] = [a + b for a, b in zip(current, value)]
+    else:
+        merged[key] = current + value
+
+
+def _process_file():
+    """
+    Return the file of this process, renewed in forked children.
+    """
+    pid = os.getpid()
+    if _process['pid'] != pid:
+        _process['pid'] = pid
+        _process['file'] = Path(CONFIG['DIRECTORY']) / f'{pid}-{uuid.uuid4().hex[:8]}.json'
+    return _process['file']
+
+
+def flush():
+    """
+    Write the totals of this process to its file in `DIRECTORY`.
+    """
+    if not CONFIG['DIRECTORY']:
+        return
+    _process['next_flush'] = time.monotonic() + CONFIG['FLUSH_INTERVAL']
+    path = _process_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    samples = [[name, labels, value] for (name, labels), value in snapshot().items()]
+    temporary = path.with_name(f'.{path.stem}-{threading.get_ident()}.tmp')
+    temporary.write_text(json.dumps(samples))
+    os.replace(temporary, path)
+
+
+def collect():
+    """
+    Return the samples of all processes (or of this one without `DIRECTORY`).
+    """
+    if not CONFIG['DIRECTORY']:
+        return snapshot()
+    flush()
+    merged = {}
+    for path in Path(CONFIG['DIRECTORY']).glob('*.json'):
+        try:
+            samples = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        for name, labels, value in samples:
+            _add(merged, (name, tuple(map(tuple, labels))), value)
+    return merged
+
+
+def _reset_after_fork():
+    """
+    Start a forked worker with empty counters instead of its parent's.
+    """
+    global _local
+    _local = threading.local()
+    _shards.clear()
+    _retired.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+if CONFIG['DIRECTORY']:
+    atexit.register(flush)
+
+
+def render(samples):
+    """
+    Return the samples in the Prometheus text exposition format.
+    """
+    by_name = {}
+    for (name, labels), value in samples.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name, (kind, help_text, buckets) in DEFINITIONS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in sorted(by_name.get(name, [])):
+            if kind == 'counter':
+                lines.append(f'{name}{_labels(labels)} {_number(value)}')
+                continue
+            cumulative = 0
+            for bound, count in zip((*buckets, '+Inf'), value):
+                cumulative += count
+                le = bound if bound == '+Inf' else _number(bound)
+                lines.append(
+                    f'{name}_bucket{_labels((*labels, ("le", le)))} {cumulative}'
+                )
+            lines.append(f'{name}_sum{_labels(labels)} {_number(value[-1])}')
+            lines.append(f'{name}_count{_labels(labels)} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+
+def _labels(labels):
+    """
+    Return `{name="value",...}`, or an empty string without labels.
+    """
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'),
+        )
+        for name, value in labels
+    )
+    return '{' + pairs + '}'
+
+
+def _number(value):
+    """
+    Format a sample value, without a fraction if it has none.
+    """
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Return the metrics of all worker processes to an allowed scraper.
+    """
+    if not _is_allowed(request):
+        return HttpResponseForbidden()
+    response = HttpResponse(render(collect()), content_type=CONTENT_TYPE)
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def _is_allowed(request):
+    """
+    Return True for the configured token, or for allowed addresses.
+    """
+    token = CONFIG['TOKEN']
+    if token:
+        authorization = request.headers.get('Authorization', '')
+        return hmac.compare_digest(authorization, f'Bearer {token}')
+    return request.META.get('REMOTE_ADDR') in CONFIG['ALLOWED_IPS']
+
+
+class MetricsMiddleware:
+    """
+    Record count, latency, queries and size of every request.
+
+    Works in sync and async stacks. Place it right after
+    `QueryStatsMiddleware`, whose statistics provide the query counts.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    def _record(self, request, response, seconds):
+        """
+        Add the request to the metrics of its URL name.
+        """
+        match = getattr(request, 'resolver_match', None)
+        view = (match.url_name or 'unnamed') if match else 'unmatched'
+        method = request.method if request.method in METHODS else 'other'
+        inc(
+            'kanmind_http_requests_total',
+            view=view, method=method, status=response.status_code,
+        )
+        observe('kanmind_http_request_duration_seconds', seconds, view=view)
+        stats = get_query_stats()
+        if stats is not None:
+            observe('kanmind_http_request_db_queries', stats.count, view=view)
+        if not response.streaming:
+            observe('kanmind_http_response_size_bytes', len(response.content), view=view)
+        if CONFIG['DIRECTORY'] and time.monotonic() >= _process['next_flush']:
+            flush()
@@ -0,0 +1,241 @@
+"""
+Keyset (cursor) pagination shared by the list endpoints.
+
+Pages are selected with a WHERE clause on the ordering key of the last row
+instead of an OFFSET, so every page costs the same no matter how deep the
+client pages. Cursors are opaque, URL-safe base64 encoded key values.
+"""
+
+# 1. Standard library
+import base64
+import json
+
+# 2. Third-party suppliers
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def encode_cursor(values):
+    """
+    Encode a tuple of key values into an opaque cursor string.
+    """
+    raw = json.dumps(values, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """
+    Decode a cursor string into key values converted to the given fields.
+
+    Raises:
+        NotFound: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError
+        return [
+            None if value is None else field.to_python(value)
+            for field, value in zip(fields, values)
+        ]
+    except (ValueError, TypeError, ValidationError):
+        raise NotFound("Invalid cursor.")
+
+
+def cursor_of(row, fields):
+    """
+    Encode the key values of a model instance or `values()` dict row.
+    """
+    if isinstance(row, dict):
+        return encode_cursor([row[field.attname] for field in fields])
+    return encode_cursor([getattr(row, field.attname) for field in fields])
+
+
+def keyset_filter(fields, values, descending=False):
+    """
+    Return a Q object selecting the rows after the given key values.
+
+    The last field must be unique (usually the primary key). Nullable
+    fields sort their NULLs last in ascending and first in descending
+    order, matching `keyset_ordering`.
+    """
+    condition = Q(pk__in=[])
+    equal = Q()
+    for field, value in zip(fields, values):
+        name = field.attname
+        lookup = 'lt' if descending else 'gt'
+        if value is None:
+            beyond = Q(**{f'{name}__isnull': False}) if descending else None
+            same = Q(**{f'{name}__isnull': True})
+        else:
+            beyond = Q(**{f'{name}__{lookup}': value})
+            if field.null and not descending:
+                beyond |= Q(**{f'{name}__isnull': True})
+            same = Q(**{name: value})
+        if beyond is not None:
+            condition |= equal & beyond
+        equal &= same
+    return condition
+
+
+def keyset_ordering(fields, descending=False):
+    """
+    Return the order_by() expressions matching `keyset_filter`.
+    """
+    if descending:
+        return [F(field.attname).desc(nulls_first=True) for field in fields]
+    return [F(field.attname).asc(nulls_last=True) for field in fields]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor pagination on a stable, unique ordering key.
+
+    Subclasses or views set `ordering` to a tuple of model field names whose
+    last entry is unique, e.g. ('due_date', 'id'). Querysets may return
+    model instances or `values()` dicts that include the ordering fields.
+    """
+    ordering = ('id',)
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return the rows of the requested page as a list.
+        """
+        self.request = request
+        fields = [queryset.model._meta.get_field(f) for f in self.ordering]
+        size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = decode_cursor(cursor, fields)
+            queryset = queryset.filter(keyset_filter(fields, values))
+
+        rows = list(queryset.order_by(*keyset_ordering(fields))[:size + 1])
+        self.has_next = len(rows) > size
+        rows = rows[:size]
+        self.next_cursor = cursor_of(rows[-1], fields) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        """
+        Return the requested page size clamped to `max_page_size`.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self):
+        """
+        Return the absolute URL of the next page, or None on the last page.
+        """
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.next_cursor
+        )
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the serialized page with the link to the next page.
+        """
+        return Response({'next': self.get_next_link(), 'results': data})
+
+
+class IncrementalKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for feeds that are polled for new rows.
+
+    `since=<cursor>` returns the rows after the cursor, `before=<cursor>`
+    the rows preceding it; without either the latest page is returned.
+    Rows are always returned in ascending order. `next` points to the rows
+    following the page (the URL to poll), `previous` to older rows.
+    """
+    since_query_param = 'since'
+    before_query_param = 'before'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return the rows of the requested page in ascending order.
+        """
+        self.request = request
+        fields = [queryset.model._meta.get_field(f) for f in self.ordering]
+        size = self.get_page_size(request)
+        since = request.query_params.get(self.since_query_param)
+        before = request.query_params.get(self.before_query_param)
+
+        if since:
+            values = decode_cursor(since, fields)
+            queryset = queryset.filter(keyset_filter(fields, values))
+            rows = list(
+                queryset.order_by(*keyset_ordering(fields))[:size + 1]
+            )
+            has_previous, rows = True, rows[:size]
+        else:
+            if before:
+                values = decode_cursor(before, fields)
+                queryset = queryset.filter(
+                    keyset_filter(fields, values, descending=True)
+                )
+            rows = list(queryset.order_by(
+                *keyset_ordering(fields, descending=True)
+            )[:size + 1])
+            has_previous = len(rows) > size
+            rows = rows[:size][::-1]
+
+        self.next_cursor = cursor_of(rows[-1], fields) if rows else since
+        self.previous_cursor = (
+            cursor_of(rows[0], fields) if rows and has_previous else None
+        )
+        return rows
+
+    def get_next_link(self):
+        """
+        Return the URL fetching the rows after this page, if known.
+        """
+        if not self.next_cursor:
+            return None
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.before_query_param
+        )
+        return replace_query_param(
+            url, self.since_query_param, self.next_cursor
+        )
+
+    def get_previous_link(self):
+        """
+        Return the URL fetching the rows before this page, if any.
+        """
+        if not self.previous_cursor:
+            return None
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.since_query_param
+        )
+        return replace_query_param(
+            url, self.before_query_param, self.previous_cursor
+        )
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the serialized page with the links to newer and older rows.
+        """
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
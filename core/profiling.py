@@ -0,0 +1,156 @@
+"""
+On-demand profiling of individual API requests.
+
+`RequestProfilingMiddleware` runs a request under `cProfile` when
+
+- it carries the `HEADER` (default `X-Profile: 1`) and is made by a staff
+  user, or
+- its view is listed in `VIEWS` and it falls into the random `SAMPLE_RATE`
+  share of their requests.
+
+Staff status is only known once the view has authenticated the request
+(token authentication happens inside DRF), so header requests are profiled
+optimistically and the profile of a non-staff user is discarded unseen.
+
+Each profile is dumped to `DIRECTORY` as a `pstats` file whose name carries
+the time, URL name, user ID and query count (from `core.query_stats`),
+e.g. `20261017-101500-123456-board-detail-u7-q12.prof`; only the newest
+`MAX_FILES` dumps are kept. Staff responses name their dump in the
+`X-Profile-Id` header. `manage.py profile_report` aggregates the dumps.
+
+The middleware works in sync and async stacks. cProfile only sees the
+thread it was enabled in, so under ASGI the profiler is started and
+stopped in the request's sync thread, which also runs sync views. Async
+views (login and registration) are never profiled: their work
+is spread over the event loop and worker threads.
+"""
+
+# 1. Standard library
+import cProfile
+import random
+import re
+from datetime import datetime
+from pathlib import Path
+
+# 2. Third-party suppliers
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+# 3. Local imports
+from core.query_stats import get_query_stats
+
+DEFAULTS = {
+    'HEADER': 'X-Profile',
+    'SAMPLE_RATE': 0.0,
+    'VIEWS': [],
+    'DIRECTORY': Path(settings.BASE_DIR) / 'profiles',
+    'MAX_FILES': 200,
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'REQUEST_PROFILING', {})}
+
+_UNSAFE = re.compile(r'[^A-Za-z0-9_-]+')
+
+
+def profile_directory():
+    """
+    Return the directory holding the profile dumps.
+    """
+    return Path(CONFIG['DIRECTORY'])
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile requests asked for by staff or sampled on configured views.
+
+    Place it after the authentication and query statistics middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.views = set(CONFIG['VIEWS'])
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.profiler = None
+        response = self.get_response(request)
+        if request.profiler is None:
+            return response
+        return self._finish(request, response)
+
+    async def __acall__(self, request):
+        request.profiler = None
+        response = await self.get_response(request)
+        if request.profiler is None:
+            return response
+        # Same thread as `process_view`, which Django runs via sync_to_async.
+        return await sync_to_async(self._finish)(request, response)
+
+    def _finish(self, request, response):
+        """
+        Stop the profiler, then dump the profile if it is to be kept.
+        """
+        profiler = request.profiler
+        profiler.disable()
+        requested = request.headers.get(CONFIG['HEADER'])
+        user = getattr(request, 'user', None)
+        is_staff = bool(user and user.is_staff)
+        if requested and not is_staff and not self._is_sampled(request):
+            return response
+        name = self._dump(request, profiler)
+        if is_staff:
+            response['X-Profile-Id'] = name
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Start the profiler right before the view of a chosen request runs.
+        """
+        if iscoroutinefunction(view_func):
+            return
+        if request.headers.get(CONFIG['HEADER']) or self._should_sample(request):
+            request.profiler = cProfile.Profile()
+            request.profiler.enable()
+
+    def _should_sample(self, request):
+        """
+        Decide whether a request without the header is sampled.
+        """
+        request.profile_sampled = (
+            request.resolver_match.view_name in self.views
+            and random.random() < CONFIG['SAMPLE_RATE']
+        )
+        return request.profile_sampled
+
+    def _is_sampled(self, request):
+        """
+        Return True if the request was chosen by sampling.
+        """
+        return getattr(request, 'profile_sampled', False)
+
+    def _dump(self, request, profiler):
+        """
+        Write the profile, drop the oldest dumps and return the file name.
+        """
+        directory = profile_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        match = request.resolver_match
+        user = getattr(request, 'user', None)
+        stats = get_query_stats()
+        tags = [
+            datetime.now().strftime('%Y%m%d-%H%M%S-%f'),
+            _UNSAFE.sub('_', match.url_name or 'unnamed'),
+            f"u{user.id if user and user.is_authenticated else 'anon'}",
+            f"q{stats.count if stats is not None else 'na'}",
+        ]
+        name = '-'.join(tags) + '.prof'
+        profiler.dump_stats(directory / name)
+
+        dumps = sorted(directory.glob('*.prof'))
+        for old in dumps[:max(len(dumps) - CONFIG['MAX_FILES'], 0)]:
+            old.unlink(missing_ok=True)
+        return name
@@ -0,0 +1,216 @@
+"""
+Per-request SQL statistics with N+1 detection and Server-Timing headers.
+
+`QueryStatsMiddleware` counts the statements and database time of every
+request and reports them in a `Server-Timing` header, e.g.
+`db;dur=4.2;desc="7 queries", total;dur=11.8`. Statements are grouped by
+fingerprint, their SQL with literals and IN lists replaced by `?`. A
+fingerprint executed `N_PLUS_ONE_THRESHOLD` times in one request is the
+N+1 signature: it is logged to the `core.query_stats` logger with the
+view and the innermost project function issuing it, e.g. a serializer's
+`get_<field>` method.
+
+Statements are observed by one execute wrapper installed on every database
+connection as it is created (and on those of the importing thread). It
+reads the statistics of the current request from a context variable,
+which `sync_to_async` carries into the thread running the ORM, so async
+views are covered too. Outside requests
+the wrapper costs a single lookup; inside it adds a timer and a cached
+fingerprint lookup per statement. Stacks are only inspected when a
+fingerprint reaches the threshold.
+
+Configured by `QUERY_STATS` with `N_PLUS_ONE_THRESHOLD` and
+`SERVER_TIMING` (whether to add the header).
+"""
+
+# 1. Standard library
+import functools
+import logging
+import re
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+# 2. Third-party suppliers
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+DEFAULTS = {
+    'N_PLUS_ONE_THRESHOLD': 10,
+    'SERVER_TIMING': True,
+}
+CONFIG = {**DEFAULTS, **getattr(settings, 'QUERY_STATS', {})}
+
+logger = logging.getLogger('core.query_stats')
+
+_current = ContextVar('query_stats', default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_IN_LIST = re.compile(r'\bIN \((?:\?, )*\?\)', re.IGNORECASE)
+_SPACE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(sql):
+    """
+    Return the shape of a statement: literals, placeholders and IN lists
+    are replaced by `?`, so the statements of an N+1 loop look alike.
+    """
+    shape = _STRING.sub('?', sql)
+    shape = _NUMBER.sub('?', shape)
+    shape = _PLACEHOLDER.sub('?', shape)
+    shape = _IN_LIST.sub('IN (...)', shape)
+    return _SPACE.sub(' ', shape).strip()
+
+
+class QueryStats:
+    """
+    Statements and database time of one request.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+        self.call_sites = {}
+
+    def record(self, sql, seconds):
+        """
+        Count one statement; remember its call site at the threshold.
+        """
+        self.count += 1
+        self.seconds += seconds
+        shape = fingerprint(sql)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == CONFIG['N_PLUS_ONE_THRESHOLD']:
+            self.call_sites[shape] = _project_call_site()
+
+    def repeated(self):
+        """
+        Return (shape, count, call site) of every N+1 candidate.
+        """
+        return [
+            (shape, self.shapes[shape], call_site)
+            for shape, call_site in self.call_sites.items()
+        ]
+
+
+def get_query_stats():
+    """
+    Return the statistics of the current request, or None.
+    """
+    return _current.get()
+
+
+def _project_call_site():
+    """
+    Return 'module.Qualified.name:line' of the innermost frame of project
+    code below this module, e.g. the serializer method running a query.
+    """
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(base_dir) and filename != __file__
+                and 'site-packages' not in filename):
+            module = frame.f_globals.get('__name__', '?')
+            return f'{module}.{frame.f_code.co_qualname}:{frame.f_lineno}'
+        frame = frame.f_back
+    return 'unknown'
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper recording statements into the current request's stats.
+    """
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.record(sql, time.perf_counter() - start)
+
+
+def install_wrapper(sender, connection, **kwargs):
+    """
+    Add the recording wrapper to a new database connection (once).
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(install_wrapper)
+# Connections of this thread may predate the import of the middleware.
+for _connection in connections.all():
+    install_wrapper(None, _connection)
+
+
+class QueryStatsMiddleware:
+    """
+    Count queries per request, add Server-Timing and log N+1 patterns.
+
+    Works in sync and async stacks. Place it first in `MIDDLEWARE` so the
+    total time covers the other middleware as well.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._finish(request, response, stats, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._finish(request, response, stats, time.perf_counter() - start)
+        return response
+
+    def _finish(self, request, response, stats, seconds):
+        """
+        Attach the statistics to the request and response and log N+1s.
+        """
+        request.query_stats = stats
+        if CONFIG['SERVER_TIMING']:
+            response['Server-Timing'] = (
+                f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+                f'total;dur={seconds * 1000:.1f}'
+            )
+        for shape, count, call_site in stats.repeated():
+            logger.warning(
+                "Possible N+1 in %s: %d similar queries from %s: %s",
+                _view_name(request), count, call_site, shape,
+            )
+
+
+def _view_name(request):
+    """
+    Return the dotted path of the view that handled the request.
+    """
+    match = getattr(request, 'resolver_match', None)
+    return match._func_path if match else request.path
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -40,18 +41,23 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework.authtoken',
+    'core',
     'auth_app',
     'board_app',
     'task_app',
 ]
 
 MIDDLEWARE = [
+    'core.query_stats.QueryStatsMiddleware',
+    'core.metrics.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.db_router.ReplicaRoutingMiddleware',
+    'core.profiling.RequestProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -98,6 +104,124 @@ DATABASES = {
     }
 }
 
+# Read replicas (core.db_router). GET requests to the VIEWS below read from
+# one of the ALIASES unless the client changed data within PIN_SECONDS.
+# Set KANMIND_REPLICA_DB to a copy of db.sqlite3 to try it locally; the copy
+# behaves like a replica lagging behind since the moment it was taken.
+
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+DATABASE_REPLICAS = {
+    'ALIASES': [],
+    'PIN_SECONDS': 5,
+    'VIEWS': [
+        'auth_app:email-check',
+        'board_app:board-list-create',
+        'board_app:board-detail',
+        'board_app:board-changes',
+        'task_app:assigned-to-me',
+        'task_app:reviewing-tasks',
+        'task_app:task-search',
+        'task_app:task-comments',
+    ],
+}
+
+if os.environ.get('KANMIND_REPLICA_DB'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['KANMIND_REPLICA_DB'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS['ALIASES'] = ['replica']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The membership cache relies on invalidation, so deployments running more
+# than one process must point this at a shared backend (Redis, Memcached).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+MEMBERSHIP_CACHE_TIMEOUT = 300
+
+# Rendered task JSON fragments (task_app.fragments). Keys change with every
+# task change, so the timeout only bounds how long unused entries are kept.
+
+TASK_FRAGMENT_CACHE_TIMEOUT = 3600
+
+
+# Authentication backends
+# https://docs.djangoproject.com/en/5.2/topics/auth/customizing/
+
+AUTHENTICATION_BACKENDS = [
+    'auth_app.backends.EmailBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+
+# Worker pool hashing passwords for the async registration and login views.
+# Jobs beyond MAX_WORKERS + MAX_QUEUE are rejected with 503.
+
+PASSWORD_HASHING_POOL = {
+    'EXECUTOR': 'thread',
+    'MAX_WORKERS': 4,
+    'MAX_QUEUE': 64,
+}
+
+
+# Server-Sent Events streams of board changes (board_app.events), per worker.
+# Connections beyond MAX_CONNECTIONS are rejected with 503; a stream whose
+# QUEUE_SIZE events are not consumed is reset. HEARTBEAT is in seconds.
+
+BOARD_EVENTS = {
+    'MAX_CONNECTIONS': 1000,
+    'QUEUE_SIZE': 100,
+    'HEARTBEAT': 15,
+}
+
+
+# Per-request SQL statistics (core.query_stats): Server-Timing headers and a
+# warning on the 'core.query_stats' logger when one statement shape runs
+# N_PLUS_ONE_THRESHOLD times in a request.
+
+QUERY_STATS = {
+    'N_PLUS_ONE_THRESHOLD': 10,
+    'SERVER_TIMING': True,
+}
+
+
+# Request profiling (core.profiling). Staff requests with the HEADER, and a
+# SAMPLE_RATE share (0.0 - 1.0) of the requests to VIEWS, are profiled into
+# DIRECTORY, keeping the newest MAX_FILES dumps. See `manage.py profile_report`.
+
+REQUEST_PROFILING = {
+    'HEADER': 'X-Profile',
+    'SAMPLE_RATE': 0.0,
+    'VIEWS': [
+        'board_app:board-detail',
+        'task_app:task-comments',
+    ],
+    'DIRECTORY': BASE_DIR / 'profiles',
+    'MAX_FILES': 200,
+}
+
+
+# Prometheus metrics at /metrics (core.metrics), readable from ALLOWED_IPS or
+# with 'Authorization: Bearer <TOKEN>'. With several worker processes, set
+# KANMIND_METRICS_DIR to a directory all of them share (emptied on restart);
+# each writes its totals there every FLUSH_INTERVAL seconds.
+
+METRICS = {
+    'DIRECTORY': os.environ.get('KANMIND_METRICS_DIR'),
+    'FLUSH_INTERVAL': 5,
+    'ALLOWED_IPS': ['127.0.0.1', '::1'],
+    'TOKEN': os.environ.get('KANMIND_METRICS_TOKEN'),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -146,6 +270,15 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.authentication.CachedTokenAuthentication',
     ]
 }
+
+# Token resolution cache of auth_app.authentication.CachedTokenAuthentication.
+# LOCAL_TIMEOUT bounds how long other processes accept a revoked token.
+
+TOKEN_CACHE = {
+    'MAX_ENTRIES': 10000,
+    'LOCAL_TIMEOUT': 30,
+    'SHARED_TIMEOUT': 300,
+}
@@ -0,0 +1,102 @@
+# 1. Standard library
+import io
+import threading
+
+# 2. Third-party suppliers
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+# 3. Local imports
+from board_app.models import Board
+from board_app.stats import rebuild_board_stats
+from core import metrics
+from task_app.models import Comment, Task
+
+
+class QueryPlanTests(TestCase):
+    """
+    No query of the hot read endpoints scans a whole table.
+
+    Runs `check_query_plans` (`EXPLAIN QUERY PLAN` on every query the
+    endpoints issue) against boards the user owns, is a member of and has
+    no access to, so the plans have to filter rather than read everything.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.member = User.objects.create_user('member', 'member@example.com', 'pw')
+        cls.stranger = User.objects.create_user('stranger', 'stranger@example.com', 'pw')
+
+        boards = [
+            Board.objects.create(title='Own board', owner=cls.owner),
+            Board.objects.create(title='Shared board', owner=cls.member),
+            Board.objects.create(title='Other board', owner=cls.stranger),
+        ]
+        boards[0].members.add(cls.owner, cls.member)
+        boards[1].members.add(cls.owner, cls.member)
+        boards[2].members.add(cls.stranger)
+
+        users = [cls.owner, cls.member, cls.stranger]
+        for board in boards:
+            for index, status in enumerate(['to-do', 'in-progress', 'review', 'done'] * 5):
+                task = Task.objects.create(
+                    board=board,
+                    title=f'Release checklist {index}',
+                    description='Update the changelog',
+                    status=status,
+                    priority=['low', 'medium', 'high'][index % 3],
+                    assignee=users[index % 3],
+                    reviewer=users[(index + 1) % 3],
+                    created_by=board.owner,
+                )
+                Comment.objects.create(task=task, author=board.owner, content='Done?')
+        rebuild_board_stats(board.id for board in boards)
+        cls.task = boards[0].tasks.order_by('id').last()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_hot_queries_use_indexes(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest("Query plans are only checked on SQLite.")
+        try:
+            call_command('check_query_plans', task=self.task.id, stdout=io.StringIO())
+        except CommandError as error:
+            self.fail(str(error))
+
+    def test_dropped_index_is_reported(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest("Query plans are only checked on SQLite.")
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Comment._meta.db_table
+            )
+            for name, constraint in constraints.items():
+                if constraint['index'] and constraint['columns'][0] == 'task_id':
+                    cursor.execute(f'DROP INDEX {name}')
+        with self.assertRaisesMessage(CommandError, 'task_app_comment'):
+            call_command('check_query_plans', task=self.task.id, stdout=io.StringIO())
+
+
+class MetricsShardTests(SimpleTestCase):
+    """
+    Samples of exited threads are kept, but their dictionaries are not.
+    """
+
+    def test_exited_threads_are_folded_into_the_totals(self):
+        name = 'kanmind_cache_requests_total'
+        labels = {'cache': 'test', 'result': 'hit'}
+        key = metrics._key(name, labels)
+        before = metrics.snapshot().get(key, 0)
+        for _ in range(50):
+            thread = threading.Thread(target=metrics.inc, args=(name,), kwargs=labels)
+            thread.start()
+            thread.join()
+        self.assertEqual(metrics.snapshot()[key], before + 50)
+        for thread_ref, _ in metrics._shards:
+            self.assertTrue(thread_ref().is_alive())
@@ -0,0 +1,54 @@
+"""
+Async counterpart of DRF's `APIView`.
+
+DRF dispatches synchronously, so under ASGI an `APIView` occupies a
+worker thread for the whole request, including time spent awaiting other
+work. `AsyncAPIView` keeps DRF's request parsing, authentication,
+permissions, throttling, content negotiation and exception handling, but
+runs async handler methods on the event loop. Only the synchronous
+checks of `initial()` (which may query the database to authenticate)
+run in a thread.
+"""
+
+# 1. Standard library
+import asyncio
+
+# 2. Third-party suppliers
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    `APIView` whose handler methods (`post`, `get`, ...) are coroutines.
+    """
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Same as `APIView.dispatch`, awaiting the handler.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(),
+                                  self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -1,9 +1,15 @@
 # 1. Third-party imports
 from django.contrib.auth.models import User
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 # 2. Local imports
+from board_app.membership import get_board_member_ids
+from board_app.models import Board
+from task_app.changes import record_task_changes, task_state
 from task_app.models import Task, Comment
+from task_app.ranking import assign_end_ranks
 
 
 class UserSummarySerializer(serializers.ModelSerializer):
@@ -81,8 +87,9 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             (reviewer_id, "Reviewer must be a member of the board."),
         ]
 
+        member_ids = get_board_member_ids(board.id)
         for user_id, error_msg in checks:
-            if user_id and not board.members.filter(id=user_id).exists():
+            if user_id and user_id not in member_ids:
                 raise serializers.ValidationError(error_msg)
 
     def create(self, validated_data):
@@ -110,6 +117,160 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return User.objects.filter(id=user_id).first() if user_id else None
 
 
+class TaskBulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer validating and creating many tasks at once.
+
+    Board existence and the membership of every creator, assignee and
+    reviewer are checked with one query each for the whole batch. Errors
+    are reported per item, aligned with the input list.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Validate the items, then the boards and memberships of the valid ones.
+        """
+        if not isinstance(data, list) or not data or (
+            self.max_length is not None and len(data) > self.max_length
+        ):
+            # Let the base class report malformed, empty or oversized lists.
+            return super().to_internal_value(data)
+
+        items, errors = [], []
+        for item in data:
+            try:
+                items.append(self.run_child_validation(item))
+                errors.append({})
+            except serializers.ValidationError as exc:
+                items.append(None)
+                errors.append(exc.detail)
+
+        valid = [item for item in items if item is not None]
+        membership_errors = iter(self._validate_board_membership(valid))
+        errors = [
+            error if item is None else next(membership_errors)
+            for item, error in zip(items, errors)
+        ]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def _validate_board_membership(self, items):
+        """
+        Return a list of per-item errors for unknown boards and non-members.
+        """
+        if not items:
+            return []
+        creator_id = self.context['request'].user.id
+        board_ids = {item['board'] for item in items}
+        user_ids = {creator_id}
+        for item in items:
+            user_ids.update((item.get('assignee_id'), item.get('reviewer_id')))
+        user_ids.discard(None)
+
+        existing = set(
+            Board.objects.filter(id__in=board_ids).values_list('id', flat=True)
+        )
+        memberships = set(
+            Board.members.through.objects.filter(
+                board_id__in=existing, user_id__in=user_ids
+            ).values_list('board_id', 'user_id')
+        )
+
+        return [
+            self._item_errors(item, creator_id, existing, memberships)
+            for item in items
+        ]
+
+    def _item_errors(self, item, creator_id, existing, memberships):
+        """
+        Return the errors of a single item, or an empty dict.
+        """
+        board_id = item['board']
+        if board_id not in existing:
+            return {'board': [f'Invalid pk "{board_id}" - object does not exist.']}
+
+        checks = [
+            (creator_id, "You are not a member of this board."),
+            (item.get('assignee_id'), "Assignee must be a member of the board."),
+            (item.get('reviewer_id'), "Reviewer must be a member of the board."),
+        ]
+        for user_id, error_msg in checks:
+            if user_id and (board_id, user_id) not in memberships:
+                return {api_settings.NON_FIELD_ERRORS_KEY: [error_msg]}
+        return {}
+
+    def create(self, validated_data):
+        """
+        Insert all tasks in one transaction and update the board counters
+        and inbox versions once for the whole batch.
+        """
+        creator = self.context['request'].user
+        tasks = [
+            Task(
+                board_id=item.pop('board'),
+                assignee_id=item.pop('assignee_id', None),
+                reviewer_id=item.pop('reviewer_id', None),
+                created_by=creator,
+                **item
+            )
+            for item in validated_data
+        ]
+        with transaction.atomic():
+            assign_end_ranks(tasks)
+            tasks = Task.objects.bulk_create(tasks)
+            record_task_changes((None, task_state(task)) for task in tasks)
+        return tasks
+
+
+class TaskBulkCreateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one task of a bulk creation request.
+
+    Takes the board and users as plain IDs, their existence and membership
+    are validated for the whole batch by `TaskBulkListSerializer`.
+    """
+    board = serializers.IntegerField()
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            'board', 'title', 'description', 'status', 'priority',
+            'assignee_id', 'reviewer_id', 'due_date'
+        ]
+        list_serializer_class = TaskBulkListSerializer
+
+
+class TaskBatchUpdateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one item of a batch task update.
+
+    Only the ID is required; the given fields are applied to the task.
+    """
+    id = serializers.IntegerField()
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = ['id', 'status', 'priority', 'assignee_id', 'reviewer_id']
+        extra_kwargs = {
+            'status': {'required': False},
+            'priority': {'required': False},
+        }
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """
+    Serializer for the target column and neighbours of a moved task.
+    """
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    after_id = serializers.IntegerField(required=False, allow_null=True)
+    before_id = serializers.IntegerField(required=False, allow_null=True)
+
+
 class UserShortSerializer(serializers.ModelSerializer):
     """
     Compact user serializer used for read-only task display.
@@ -145,7 +306,12 @@ class TaskSerializer(serializers.ModelSerializer):
     def get_comments_count(self, obj):
         """
         Return the number of comments on the task.
+
+        Uses the `comments_count` annotation of `Task.objects.with_summary()`
+        when present instead of counting per task.
         """
+        if hasattr(obj, 'comments_count'):
+            return obj.comments_count
         return obj.comments.count()
 
 
@@ -5,9 +5,13 @@ including assignments, reviews, and task comments.
 
 Available endpoints:
     - / → TaskCreateView
+    - /bulk/ → TaskBulkCreateView
+    - /batch/ → TaskBatchUpdateView
     - /assigned-to-me/ → AssignedToMeTasksView
     - /reviewing/ → ReviewingTasksView
+    - /search/ → TaskSearchView
     - /<int:task_id>/ → TaskDetailView
+    - /<int:task_id>/move/ → TaskMoveView
     - /<int:task_id>/comments/ → TaskCommentsView
     - /<int:task_id>/comments/<int:comment_id>/ → CommentDeleteView
 """
@@ -20,18 +24,26 @@ from .views import (
     AssignedToMeTasksView,
     CommentDeleteView,
     ReviewingTasksView,
+    TaskBatchUpdateView,
+    TaskBulkCreateView,
     TaskCommentsView,
     TaskCreateView,
-    TaskDetailView
+    TaskDetailView,
+    TaskMoveView,
+    TaskSearchView
 )
 
 app_name = 'task_app'
 
 urlpatterns = [
     path('', TaskCreateView.as_view(), name='task-create'),
+    path('bulk/', TaskBulkCreateView.as_view(), name='task-bulk-create'),
+    path('batch/', TaskBatchUpdateView.as_view(), name='task-batch-update'),
     path('assigned-to-me/', AssignedToMeTasksView.as_view(), name='assigned-to-me'),
     path('reviewing/', ReviewingTasksView.as_view(), name='reviewing-tasks'),
+    path('search/', TaskSearchView.as_view(), name='task-search'),
     path('<int:task_id>/', TaskDetailView.as_view(), name='task-detail'),
+    path('<int:task_id>/move/', TaskMoveView.as_view(), name='task-move'),
     path(
         '<int:task_id>/comments/',
         TaskCommentsView.as_view(),
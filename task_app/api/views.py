@@ -1,18 +1,44 @@
 # 1. Third-party suppliers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Max, Min
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
 # 2. Local imports
 from .serializers import (
     TaskSerializer,
+    TaskBatchUpdateSerializer,
+    TaskBulkCreateSerializer,
     TaskCreateSerializer,
+    TaskMoveSerializer,
     CommentSerializer,
 )
-from task_app.models import Comment, Task
+from board_app.membership import get_visible_board_ids, is_board_member
+from board_app.models import Board
+from board_app.stats import get_board_stats
+from core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    with_etag,
+)
+from core.pagination import IncrementalKeysetPagination, KeysetPagination
+from task_app.changes import record_task_changes, task_state
+from task_app.fragments import render_cached_tasks, task_stubs
+from task_app.models import Comment, InboxVersion, Task
+from task_app.ranking import (
+    assign_end_ranks,
+    rank_after,
+    rank_before,
+    rank_between,
+)
+from task_app.rendering import render_tasks, task_values
+from task_app.search import search_task_ids, search_terms
 
 
 class TaskCreateView(generics.CreateAPIView):
@@ -27,22 +53,195 @@ class TaskCreateView(generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
 
+class TaskBulkCreateView(APIView):
+    """
+    API view to create many tasks in one request.
+
+    The request body is a list of task objects (at most 500). Membership is
+    validated for the whole batch; if any item is invalid nothing is created
+    and the errors are returned as a list aligned with the input.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Create the given tasks and return them.
+        """
+        serializer = TaskBulkCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=500,
+            context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
+        tasks = serializer.save()
+
+        created = Task.objects.filter(
+            id__in=[task.id for task in tasks]
+        ).with_summary().order_by('id')
+        return Response(
+            TaskSerializer(created, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
+
+
+class TaskBatchUpdateView(APIView):
+    """
+    API view to update status, priority, assignee and reviewer of many
+    tasks in one request, e.g. after a drag-and-drop of several cards.
+
+    The request body is a list of objects with a task `id` and the fields
+    to change (at most 500). The requester must be a member of every board
+    involved. Either all updates are applied or none.
+    """
+    permission_classes = [IsAuthenticated]
+    USER_FIELDS = [
+        ('assignee_id', "Assignee must be a member of the board."),
+        ('reviewer_id', "Reviewer must be a member of the board."),
+    ]
+
+    def patch(self, request):
+        """
+        Apply the given changes and return the updated tasks.
+        """
+        serializer = TaskBatchUpdateSerializer(
+            data=request.data, many=True, allow_empty=False, max_length=500
+        )
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+
+        with transaction.atomic():
+            tasks = Task.objects.select_for_update().in_bulk(
+                [item['id'] for item in items]
+            )
+            if errors := self._item_errors(items, tasks):
+                return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+            memberships = self._get_memberships(request.user.id, items, tasks)
+            board_ids = {task.board_id for task in tasks.values()}
+            if any((board_id, request.user.id) not in memberships
+                   for board_id in board_ids):
+                return Response(
+                    {"detail": "You are not a member of this board."},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+            if errors := self._membership_errors(items, tasks, memberships):
+                return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+            self._apply_changes(items, tasks)
+
+        updated = Task.objects.filter(id__in=list(tasks)).with_summary().order_by('id')
+        return Response(TaskSerializer(updated, many=True).data)
+
+    def _item_errors(self, items, tasks):
+        """
+        Return per-item errors for unknown and repeated task IDs, or None.
+        """
+        seen = set()
+        errors = []
+        for item in items:
+            if item['id'] not in tasks:
+                errors.append({'id': ["Task not found."]})
+            elif item['id'] in seen:
+                errors.append({'id': ["Task is listed more than once."]})
+            else:
+                errors.append({})
+            seen.add(item['id'])
+        return errors if any(errors) else None
+
+    def _get_memberships(self, user_id, items, tasks):
+        """
+        Fetch the (board_id, user_id) memberships relevant to the batch
+        with a single query.
+        """
+        user_ids = {user_id}
+        for item in items:
+            user_ids.update(item.get(field) for field, _ in self.USER_FIELDS)
+        user_ids.discard(None)
+        return set(
+            Board.members.through.objects.filter(
+                board_id__in={task.board_id for task in tasks.values()},
+                user_id__in=user_ids
+            ).values_list('board_id', 'user_id')
+        )
+
+    def _membership_errors(self, items, tasks, memberships):
+        """
+        Return per-item errors for assignees and reviewers who are not
+        members of the task's board, or None.
+        """
+        errors = []
+        for item in items:
+            board_id = tasks[item['id']].board_id
+            error = {}
+            for field, message in self.USER_FIELDS:
+                user_id = item.get(field)
+                if user_id and (board_id, user_id) not in memberships:
+                    error = {'non_field_errors': [message]}
+                    break
+            errors.append(error)
+        return errors if any(errors) else None
+
+    def _apply_changes(self, items, tasks):
+        """
+        Set the new values and write them with one `bulk_update` limited to
+        the changed columns.
+        """
+        changed_tasks = []
+        changed_fields = set()
+        changes = []
+        for item in items:
+            task = tasks[item['id']]
+            old_state = task_state(task)
+            fields = [
+                field for field, value in item.items()
+                if field != 'id' and getattr(task, field) != value
+            ]
+            if not fields:
+                continue
+            for field in fields:
+                setattr(task, field, item[field])
+            changed_tasks.append(task)
+            changed_fields.update(fields)
+            changes.append((old_state, task_state(task)))
+
+        moved = [task for task in changed_tasks if task.needs_end_rank()]
+        if moved:
+            assign_end_ranks(moved)
+            changed_fields.add('rank')
+
+        if changed_tasks:
+            Task.objects.bulk_update(changed_tasks, sorted(changed_fields))
+            record_task_changes(changes)
+
+
 class AssignedToMeTasksView(APIView):
     """
     API view to retrieve tasks assigned to the authenticated user.
 
     Only tasks where the user is set as `assignee` will be returned.
+    Results are cursor-paginated by due date and carry an ETag derived from
+    the user's inbox version.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         """
-        Return a list of tasks assigned to the authenticated user.
+        Return a page of tasks assigned to the authenticated user.
         """
         user = request.user
-        tasks = Task.objects.filter(assignee=user)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag = make_etag(request, 'inbox', user.id, InboxVersion.current(user.id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        paginator = KeysetPagination(ordering=('due_date', 'id'))
+        stubs = paginator.paginate_queryset(
+            task_stubs(Task.objects.filter(assignee=user), 'due_date'), request, self
+        )
+        return with_etag(
+            paginator.get_paginated_response(render_cached_tasks(stubs)), etag
+        )
 
 
 class ReviewingTasksView(APIView):
@@ -50,17 +249,77 @@ class ReviewingTasksView(APIView):
     API view to retrieve tasks the authenticated user is reviewing.
 
     Only tasks where the user is set as `reviewer` will be returned.
+    Results are cursor-paginated by due date and carry an ETag derived from
+    the user's inbox version.
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         """
-        Return a list of tasks being reviewed by the authenticated user.
+        Return a page of tasks being reviewed by the authenticated user.
         """
         user = request.user
-        tasks = Task.objects.filter(reviewer=user)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag = make_etag(request, 'inbox', user.id, InboxVersion.current(user.id))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        paginator = KeysetPagination(ordering=('due_date', 'id'))
+        stubs = paginator.paginate_queryset(
+            task_stubs(Task.objects.filter(reviewer=user), 'due_date'), request, self
+        )
+        return with_etag(
+            paginator.get_paginated_response(render_cached_tasks(stubs)), etag
+        )
+
+
+class TaskSearchView(APIView):
+    """
+    API view to search the tasks of the boards the user can see.
+
+    `q` is matched against task titles, descriptions and comments; results
+    are ordered by relevance and paginated with `page_size` and `offset`.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Return a page of tasks matching the query, best match first.
+        """
+        query = request.query_params.get('q', '')
+        if not search_terms(query):
+            return Response(
+                {"q": ["Enter a search term."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        size = KeysetPagination().get_page_size(request)
+        offset = self._get_offset(request)
+        task_ids = search_task_ids(
+            query, get_visible_board_ids(request.user.id), size + 1, offset
+        )
+        has_next = len(task_ids) > size
+        task_ids = task_ids[:size]
+
+        rows = {
+            row['id']: row
+            for row in task_values(Task.objects.filter(id__in=task_ids))
+        }
+        results = render_tasks(
+            rows[task_id] for task_id in task_ids if task_id in rows
+        )
+        next_link = replace_query_param(
+            request.build_absolute_uri(), 'offset', offset + size
+        ) if has_next else None
+        return Response({'next': next_link, 'results': results})
+
+    def _get_offset(self, request):
+        """
+        Return the requested non-negative offset, 0 if missing or invalid.
+        """
+        try:
+            return max(0, int(request.query_params['offset']))
+        except (KeyError, ValueError):
+            return 0
 
 
 class TaskDetailView(APIView):
@@ -86,7 +345,7 @@ class TaskDetailView(APIView):
         Prevents changes to the board ID.
         """
         task = self.get_task(task_id)
-        if not self._is_board_member(request.user, task.board):
+        if not is_board_member(request.user.id, task.board_id):
             return self._error("You are not a member of this board.", 403)
 
         data = request.data.copy()
@@ -106,7 +365,8 @@ class TaskDetailView(APIView):
         """
         task = self.get_task(task_id)
 
-        if task.created_by != request.user and task.board.owner != request.user:
+        is_creator = task.created_by_id == request.user.id
+        if not is_creator and task.board.owner_id != request.user.id:
             return Response(
                 {"detail": "Only the task creator or board owner can delete the task."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -115,17 +375,11 @@ class TaskDetailView(APIView):
         task.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    def _is_board_member(self, user, board):
-        """
-        Check whether a user is a member of the board.
-        """
-        return board.members.filter(id=user.id).exists()
-
     def _board_changed(self, data, task):
         """
         Check whether the board ID has been changed in the update.
         """
-        return "board" in data and str(data["board"]) != str(task.board.id)
+        return "board" in data and str(data["board"]) != str(task.board_id)
 
     def _update_user_field(self, data, task, field_key, attr_name):
         """
@@ -140,7 +394,7 @@ class TaskDetailView(APIView):
         if isinstance(user, Response):
             return user
 
-        if not self._is_board_member(user, task.board):
+        if not is_board_member(user.id, task.board_id):
             return self._error(f"{attr_name.capitalize()} must be a member of the board.")
 
         setattr(task, attr_name, user)
@@ -172,6 +426,81 @@ class TaskDetailView(APIView):
         return Response({"detail": message}, status=status_code)
 
 
+class TaskMoveView(APIView):
+    """
+    API view to move a task within its column or into another one.
+
+    The body may contain the target `status` and the IDs of the tasks the
+    card is dropped between: `after_id` (the card above) and `before_id`
+    (the card below). Without neighbours the task goes to the end of the
+    column. Only the moved task is written.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def patch(self, request, task_id):
+        """
+        Rank the task between its new neighbours and return it.
+        """
+        task = get_object_or_404(Task, id=task_id)
+        if not is_board_member(request.user.id, task.board_id):
+            return Response(
+                {"detail": "You are not a member of this board."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = TaskMoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target_status = serializer.validated_data.get('status', task.status)
+        column = Task.objects.filter(
+            board_id=task.board_id, status=target_status
+        ).exclude(id=task.id)
+
+        try:
+            rank = self._get_rank(column, **serializer.validated_data)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        task.status = target_status
+        task.rank = rank
+        task.save(update_fields=['status', 'rank'])
+
+        task = Task.objects.with_summary().get(id=task.id)
+        return Response(TaskSerializer(task).data)
+
+    def _get_rank(self, column, after_id=None, before_id=None, **kwargs):
+        """
+        Return a rank between the given neighbours in the target column.
+
+        A missing neighbour is looked up next to the given one; without any
+        neighbour the rank follows the last task of the column.
+
+        Raises:
+            ValueError: If a neighbour is not in the column or the
+                neighbours are not in order.
+        """
+        neighbour_ids = [i for i in (after_id, before_id) if i]
+        ranks = dict(
+            column.filter(id__in=neighbour_ids).values_list('id', 'rank')
+        )
+        for neighbour_id in neighbour_ids:
+            if neighbour_id not in ranks:
+                raise ValueError(f"Task {neighbour_id} is not in the target column.")
+
+        lower, upper = ranks.get(after_id), ranks.get(before_id)
+        if after_id and not before_id:
+            upper = column.filter(rank__gt=lower).aggregate(Min('rank'))['rank__min']
+            return rank_between(lower, upper) if upper else rank_after(lower)
+        if before_id and not after_id:
+            lower = column.filter(rank__lt=upper).aggregate(Max('rank'))['rank__max']
+            return rank_between(lower, upper) if lower else rank_before(upper)
+        if not neighbour_ids:
+            return rank_after(column.aggregate(Max('rank'))['rank__max'])
+        try:
+            return rank_between(lower, upper)
+        except ValueError:
+            raise ValueError("after_id must be above before_id.") from None
+
+
 class TaskCommentsView(APIView):
     """
     API view to list and create comments for a specific task.
@@ -182,16 +511,32 @@ class TaskCommentsView(APIView):
 
     def get(self, request, task_id):
         """
-        Retrieve all comments on a task in ascending order by creation time.
+        Retrieve comments on a task in ascending order by creation time.
+
+        Without parameters the latest page is returned. `since=<cursor>`
+        returns only newer comments and `before=<cursor>` pages backwards;
+        the cursors are taken from the `next` and `previous` links.
+        Answers `If-None-Match` with 304 while the board version is unchanged.
         """
-        task = get_object_or_404(Task, id=task_id)
+        task = get_object_or_404(
+            Task.objects.select_related('board__stats'), id=task_id
+        )
 
-        if request.user not in task.board.members.all():
+        if not is_board_member(request.user.id, task.board_id):
             return Response({'detail': 'Forbidden'}, status=status.HTTP_403_FORBIDDEN)
 
-        comments = task.comments.all().order_by('created_at')
+        etag = make_etag(
+            request, 'comments', task.id, get_board_stats(task.board).version
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        paginator = IncrementalKeysetPagination(ordering=('created_at', 'id'))
+        comments = paginator.paginate_queryset(
+            task.comments.select_related('author'), request, self
+        )
         serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return with_etag(paginator.get_paginated_response(serializer.data), etag)
 
     def post(self, request, task_id):
         """
@@ -201,7 +546,7 @@ class TaskCommentsView(APIView):
         """
         task = get_object_or_404(Task, id=task_id)
 
-        if not self._is_board_member(request.user, task.board):
+        if not is_board_member(request.user.id, task.board_id):
             return self._error('Forbidden', 403)
 
         content = self._get_content(request)
@@ -212,12 +557,6 @@ class TaskCommentsView(APIView):
         serializer = CommentSerializer(comment)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-    def _is_board_member(self, user, board):
-        """
-        Check if user is a board member.
-        """
-        return board.members.filter(id=user.id).exists()
-
     def _error(self, message, status_code=400):
         """
         Return a standardized error response.
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TaskAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_app'
+
+    def ready(self):
+        """
+        Connect the signal handlers maintaining the inbox versions.
+        """
+        from . import signals  # noqa: F401
@@ -0,0 +1,99 @@
+"""
+Bookkeeping for task writes that bypass model signals.
+
+`bulk_create` and `bulk_update` send no signals, so bulk endpoints report
+their changes here. The board counters, board versions, change logs and
+inbox versions are then updated with a few statements per board plus one
+inbox bump, instead of once per task, and the board events are published.
+"""
+
+# 1. Standard library
+from collections import Counter, defaultdict
+
+# 2. Third-party suppliers
+from django.db import transaction
+
+# 3. Local imports
+from board_app.changelog import record_changes
+from board_app.events import publish_on_commit
+from board_app.stats import task_counter_deltas, touch_board_stats
+from task_app.models import InboxVersion
+
+TRACKED_FIELDS = (
+    'id', 'board_id', 'status', 'priority', 'assignee_id', 'reviewer_id'
+)
+
+
+def task_state(task):
+    """
+    Return the tracked values of a task as a dict.
+    """
+    return {field: getattr(task, field) for field in TRACKED_FIELDS}
+
+
+def record_task_changes(changes):
+    """
+    Apply the side effects of bulk task writes.
+
+    Args:
+        changes (Iterable[tuple]): Pairs of (old_state, new_state) as
+            returned by `task_state`; old_state is None for created tasks,
+            new_state is None for deleted ones.
+    """
+    changes = list(changes)
+    deltas = defaultdict(Counter)
+    inbox_user_ids = set()
+    for old, new in changes:
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None:
+                continue
+            board_deltas = deltas[state['board_id']]
+            if _counters_changed(old, new):
+                board_deltas.update(
+                    task_counter_deltas(state['status'], state['priority'], sign)
+                )
+            inbox_user_ids.update((state['assignee_id'], state['reviewer_id']))
+
+    saved_ids, deleted_ids = defaultdict(list), defaultdict(list)
+    for old, new in changes:
+        if old is not None and (new is None or old['board_id'] != new['board_id']):
+            deleted_ids[old['board_id']].append(old['id'])
+        if new is not None:
+            saved_ids[new['board_id']].append(new['id'])
+
+    for board_id, board_deltas in deltas.items():
+        with transaction.atomic():
+            version = touch_board_stats(board_id, board_deltas)
+            if saved_ids[board_id]:
+                record_changes(board_id, 'task', saved_ids[board_id], version)
+            if deleted_ids[board_id]:
+                record_changes(
+                    board_id, 'task', deleted_ids[board_id], version, deleted=True
+                )
+    InboxVersion.bump(inbox_user_ids)
+    for old, new in changes:
+        _publish_change(old, new)
+
+
+def _publish_change(old, new):
+    """
+    Publish the board events of one task change.
+    """
+    moved = old is not None and new is not None and old['board_id'] != new['board_id']
+    if old is not None and (new is None or moved):
+        publish_on_commit(old['board_id'], 'task.deleted', id=old['id'])
+    if new is not None:
+        created = old is None or moved
+        event_type = 'task.created' if created else 'task.updated'
+        publish_on_commit(new['board_id'], event_type, id=new['id'])
+
+
+def _counters_changed(old, new):
+    """
+    Return True if a change affects the board counters.
+    """
+    if old is None or new is None:
+        return True
+    return any(
+        old[field] != new[field] for field in ('board_id', 'status', 'priority')
+    )
@@ -0,0 +1,128 @@
+"""
+Cache of rendered task JSON fragments.
+
+A fragment is the `TaskSerializer` output of one task, as built by
+`task_app.rendering`. Its key contains everything the output depends on:
+the board and the task's latest change sequence from the board change log
+(bumped by every save of the task), the comment count, and a generation
+of the user data bumped when a user's name or email changes. A changed
+task therefore simply misses the cache; stale entries expire after
+`TASK_FRAGMENT_CACHE_TIMEOUT` seconds.
+
+List endpoints select cheap stub rows with `task_stubs`, fetch the
+fragments with one multi-get and render only the missing tasks.
+"""
+
+# 1. Standard library
+import time
+
+# 2. Third-party suppliers
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# 3. Local imports
+from board_app.models import BoardChange
+from core.metrics import inc
+from task_app.models import Comment, Task
+from task_app.rendering import render_task, task_values
+
+FRAGMENT_KEY = 'task:fragment:{}:{}:{}:{}:{}'
+USERS_GENERATION_KEY = 'task:fragment:users'
+
+
+def _timeout():
+    """
+    Return the lifetime of fragment cache entries in seconds.
+    """
+    return getattr(settings, 'TASK_FRAGMENT_CACHE_TIMEOUT', 3600)
+
+
+def _users_generation():
+    """
+    Return the current generation of the user data, creating it if needed.
+    """
+    generation = cache.get(USERS_GENERATION_KEY)
+    if generation is None:
+        generation = time.time_ns()
+        cache.add(USERS_GENERATION_KEY, generation, None)
+        generation = cache.get(USERS_GENERATION_KEY, generation)
+    return generation
+
+
+def invalidate_user_fragments():
+    """
+    Invalidate all fragments after user names or emails changed.
+
+    Starts a new generation now and again once the transaction commits.
+    """
+    cache.set(USERS_GENERATION_KEY, time.time_ns(), None)
+    transaction.on_commit(
+        lambda: cache.set(USERS_GENERATION_KEY, time.time_ns(), None)
+    )
+
+
+def task_stubs(queryset, *fields):
+    """
+    Return `values()` rows identifying the cached fragments of tasks.
+
+    Args:
+        queryset (QuerySet): Tasks to render, filtered and ordered.
+        *fields (str): Further fields to select, e.g. the pagination keys.
+    """
+    change_seq = BoardChange.objects.filter(
+        board_id=OuterRef('board_id'), kind='task', object_id=OuterRef('id')
+    ).values('seq')[:1]
+    # Counted in a correlated subquery rather than a join: without GROUP BY
+    # the task indexes also deliver the ordering and a page stops early.
+    comments_count = Comment.objects.filter(
+        task_id=OuterRef('id')
+    ).order_by().values('task_id').annotate(total=Count('*')).values('total')
+    return queryset.annotate(
+        comments_count=Coalesce(Subquery(comments_count), 0),
+        change_seq=Subquery(change_seq),
+    ).values('id', 'board_id', 'comments_count', 'change_seq', *fields)
+
+
+def render_cached_tasks(stubs):
+    """
+    Render tasks from cached fragments, rendering and caching the misses.
+
+    Args:
+        stubs (Iterable[dict]): Rows returned by `task_stubs`.
+
+    Returns:
+        list[dict]: The rendered tasks in the order of `stubs`.
+    """
+    stubs = list(stubs)
+    generation = _users_generation()
+    keys = [
+        FRAGMENT_KEY.format(
+            generation, stub['board_id'], stub['id'],
+            stub['change_seq'], stub['comments_count']
+        )
+        for stub in stubs
+    ]
+    fragments = cache.get_many(keys)
+    inc('kanmind_cache_requests_total', len(fragments),
+        cache='task_fragment', result='hit')
+    inc('kanmind_cache_requests_total', len(keys) - len(fragments),
+        cache='task_fragment', result='miss')
+
+    missing = {
+        stub['id']: (key, stub) for stub, key in zip(stubs, keys)
+        if key not in fragments
+    }
+    if missing:
+        rendered = {}
+        for row in task_values(Task.objects.filter(id__in=list(missing))):
+            key, stub = missing[row['id']]
+            # A comment may have been added since the stubs were read; keep
+            # the fragment consistent with the count in its key.
+            row['comments_count'] = stub['comments_count']
+            rendered[key] = render_task(row)
+        cache.set_many(rendered, _timeout())
+        fragments.update(rendered)
+    return [fragments[key] for key in keys if key in fragments]
@@ -0,0 +1,102 @@
+# 1. Standard library
+import time
+
+# 2. Third-party suppliers
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+# 3. Local imports
+from task_app.api.serializers import TaskSerializer, UserShortSerializer
+from task_app.models import Task
+from task_app.rendering import render_tasks, render_users, task_values, user_values
+
+
+class Command(BaseCommand):
+    """
+    Check the fast renderers of `task_app.rendering` against the DRF
+    serializers and compare their speed.
+
+    Both paths render the same tasks and users of the current database;
+    the command fails if their JSON differs in a single byte. Timings are
+    the best of `--repeat` runs, including the queries.
+    """
+    help = "Compare the fast task renderer with TaskSerializer (output and speed)."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=1000,
+            help="Number of tasks and users rendered (default: 1000)."
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help="Timed runs per renderer (default: 5)."
+        )
+
+    def handle(self, *args, limit, repeat, **options):
+        """
+        Compare the outputs, then time both renderers.
+        """
+        task_ids = list(Task.objects.order_by('id').values_list('id', flat=True)[:limit])
+        user_ids = list(User.objects.order_by('id').values_list('id', flat=True)[:limit])
+        tasks = Task.objects.filter(id__in=task_ids).order_by('id')
+        users = User.objects.filter(id__in=user_ids).order_by('id')
+
+        paths = {
+            'tasks': (
+                lambda: TaskSerializer(tasks.with_summary(), many=True).data,
+                lambda: render_tasks(task_values(tasks)),
+            ),
+            'users': (
+                lambda: UserShortSerializer(users, many=True).data,
+                lambda: render_users(user_values(users)),
+            ),
+        }
+        for name, (reference, fast) in paths.items():
+            self._check_output(name, reference(), fast())
+            drf_time = self._best_time(reference, repeat)
+            fast_time = self._best_time(fast, repeat)
+            self.stdout.write(
+                f"{name}: DRF {drf_time * 1000:.1f} ms, "
+                f"fast {fast_time * 1000:.1f} ms "
+                f"({drf_time / max(fast_time, 1e-9):.1f}x)"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Identical output for {len(task_ids)} tasks and {len(user_ids)} users."
+        ))
+
+    def _check_output(self, name, expected, actual):
+        """
+        Raise CommandError if the rendered JSON of both paths differs.
+        """
+        renderer = JSONRenderer()
+        if renderer.render(expected) == renderer.render(actual):
+            return
+        for expected_item, actual_item in zip(expected, actual):
+            if renderer.render(expected_item) != renderer.render(actual_item):
+                raise CommandError(
+                    f"{name}: output differs for id {expected_item['id']}:\n"
+                    f"  DRF:  {renderer.render(expected_item).decode()}\n"
+                    f"  fast: {renderer.render(actual_item).decode()}"
+                )
+        raise CommandError(
+            f"{name}: {len(expected)} rows from DRF, {len(actual)} from the fast path."
+        )
+
+    def _best_time(self, render, repeat):
+        """
+        Return the fastest of `repeat` runs in seconds.
+        """
+        timings = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            render()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
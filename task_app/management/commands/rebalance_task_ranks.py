@@ -0,0 +1,67 @@
+# 1. Third-party suppliers
+from django.core.management.base import BaseCommand
+
+# 2. Local imports
+from board_app.models import Board
+from task_app.ranking import RANK_WIDTH, rebalance_ranks
+
+
+class Command(BaseCommand):
+    """
+    Rewrite long, missing or duplicated task ranks evenly spaced.
+
+    Boards are processed in chunks of ascending IDs, each chunk in its own
+    transaction, so the command can run periodically against a live
+    database. Columns with short, unique keys are left untouched.
+    """
+    help = "Rebalance the rank keys ordering tasks within their columns."
+
+    def add_arguments(self, parser):
+        """
+        Register the command line options.
+        """
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help="Number of boards rebalanced per transaction (default: 500)."
+        )
+        parser.add_argument(
+            '--board',
+            type=int,
+            action='append',
+            dest='board_ids',
+            help="Only rebalance the board with this ID (repeatable)."
+        )
+        parser.add_argument(
+            '--max-length',
+            type=int,
+            default=RANK_WIDTH,
+            help=f"Rebalance columns with longer keys (default: {RANK_WIDTH})."
+        )
+
+    def handle(self, *args, chunk_size, board_ids, max_length, **options):
+        """
+        Rebalance the columns chunk by chunk and report the rewritten tasks.
+        """
+        boards = Board.objects.order_by('id')
+        if board_ids:
+            boards = boards.filter(id__in=board_ids)
+
+        processed = rewritten = 0
+        last_id = 0
+        while True:
+            chunk = list(
+                boards.filter(id__gt=last_id).values_list('id', flat=True)[
+                    :chunk_size
+                ]
+            )
+            if not chunk:
+                break
+            rewritten += rebalance_ranks(chunk, max_length)
+            processed += len(chunk)
+            last_id = chunk[-1]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {processed} boards, rewrote the rank of {rewritten} tasks."
+        ))
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-17 03:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0007_board_title_id_idx'),
+        ('task_app', '0016_alter_comment_options_alter_task_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date', 'id'], name='task_assignee_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', 'due_date', 'id'], name='task_reviewer_due_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-17 03:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('task_app', '0018_comment_task_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InboxVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='inbox_version', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('version', models.BigIntegerField(default=0, verbose_name='Version')),
+            ],
+            options={
+                'verbose_name': 'Inbox version',
+                'verbose_name_plural': 'Inbox versions',
+            },
+        ),
+    ]
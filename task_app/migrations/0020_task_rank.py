@@ -0,0 +1,73 @@
+# Generated by Django 5.1.4 on 2026-10-17 04:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copy of task_app.ranking.spread_ranks as of this migration, so
+# later changes to the rank format do not change what it writes.
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+RANK_WIDTH = 6
+
+
+def spread_ranks(count):
+    """
+    Return `count` evenly spaced, ascending keys of minimal length.
+    """
+    width = RANK_WIDTH
+    while BASE ** width // (count + 1) < BASE:
+        width += 1
+    step = BASE ** width // (count + 1)
+    return [_to_key(step * position, width) for position in range(1, count + 1)]
+
+
+def _to_key(value, width):
+    """
+    Return an integer as a key of `width` digits without trailing zeros.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits)).rstrip('0')
+
+
+def rank_existing_tasks(apps, schema_editor):
+    """
+    Rank the existing tasks of every column in the order of their IDs.
+    """
+    Task = apps.get_model('task_app', 'Task')
+    tasks = Task.objects.order_by('board_id', 'status', 'id').only(
+        'id', 'board_id', 'status'
+    )
+    columns = {}
+    for task in tasks.iterator():
+        columns.setdefault((task.board_id, task.status), []).append(task)
+    ranked = []
+    for column in columns.values():
+        for task, rank in zip(column, spread_ranks(len(column))):
+            task.rank = rank
+            ranked.append(task)
+    Task.objects.bulk_update(ranked, ['rank'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0008_boardstats_version'),
+        ('task_app', '0019_inboxversion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='rank',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Lexicographic position of the task within its status column.', max_length=255, verbose_name='Rank'),
+        ),
+        migrations.RunPython(rank_existing_tasks, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'rank'], name='task_board_status_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,112 @@
+from django.db import migrations
+
+# Frozen copy of the statements in task_app.search as of this migration, so
+# later changes to that module do not change what it creates.
+INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE task_app_task_search USING fts5(
+        title, body, task_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    INSERT INTO task_app_task_search(task_app_task_search, rank)
+    VALUES ('rank', 'bm25(10.0, 1.0)')
+    """,
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT id * 2, title, description, id FROM task_app_task
+    """,
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT id * 2 + 1, '', content, task_id FROM task_app_comment
+    """,
+]
+
+TRIGGER_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_insert
+    AFTER INSERT ON task_app_task BEGIN
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2, new.title, new.description, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_update
+    AFTER UPDATE OF title, description ON task_app_task BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2;
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2, new.title, new.description, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_delete
+    AFTER DELETE ON task_app_task BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_insert
+    AFTER INSERT ON task_app_comment BEGIN
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2 + 1, '', new.content, new.task_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_update
+    AFTER UPDATE OF content, task_id ON task_app_comment BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2 + 1;
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2 + 1, '', new.content, new.task_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_delete
+    AFTER DELETE ON task_app_comment BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_insert",
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_update",
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_delete",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_insert",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_update",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_delete",
+    "DROP TABLE IF EXISTS task_app_task_search",
+]
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Create and fill the FTS5 table with its triggers on SQLite.
+
+    Other backends fall back to plain LIKE queries in `task_app.search`.
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in [*INDEX_SQL, *TRIGGER_SQL]:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    """
+    Drop the FTS5 table and its triggers on SQLite.
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_app', '0020_task_rank'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
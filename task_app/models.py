@@ -1,9 +1,33 @@
 # 1. Third-party suppliers
 from django.db import models
+from django.db.models import Count
 from django.contrib.auth.models import User
 
 # 2. Local imports
 from board_app.models import Board
+from task_app.ranking import assign_end_ranks
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet with helpers shared by the task read endpoints.
+    """
+
+    def with_summary(self):
+        """
+        Load everything the read-only task serializers need in one query.
+
+        Joins assignee and reviewer and annotates `comments_count`.
+        """
+        return self.select_related('assignee', 'reviewer').annotate(
+            comments_count=Count('comments')
+        )
+
+    def in_column_order(self):
+        """
+        Order tasks by status column and their rank within the column.
+        """
+        return self.order_by('status', 'rank', 'id')
 
 
 class Task(models.Model):
@@ -82,10 +106,89 @@ class Task(models.Model):
         related_name='created_tasks',
         verbose_name='Created By'
     )
+    rank = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name='Rank',
+        help_text='Lexicographic position of the task within its status column.'
+    )
+
+    objects = TaskQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
+        # Board detail filters on board and status, served by the leading
+        # columns of `task_board_status_rank_idx`. There is no board and
+        # priority index: no query filters on both. The high priority count
+        # is a stored `BoardStats` counter, and `with_counters()` (used to
+        # rebuild it) reads every task of a board for the ticket count in
+        # the same pass. core.tests.QueryPlanTests checks the plans.
+        indexes = [
+            models.Index(
+                fields=['assignee', 'due_date', 'id'],
+                name='task_assignee_due_idx'
+            ),
+            models.Index(
+                fields=['reviewer', 'due_date', 'id'],
+                name='task_reviewer_due_idx'
+            ),
+            models.Index(
+                fields=['board', 'status', 'rank'],
+                name='task_board_status_rank_idx'
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the values loaded from the database.
+
+        Signal handlers compare them with the saved values to derive which
+        denormalized board counters have to change.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(
+            field_names,
+            (value for value in values if value is not models.DEFERRED)
+        ))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Save the task and remember the saved values as the loaded state.
+
+        New tasks and tasks moved to another board or status column are
+        ranked at the end of their column, unless the rank is saved
+        explicitly via `update_fields`.
+        """
+        update_fields = kwargs.get('update_fields')
+        if self.needs_end_rank(update_fields):
+            assign_end_ranks([self])
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'rank'}
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def needs_end_rank(self, update_fields=None):
+        """
+        Return True if the task has to be appended to its column.
+        """
+        if update_fields is not None and 'rank' in update_fields:
+            return False
+        if not self.rank:
+            return True
+        loaded = getattr(self, '_loaded_values', None)
+        return bool(loaded) and any(
+            field in loaded and loaded[field] != getattr(self, field)
+            for field in ('board_id', 'status')
+        )
 
     def create(self, validated_data):
         """
@@ -156,9 +259,82 @@ class Comment(models.Model):
     class Meta:
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
+        indexes = [
+            models.Index(
+                fields=['task', 'created_at', 'id'],
+                name='comment_task_created_idx'
+            ),
+        ]
 
     def __str__(self):
         """
         Returns a human-readable string representation of the Comment.
         """
         return f"Comment by {self.author} on {self.created_at}"
+
+
+class InboxVersion(models.Model):
+    """
+    Version counter of a user's task inbox.
+
+    Bumped whenever a task the user is assigned to or reviewing changes,
+    including its comments, and drives the ETags of the assigned-to-me and
+    reviewing endpoints. Users without a row are at version 0.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='inbox_version',
+        verbose_name='User'
+    )
+    version = models.BigIntegerField(
+        default=0,
+        verbose_name='Version'
+    )
+
+    class Meta:
+        verbose_name = 'Inbox version'
+        verbose_name_plural = 'Inbox versions'
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the version.
+        """
+        return f"Inbox of {self.user_id} at version {self.version}"
+
+    @classmethod
+    def bump(cls, user_ids):
+        """
+        Increment the inbox versions of the given users.
+
+        Rows are created on first use; an UPDATE is tried first so the
+        common case costs a single query.
+        """
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+        increment = {'version': models.F('version') + 1}
+        updated = cls.objects.filter(user_id__in=user_ids).update(**increment)
+        if updated == len(user_ids):
+            return
+        existing = cls.objects.filter(user_id__in=user_ids).values_list(
+            'user_id', flat=True
+        )
+        # Users deleted earlier in the transaction get no row.
+        missing = set(User.objects.filter(
+            id__in=user_ids.difference(existing)
+        ).values_list('id', flat=True))
+        cls.objects.bulk_create(
+            [cls(user_id=user_id) for user_id in missing], ignore_conflicts=True
+        )
+        cls.objects.filter(user_id__in=missing).update(**increment)
+
+    @classmethod
+    def current(cls, user_id):
+        """
+        Return the inbox version of a user.
+        """
+        return cls.objects.filter(user_id=user_id).values_list(
+            'version', flat=True
+        ).first() or 0
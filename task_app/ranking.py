@@ -0,0 +1,194 @@
+"""
+Lexicographic rank keys ordering the tasks within a status column.
+
+Ranks are base-36 fractions written without the leading "0.", e.g. "i"
+sorts between "a" and "z", and "i5" between "i" and "j". A key can always
+be generated between two others, so moving a card rewrites only that card.
+Keys never end in "0", which keeps room below every key.
+
+Appending to a column steps the first `RANK_WIDTH` digits instead of
+halving the remaining space, so keys stay short when cards are added at
+the end. Repeated inserts into the same gap make keys grow; the
+`rebalance_task_ranks` command rewrites long keys evenly spaced again.
+"""
+
+# 1. Third-party suppliers
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import Length
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+RANK_WIDTH = 6
+RANK_STEP = BASE ** 2
+
+
+def rank_between(before=None, after=None):
+    """
+    Return a rank key sorting strictly between two keys.
+
+    Args:
+        before (str | None): Key of the preceding task, None for the start.
+        after (str | None): Key of the following task, None for the end.
+
+    Returns:
+        str: The new key.
+
+    Raises:
+        ValueError: If `before` does not sort before `after`.
+    """
+    before = before or ''
+    if after is not None and after <= before:
+        raise ValueError(f"Rank {before!r} does not sort before {after!r}.")
+    return _midpoint(before, after)
+
+
+def _midpoint(low, high):
+    """
+    Return the key halfway between `low` ('' for zero) and `high`
+    (None for one).
+    """
+    if high is not None:
+        common = 0
+        while common < len(high) and (low[common:common + 1] or '0') == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _midpoint(low[common:], high[common:])
+
+    low_digit = DIGITS.index(low[0]) if low else 0
+    high_digit = DIGITS.index(high[0]) if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def rank_after(rank=None):
+    """
+    Return a short key sorting after `rank`, for appending to a column.
+    """
+    if not rank:
+        return DIGITS[BASE // 2]
+    value = _to_int(rank[:RANK_WIDTH]) + RANK_STEP
+    if value < BASE ** RANK_WIDTH:
+        return _to_key(value)
+    return rank_between(rank, None)
+
+
+def rank_before(rank=None):
+    """
+    Return a short key sorting before `rank`, for prepending to a column.
+    """
+    if not rank:
+        return DIGITS[BASE // 2]
+    value = _to_int(rank[:RANK_WIDTH]) - RANK_STEP
+    if value > 0:
+        return _to_key(value)
+    return rank_between(None, rank)
+
+
+def spread_ranks(count):
+    """
+    Return `count` evenly spaced, ascending keys of minimal length.
+    """
+    width = RANK_WIDTH
+    while BASE ** width // (count + 1) < BASE:
+        width += 1
+    step = BASE ** width // (count + 1)
+    return [_to_key(step * position, width) for position in range(1, count + 1)]
+
+
+def assign_end_ranks(tasks):
+    """
+    Give tasks ranks at the end of their (board, status) columns.
+
+    The current last keys of all involved columns are read with a single
+    query; tasks of the same column keep their order in `tasks`.
+
+    Args:
+        tasks (Iterable[Task]): Unsaved or moved tasks, modified in place.
+    """
+    # Imported here, the models import this module to rank new tasks.
+    from task_app.models import Task
+
+    tasks = list(tasks)
+    if not tasks:
+        return
+    columns = Task.objects.filter(
+        board_id__in={task.board_id for task in tasks},
+        status__in={task.status for task in tasks},
+    ).exclude(
+        id__in=[task.id for task in tasks if task.id]
+    ).order_by().values_list('board_id', 'status').annotate(last=Max('rank'))
+    last_ranks = {(board_id, status): last for board_id, status, last in columns}
+
+    for task in tasks:
+        column = (task.board_id, task.status)
+        task.rank = last_ranks[column] = rank_after(last_ranks.get(column))
+
+
+def rebalance_ranks(board_ids, max_length=RANK_WIDTH):
+    """
+    Rewrite the ranks of worn-out columns evenly spaced.
+
+    A column is rewritten when its longest key exceeds `max_length` or
+    keys are missing or duplicated (e.g. after concurrent appends). The
+    current order, ties broken by ID, is kept. Runs in one transaction.
+
+    Args:
+        board_ids (Iterable[int]): IDs of the boards to check.
+        max_length (int): Longest acceptable key.
+
+    Returns:
+        int: Number of tasks whose rank was rewritten.
+    """
+    from task_app.models import Task
+
+    tasks = Task.objects.filter(board_id__in=list(board_ids))
+    worn = tasks.order_by().values('board_id', 'status').annotate(
+        longest=Max(Length('rank')),
+        total=Count('id'),
+        distinct_ranks=Count('rank', distinct=True),
+        unranked=Count('id', filter=Q(rank='')),
+    ).filter(
+        Q(longest__gt=max_length)
+        | Q(distinct_ranks__lt=F('total'))
+        | Q(unranked__gt=0)
+    ).values_list('board_id', 'status')
+
+    rewritten = []
+    with transaction.atomic():
+        for board_id, status in worn:
+            column = list(
+                tasks.select_for_update().filter(
+                    board_id=board_id, status=status
+                ).order_by('rank', 'id').only('id', 'rank')
+            )
+            for task, rank in zip(column, spread_ranks(len(column))):
+                if task.rank != rank:
+                    task.rank = rank
+                    rewritten.append(task)
+        Task.objects.bulk_update(rewritten, ['rank'], batch_size=500)
+    return len(rewritten)
+
+
+def _to_int(key):
+    """
+    Return the first `RANK_WIDTH` digits of a key as an integer.
+    """
+    value = 0
+    for digit in key.ljust(RANK_WIDTH, '0'):
+        value = value * BASE + DIGITS.index(digit)
+    return value
+
+
+def _to_key(value, width=RANK_WIDTH):
+    """
+    Return an integer as a key of `width` digits without trailing zeros.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits)).rstrip('0')
@@ -0,0 +1,91 @@
+"""
+Fast read-only rendering of tasks and users.
+
+Builds the exact JSON of `TaskSerializer` and `UserShortSerializer` from
+`values()` rows, skipping model instances and DRF's per-field machinery.
+Used by the read endpoints of both apps; the serializers remain the
+reference for writes and single objects. `manage.py compare_task_rendering`
+checks both paths produce identical output and times them.
+"""
+
+# 1. Third-party suppliers
+from django.db.models import Count
+
+USER_FIELDS = ('id', 'email', 'first_name', 'last_name')
+TASK_FIELDS = (
+    'id', 'board_id', 'title', 'description', 'status', 'priority',
+    'due_date', 'comments_count',
+    *(f'assignee__{field}' for field in USER_FIELDS),
+    *(f'reviewer__{field}' for field in USER_FIELDS),
+)
+
+
+def task_values(queryset):
+    """
+    Return the rows needed by `render_task` as dicts.
+
+    Adds the `comments_count` annotation unless the queryset has it.
+    Ordering and filters of the queryset are kept.
+    """
+    if 'comments_count' not in queryset.query.annotations:
+        queryset = queryset.annotate(comments_count=Count('comments'))
+    return queryset.values(*TASK_FIELDS)
+
+
+def user_values(queryset):
+    """
+    Return the rows needed by `render_user` as dicts.
+    """
+    return queryset.values(*USER_FIELDS)
+
+
+def render_user(row, prefix=''):
+    """
+    Render a user like `UserShortSerializer`, or None if absent.
+
+    Args:
+        row (dict): A `user_values` row, or a `task_values` row with
+            `prefix` 'assignee__' or 'reviewer__'.
+        prefix (str): Prefix of the user columns in the row.
+    """
+    user_id = row[prefix + 'id']
+    if user_id is None:
+        return None
+    return {
+        'id': user_id,
+        'email': row[prefix + 'email'],
+        'fullname': f"{row[prefix + 'first_name']} {row[prefix + 'last_name']}".strip(),
+    }
+
+
+def render_task(row):
+    """
+    Render a `task_values` row like `TaskSerializer`.
+    """
+    due_date = row['due_date']
+    return {
+        'id': row['id'],
+        'board': row['board_id'],
+        'title': row['title'],
+        'description': row['description'],
+        'status': row['status'],
+        'priority': row['priority'],
+        'assignee': render_user(row, 'assignee__'),
+        'reviewer': render_user(row, 'reviewer__'),
+        'due_date': due_date.isoformat() if due_date is not None else None,
+        'comments_count': row['comments_count'],
+    }
+
+
+def render_tasks(rows):
+    """
+    Render `task_values` rows like `TaskSerializer(many=True)`.
+    """
+    return [render_task(row) for row in rows]
+
+
+def render_users(rows):
+    """
+    Render `user_values` rows like `UserShortSerializer(many=True)`.
+    """
+    return [render_user(row) for row in rows]
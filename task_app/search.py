@@ -0,0 +1,204 @@
+"""
+Full-text search over task titles, descriptions and comments.
+
+On SQLite the text lives in the FTS5 table `task_app_task_search`, kept in
+sync with tasks and comments by triggers. Tasks use even rowids
+(id * 2) and comments odd ones (id * 2 + 1); both rows carry the task ID
+so comment hits are reported as their task. Results are ordered by BM25,
+with titles weighing ten times as much as descriptions and comments.
+
+SQLite rebuilds a table for many schema changes, which drops its
+triggers; a migration changing `Task` or `Comment` that way has to run
+`TRIGGER_SQL` again. Other databases fall back to unranked LIKE queries.
+"""
+
+# 1. Standard library
+import re
+
+# 2. Third-party suppliers
+from django.db import connections, router
+from django.db.models import Q
+
+# 3. Local imports
+from task_app.models import Task
+
+INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE task_app_task_search USING fts5(
+        title, body, task_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    INSERT INTO task_app_task_search(task_app_task_search, rank)
+    VALUES ('rank', 'bm25(10.0, 1.0)')
+    """,
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT id * 2, title, description, id FROM task_app_task
+    """,
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT id * 2 + 1, '', content, task_id FROM task_app_comment
+    """,
+]
+
+TRIGGER_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_insert
+    AFTER INSERT ON task_app_task BEGIN
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2, new.title, new.description, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_update
+    AFTER UPDATE OF title, description ON task_app_task BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2;
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2, new.title, new.description, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_task_delete
+    AFTER DELETE ON task_app_task BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_insert
+    AFTER INSERT ON task_app_comment BEGIN
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2 + 1, '', new.content, new.task_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_update
+    AFTER UPDATE OF content, task_id ON task_app_comment BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2 + 1;
+        INSERT INTO task_app_task_search(rowid, title, body, task_id)
+        VALUES (new.id * 2 + 1, '', new.content, new.task_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_app_task_search_comment_delete
+    AFTER DELETE ON task_app_comment BEGIN
+        DELETE FROM task_app_task_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_insert",
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_update",
+    "DROP TRIGGER IF EXISTS task_app_task_search_task_delete",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_insert",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_update",
+    "DROP TRIGGER IF EXISTS task_app_task_search_comment_delete",
+    "DROP TABLE IF EXISTS task_app_task_search",
+]
+
+# Suspended by bulk loads, which index their rows with `index_boards`.
+INSERT_TRIGGERS = [
+    'task_app_task_search_task_insert',
+    'task_app_task_search_comment_insert',
+]
+
+BOARD_INDEX_SQL = [
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT id * 2, title, description, id FROM task_app_task
+    WHERE board_id IN ({board_ids})
+    """,
+    """
+    INSERT INTO task_app_task_search(rowid, title, body, task_id)
+    SELECT comment.id * 2 + 1, '', comment.content, comment.task_id
+    FROM task_app_comment AS comment
+    JOIN task_app_task AS task ON task.id = comment.task_id
+    WHERE task.board_id IN ({board_ids})
+    """,
+]
+
+SEARCH_SQL = """
+    SELECT search.task_id, MIN(search.rank) AS score
+    FROM task_app_task_search AS search
+    JOIN task_app_task AS task ON task.id = search.task_id
+    WHERE task_app_task_search MATCH %s AND task.board_id IN ({board_ids})
+    GROUP BY search.task_id
+    ORDER BY score, search.task_id
+    LIMIT %s OFFSET %s
+"""
+
+
+def index_boards(board_ids):
+    """
+    Add the tasks and comments of new boards to the search index.
+
+    Only for boards whose rows were inserted while the `INSERT_TRIGGERS`
+    were suspended; indexed rows would be added twice.
+    """
+    board_ids = list(board_ids)
+    connection = connections[router.db_for_write(Task)]
+    if connection.vendor != 'sqlite' or not board_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(board_ids))
+    with connection.cursor() as cursor:
+        for statement in BOARD_INDEX_SQL:
+            cursor.execute(statement.format(board_ids=placeholders), board_ids)
+
+
+def search_terms(query):
+    """
+    Split a user query into search terms, ignoring FTS syntax characters.
+    """
+    return re.findall(r'\w+', query)
+
+
+def search_task_ids(query, board_ids, limit, offset=0):
+    """
+    Return the IDs of the best matching tasks on the given boards.
+
+    Every term has to match, the last one also as a prefix so results
+    appear while the user is typing.
+
+    Args:
+        query (str): The user's search text.
+        board_ids (Iterable[int]): Boards to search in.
+        limit (int): Maximum number of IDs to return.
+        offset (int): Number of best matches to skip.
+
+    Returns:
+        list[int]: Task IDs, best match first.
+    """
+    terms = search_terms(query)
+    board_ids = list(board_ids)
+    if not terms or not board_ids:
+        return []
+    # Raw SQL bypasses the database routers; ask them for the connection.
+    connection = connections[router.db_for_read(Task)]
+    if connection.vendor != 'sqlite':
+        return _like_search_task_ids(terms, board_ids, limit, offset)
+
+    match = ' '.join(f'"{term}"' for term in terms) + '*'
+    sql = SEARCH_SQL.format(board_ids=', '.join(['%s'] * len(board_ids)))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, *board_ids, limit, offset])
+        return [task_id for task_id, _ in cursor.fetchall()]
+
+
+def _like_search_task_ids(terms, board_ids, limit, offset):
+    """
+    Return matching task IDs, newest first, using case-insensitive LIKE.
+    """
+    tasks = Task.objects.filter(board_id__in=board_ids)
+    for term in terms:
+        tasks = tasks.filter(
+            Q(title__icontains=term)
+            | Q(description__icontains=term)
+            | Q(comments__content__icontains=term)
+        )
+    return list(
+        tasks.order_by('-id').values_list('id', flat=True).distinct()[
+            offset:offset + limit
+        ]
+    )
@@ -0,0 +1,199 @@
+"""
+Signal handlers bumping the task inbox versions of assignees and reviewers,
+publishing task and comment change events to board subscribers and
+invalidating cached task fragments when user data changes.
+"""
+
+# 1. Third-party suppliers
+from django.contrib.auth.models import User
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+# 2. Local imports
+from board_app.events import publish_on_commit
+from board_app.models import Board
+from task_app.fragments import invalidate_user_fragments
+from task_app.models import Comment, InboxVersion, Task
+
+FRAGMENT_USER_FIELDS = {'email', 'first_name', 'last_name'}
+
+
+def _inbox_users(task):
+    """
+    Return the assignee and reviewer IDs of a task, as loaded and as saved.
+    """
+    loaded = getattr(task, '_loaded_values', None) or {}
+    return {
+        task.assignee_id,
+        task.reviewer_id,
+        loaded.get('assignee_id'),
+        loaded.get('reviewer_id'),
+    }
+
+
+def _deleted_with(origin, *models):
+    """
+    Return True if a deletion cascades from deleting one of the models.
+    """
+    return getattr(origin, 'model', type(origin)) in models
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def bump_inbox_on_task_change(sender, instance, raw=False, origin=None, **kwargs):
+    """
+    Bump the inboxes a task enters, leaves or is changed in.
+
+    Skipped when the task goes with its board or a user; their deletion
+    bumps all affected inboxes at once.
+    """
+    if raw or _deleted_with(origin, Board, User):
+        return
+    InboxVersion.bump(_inbox_users(instance))
+
+
+def _task_inbox_users(tasks):
+    """
+    Return the assignee and reviewer IDs of the given tasks.
+    """
+    return {
+        user_id
+        for pair in tasks.values_list('assignee_id', 'reviewer_id').distinct()
+        for user_id in pair
+    }
+
+
+@receiver(pre_delete, sender=Board)
+def remember_board_inbox_users(sender, instance, origin=None, **kwargs):
+    """
+    Capture the inboxes of a board's tasks before they are deleted with it.
+    """
+    if not _deleted_with(origin, User):
+        instance._inbox_user_ids = _task_inbox_users(instance.tasks.all())
+
+
+@receiver(pre_delete, sender=User)
+def remember_user_inbox_users(sender, instance, **kwargs):
+    """
+    Capture the inboxes of the tasks a user's deletion removes (those the
+    user created or that are on the user's boards) or removes comments of.
+    """
+    tasks = Task.objects.filter(
+        Q(created_by=instance) | Q(board__owner=instance)
+        | Q(comments__author=instance)
+    )
+    instance._inbox_user_ids = _task_inbox_users(tasks)
+
+
+@receiver(post_delete, sender=Board)
+@receiver(post_delete, sender=User)
+def bump_inbox_on_cascade(sender, instance, **kwargs):
+    """
+    Bump the captured inboxes in one call once the deletion is done.
+
+    Runs after the deleted users' rows are gone, so `InboxVersion.bump`
+    does not recreate their inboxes.
+    """
+    InboxVersion.bump(getattr(instance, '_inbox_user_ids', ()))
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_inbox_on_comment_change(sender, instance, raw=False, origin=None, **kwargs):
+    """
+    Bump the inboxes of a task when its comment count changes.
+
+    Skipped when the comment goes with its task, board or author, whose
+    deletions bump them already.
+    """
+    if raw or _deleted_with(origin, Task, Board, User):
+        return
+    _, *user_ids = _comment_task_values(instance)
+    InboxVersion.bump(user_ids)
+
+
+def _comment_task_values(comment):
+    """
+    Return (board_id, assignee_id, reviewer_id) of a comment's task.
+
+    Uses the cached task if loaded, otherwise queries once per instance.
+    """
+    if Comment.task.is_cached(comment):
+        task = comment.task
+        return (task.board_id, task.assignee_id, task.reviewer_id)
+    if not hasattr(comment, '_task_values'):
+        comment._task_values = Task.objects.filter(
+            id=comment.task_id
+        ).values_list('board_id', 'assignee_id', 'reviewer_id').first() or (
+            None, None, None
+        )
+    return comment._task_values
+
+
+@receiver(post_save, sender=Task)
+def publish_task_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Publish a task event to the subscribers of its board, and of its
+    previous board if it moved.
+    """
+    if raw:
+        return
+    loaded = getattr(instance, '_loaded_values', None) or {}
+    previous_board_id = loaded.get('board_id', instance.board_id)
+    if previous_board_id != instance.board_id:
+        publish_on_commit(previous_board_id, 'task.deleted', id=instance.pk)
+        created = True
+    event_type = 'task.created' if created else 'task.updated'
+    publish_on_commit(instance.board_id, event_type, id=instance.pk)
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_deletion(sender, instance, origin=None, **kwargs):
+    """
+    Publish a task deletion, unless the whole board goes with it.
+    """
+    if getattr(origin, 'model', type(origin)) is not Board:
+        publish_on_commit(instance.board_id, 'task.deleted', id=instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def publish_comment_change(sender, instance, raw=False, origin=None, **kwargs):
+    """
+    Publish a comment event, unless the comment goes with its task or board.
+    """
+    origin_model = getattr(origin, 'model', type(origin))
+    if raw or origin_model in (Task, Board):
+        return
+    if 'created' not in kwargs:
+        event_type = 'comment.deleted'
+    else:
+        event_type = 'comment.created' if kwargs['created'] else 'comment.updated'
+    board_id, _, _ = _comment_task_values(instance)
+    publish_on_commit(
+        board_id, event_type, id=instance.pk, task_id=instance.task_id
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_fragments_on_user_change(sender, instance, created, raw=False,
+                                        update_fields=None, **kwargs):
+    """
+    Invalidate the task fragments when a user's name or email may have
+    changed; saves of other fields, such as `last_login`, are ignored.
+    """
+    if created or raw:
+        return
+    if update_fields is None or FRAGMENT_USER_FIELDS.intersection(update_fields):
+        invalidate_user_fragments()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_fragments_on_user_delete(sender, instance, **kwargs):
+    """
+    Invalidate the task fragments when a user is deleted; the database sets
+    the user's assignments and reviews to NULL without saving the tasks.
+    """
+    invalidate_user_fragments()
+
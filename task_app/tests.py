@@ -1,3 +1,464 @@
+# 1. Standard library
+import datetime
+import io
+
+# 2. Third-party suppliers
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+# 3. Local imports
+from board_app.models import Board, BoardStats
+from board_app.stats import rebuild_board_stats
+from task_app.api.serializers import TaskSerializer, UserShortSerializer
+from task_app.fragments import render_cached_tasks, task_stubs
+from task_app.models import Comment, InboxVersion, Task
+from task_app.rendering import render_tasks, render_users, task_values, user_values
+from task_app.search import INSERT_TRIGGERS, search_task_ids
+
+
+class TaskRenderingTests(TestCase):
+    """
+    The `values()` renderers produce byte for byte the JSON of the DRF
+    serializers they replace.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.named = User.objects.create_user(
+            'ada', 'ada@example.com', 'pw', first_name='Ada', last_name='Lovelace'
+        )
+        cls.first_name_only = User.objects.create_user(
+            'grace', 'grace@example.com', 'pw', first_name='Grace'
+        )
+        cls.unnamed = User.objects.create_user('anon', 'anon@example.com', 'pw')
+        board = Board.objects.create(title='Board', owner=cls.named)
+        board.members.add(cls.named, cls.first_name_only, cls.unnamed)
+
+        variants = [
+            {},
+            {'assignee': cls.named},
+            {'reviewer': cls.first_name_only},
+            {'assignee': cls.unnamed, 'reviewer': cls.named,
+             'due_date': datetime.date(2026, 2, 28)},
+            {'due_date': datetime.date(2027, 1, 1), 'description': 'Ünïcödé "quoted"'},
+        ]
+        for index, variant in enumerate(variants):
+            for comments in (0, 2):
+                task = Task.objects.create(
+                    board=board,
+                    title=f'Task {index}/{comments}',
+                    status=['to-do', 'in-progress', 'review', 'done'][index % 4],
+                    priority=['low', 'medium', 'high'][index % 3],
+                    created_by=cls.named,
+                    **variant,
+                )
+                for _ in range(comments):
+                    Comment.objects.create(task=task, author=cls.unnamed, content='Hi')
+
+    def setUp(self):
+        cache.clear()
+
+    def assertSameJSON(self, expected, actual):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(expected), renderer.render(actual))
+
+    def test_tasks_match_task_serializer(self):
+        tasks = Task.objects.order_by('id')
+        self.assertSameJSON(
+            TaskSerializer(tasks.with_summary(), many=True).data,
+            render_tasks(task_values(tasks)),
+        )
+
+    def test_cached_fragments_match_task_serializer(self):
+        tasks = Task.objects.order_by('id')
+        expected = TaskSerializer(tasks.with_summary(), many=True).data
+        for attempt in ('miss', 'hit'):
+            with self.subTest(cache=attempt):
+                self.assertSameJSON(expected, render_cached_tasks(task_stubs(tasks)))
+
+    def test_users_match_user_short_serializer(self):
+        users = User.objects.order_by('id')
+        self.assertSameJSON(
+            UserShortSerializer(users, many=True).data,
+            render_users(user_values(users)),
+        )
+
+
+class SeedSearchIndexTests(TestCase):
+    """
+    `seed_kanban` indexes its rows itself and leaves the search triggers
+    in place for everyone else.
+    """
+
+    def _search_triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+                "AND name LIKE 'task_app_task_search_%%'"
+            )
+            return {name for name, in cursor.fetchall()}
+
+    def test_seeded_rows_are_indexed_once(self):
+        triggers = self._search_triggers()
+        self.assertTrue(set(INSERT_TRIGGERS) <= triggers)
+        call_command(
+            'seed_kanban', users=5, boards=3, tasks=40, comments=30,
+            batch_size=20, seed=1, stdout=io.StringIO(),
+        )
+        self.assertEqual(self._search_triggers(), triggers)
+
+        task = Task.objects.order_by('id').last()
+        word = task.title.split()[0]
+        self.assertIn(task.id, search_task_ids(word, [task.board_id], 100))
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM task_app_task_search")
+            rows, = cursor.fetchone()
+        self.assertEqual(rows, Task.objects.count() + Comment.objects.count())
+
+        # Rows written after the seed are indexed by the triggers.
+        new = Task.objects.create(
+            board=task.board, title='Zebracorn', created_by=task.created_by
+        )
+        self.assertEqual(search_task_ids('zebracorn', [task.board_id], 10), [new.id])
+
+
+class BoardDeletionInboxTests(TestCase):
+    """
+    Deleting a board bumps the inboxes of its tasks once, not per task.
+    """
+    # Tasks, comments, members and inbox users of the board, the deletion
+    # of each table's rows and one inbox update. Django deletes 100 rows
+    # and collects the comments of 500 tasks per statement, which adds 13
+    # queries for 1,000 tasks; none of them are per task.
+    QUERIES = {1: 11, 1000: 24}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.assignee = User.objects.create_user('ada', 'ada@example.com', 'pw')
+        cls.reviewer = User.objects.create_user('grace', 'grace@example.com', 'pw')
+
+    def _create_board(self, task_count):
+        board = Board.objects.create(title='Board', owner=self.owner)
+        board.members.add(self.owner, self.assignee, self.reviewer)
+        tasks = Task.objects.bulk_create([
+            Task(
+                board=board, title=f'Task {index}', created_by=self.owner,
+                assignee=self.assignee,
+                reviewer=self.reviewer if index % 2 else None,
+                rank=f'{index:06d}',
+            )
+            for index in range(task_count)
+        ])
+        Comment.objects.bulk_create([
+            Comment(task=task, author=self.owner, content='Comment')
+            for task in tasks[::3]
+        ])
+        InboxVersion.bump([self.assignee.id, self.reviewer.id])
+        return board
+
+    def test_inboxes_are_bumped_once(self):
+        for size, queries in self.QUERIES.items():
+            with self.subTest(tasks=size):
+                board = self._create_board(size)
+                versions = {
+                    user_id: InboxVersion.current(user_id)
+                    for user_id in (self.assignee.id, self.reviewer.id)
+                }
+                with self.assertNumQueries(queries) as context:
+                    board.delete()
+                inbox_updates = [
+                    query for query in context.captured_queries
+                    if query['sql'].startswith('UPDATE "task_app_inboxversion"')
+                ]
+                self.assertEqual(len(inbox_updates), 1)
+                # A single task has no reviewer.
+                self.assertEqual(
+                    InboxVersion.current(self.assignee.id),
+                    versions[self.assignee.id] + 1
+                )
+                self.assertEqual(
+                    InboxVersion.current(self.reviewer.id),
+                    versions[self.reviewer.id] + (size > 1)
+                )
+
+    def test_deleting_a_user_keeps_other_inboxes_consistent(self):
+        board = self._create_board(3)
+        version = InboxVersion.current(self.assignee.id)
+        User.objects.filter(id__in=[self.owner.id, self.reviewer.id]).delete()
+        self.assertFalse(Board.objects.filter(id=board.id).exists())
+        self.assertEqual(InboxVersion.current(self.assignee.id), version + 1)
+        self.assertFalse(
+            InboxVersion.objects.filter(user_id=self.reviewer.id).exists()
+        )
+
+
+class TaskEndpointTestCase(TestCase):
+    """
+    A board with its owner and a member, and a user from outside.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.member = User.objects.create_user('member', 'member@example.com', 'pw')
+        cls.outsider = User.objects.create_user('outsider', 'outsider@example.com', 'pw')
+        cls.board = Board.objects.create(title='Board', owner=cls.owner)
+        cls.board.members.add(cls.owner, cls.member)
+        InboxVersion.bump([cls.owner.id, cls.member.id])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _stats(self):
+        return BoardStats.objects.get(board=self.board)
+
+
+class TaskBulkCreateTests(TaskEndpointTestCase):
+    """
+    Bulk creation validates the whole batch first, then creates it with a
+    fixed number of queries and one board version bump.
+    """
+    # Boards, memberships, end ranks, the insert (returning the IDs), the
+    # board counters with their change log, the inboxes and the response,
+    # plus two savepoints and their releases.
+    QUERIES = 12
+
+    def _post(self, items):
+        return self.client.post(
+            reverse('task_app:task-bulk-create'), items, format='json'
+        )
+
+    def _item(self, title, **fields):
+        return {
+            'board': self.board.id, 'title': title,
+            'status': 'to-do', 'priority': 'medium', **fields,
+        }
+
+    def test_invalid_item_rejects_the_batch(self):
+        response = self._post([
+            self._item('Valid'),
+            self._item('', status='unknown'),
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(set(response.data[1]), {'title', 'status'})
+        self.assertFalse(Task.objects.exists())
+
+    def test_non_member_assignee_is_rejected(self):
+        response = self._post([
+            self._item('Mine', assignee_id=self.member.id),
+            self._item('Theirs', assignee_id=self.outsider.id),
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, [
+            {}, {'non_field_errors': ['Assignee must be a member of the board.']},
+        ])
+        self.assertFalse(Task.objects.exists())
+
+    def test_queries_do_not_grow_with_items(self):
+        for size in (1, 50):
+            with self.subTest(tasks=size):
+                before = self._stats()
+                items = [
+                    self._item(f'Task {index}', priority='high',
+                               assignee_id=self.member.id)
+                    for index in range(size)
+                ]
+                with self.assertNumQueries(self.QUERIES):
+                    response = self._post(items)
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(len(response.data), size)
+
+                stats = self._stats()
+                self.assertEqual(stats.version, before.version + 1)
+                self.assertEqual(stats.ticket_count, before.ticket_count + size)
+                self.assertEqual(stats.to_do_count, before.to_do_count + size)
+                self.assertEqual(stats.high_prio_count, before.high_prio_count + size)
+
+        ranks = list(
+            Task.objects.order_by('id').values_list('rank', flat=True)
+        )
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+
+
+class TaskBatchUpdateTests(TaskEndpointTestCase):
+    """
+    Batch updates apply all items or none, with a fixed number of queries
+    and one board version bump.
+    """
+    # Locked tasks, memberships, end ranks of moved tasks, the update, the
+    # board counters with their change log, the inboxes and the response,
+    # plus two savepoints and their releases.
+    QUERIES = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.tasks = Task.objects.bulk_create([
+            Task(
+                board=cls.board, title=f'Task {index}', status='to-do',
+                priority='low', created_by=cls.owner, rank=f'{index:06d}',
+            )
+            for index in range(50)
+        ])
+        rebuild_board_stats([cls.board.id])
+
+    def _patch(self, items):
+        return self.client.patch(
+            reverse('task_app:task-batch-update'), items, format='json'
+        )
+
+    def test_invalid_item_rejects_the_batch(self):
+        first, second = self.tasks[:2]
+        response = self._patch([
+            {'id': first.id, 'status': 'done'},
+            {'id': 0, 'status': 'done'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, [{}, {'id': ['Task not found.']}])
+
+        response = self._patch([
+            {'id': first.id, 'status': 'done'},
+            {'id': first.id, 'priority': 'high'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[1], {'id': ['Task is listed more than once.']})
+        first.refresh_from_db()
+        self.assertEqual((first.status, first.priority), ('to-do', 'low'))
+
+    def test_non_member_assignee_is_rejected(self):
+        first, second = self.tasks[:2]
+        response = self._patch([
+            {'id': first.id, 'status': 'done'},
+            {'id': second.id, 'assignee_id': self.outsider.id},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, [
+            {}, {'non_field_errors': ['Assignee must be a member of the board.']},
+        ])
+        self.assertFalse(Task.objects.filter(status='done').exists())
+
+    def test_non_member_requester_is_forbidden(self):
+        self.client.force_authenticate(self.outsider)
+        response = self._patch([{'id': self.tasks[0].id, 'status': 'done'}])
+        self.assertEqual(response.status_code, 403)
+
+    def test_queries_do_not_grow_with_items(self):
+        for size, tasks in ((1, self.tasks[:1]), (49, self.tasks[1:])):
+            with self.subTest(tasks=size):
+                before = self._stats()
+                items = [
+                    {'id': task.id, 'status': 'done', 'priority': 'high',
+                     'reviewer_id': self.member.id}
+                    for task in tasks
+                ]
+                with self.assertNumQueries(self.QUERIES):
+                    response = self._patch(items)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data), size)
+
+                stats = self._stats()
+                self.assertEqual(stats.version, before.version + 1)
+                self.assertEqual(stats.to_do_count, before.to_do_count - size)
+                self.assertEqual(stats.done_count, before.done_count + size)
+                self.assertEqual(stats.high_prio_count, before.high_prio_count + size)
+
+        ranks = list(
+            Task.objects.filter(status='done').order_by('rank')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ranks, [task.id for task in self.tasks])
+
+
+class TaskMoveTests(TaskEndpointTestCase):
+    """
+    Moving a task ranks it between its new neighbours and rejects
+    neighbours that are out of order or in another column.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        tasks = Task.objects.bulk_create([
+            Task(
+                board=cls.board, title=f'{status} {index}', status=status,
+                created_by=cls.owner, rank=rank,
+            )
+            for status in ('to-do', 'done')
+            for index, rank in enumerate(['a', 'b', 'c'])
+        ])
+        cls.todo, cls.done = tasks[:3], tasks[3:]
+        rebuild_board_stats([cls.board.id])
+
+    def _move(self, task, **data):
+        return self.client.patch(
+            reverse('task_app:task-move', args=[task.id]), data, format='json'
+        )
+
+    def _column(self, status):
+        return list(
+            Task.objects.filter(board=self.board, status=status)
+            .order_by('rank').values_list('id', flat=True)
+        )
+
+    def test_move_between_neighbours(self):
+        first, second, third = self.todo
+        response = self._move(third, after_id=first.id, before_id=second.id)
+        self.assertEqual(response.status_code, 200)
+        third.refresh_from_db()
+        self.assertTrue(first.rank < third.rank < second.rank)
+        self.assertEqual(self._column('to-do'), [first.id, third.id, second.id])
+
+    def test_one_neighbour_is_enough(self):
+        first, second, third = self.todo
+        self._move(first, after_id=second.id)
+        self.assertEqual(self._column('to-do'), [second.id, first.id, third.id])
+        self._move(third, before_id=second.id)
+        self.assertEqual(self._column('to-do'), [third.id, second.id, first.id])
+
+    def test_move_to_another_column(self):
+        task = self.todo[0]
+        before = self._stats()
+        response = self._move(task, status='done', before_id=self.done[0].id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'done')
+        self.assertEqual(self._column('done'), [task.id, *(t.id for t in self.done)])
+        stats = self._stats()
+        self.assertEqual(stats.to_do_count, before.to_do_count - 1)
+        self.assertEqual(stats.done_count, before.done_count + 1)
+
+    def test_without_neighbours_the_task_goes_last(self):
+        task = self.todo[0]
+        self._move(task, status='done')
+        self.assertEqual(self._column('done')[-1], task.id)
+
+    def test_neighbours_out_of_order_are_rejected(self):
+        first, second, third = self.todo
+        response = self._move(first, after_id=third.id, before_id=second.id)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'detail': 'after_id must be above before_id.'})
+        self.assertEqual(self._column('to-do'), [task.id for task in self.todo])
+
+    def test_neighbour_in_another_column_is_rejected(self):
+        neighbour = self.done[0]
+        response = self._move(self.todo[0], after_id=neighbour.id)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {'detail': f'Task {neighbour.id} is not in the target column.'}
+        )
 
-# Create your tests here.
+    def test_non_member_is_forbidden(self):
+        self.client.force_authenticate(self.outsider)
+        response = self._move(self.todo[0], after_id=self.todo[1].id)
+        self.assertEqual(response.status_code, 403)